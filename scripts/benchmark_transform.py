@@ -0,0 +1,203 @@
+"""Micro-benchmarks for the hot steps of ``ProjectTransformer``.
+
+Builds synthetic frames and times each optimized step against the original
+implementation it replaced, asserting both produce the same output.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from src.core.config import BooleanMapping, CurrencyFormat, EtlSettings
+from src.core.schema import CURRENCY_COLUMNS
+from src.etl.transform import ProjectTransformer, TransformIssues, map_booleans, parse_currency
+
+_VALUES = np.array(
+    [
+        "Programa de Absorción Tecnológica para la Innovación",
+        "Persona Jurídica constituida en Chile",
+        "Región de Los Ríos",
+        "Entorno para la innovación",
+        "Subsidio",
+    ]
+)
+_BOOLEAN_VALUES = np.array(["Sí", "No", "no aplica", "Incentivo", " SI ", "NO"], dtype=object)
+BOOLEAN_COLUMNS = ["Criterio Mujer", "Sostenible", "Economía Circular", "Ley REP"]
+_BOOLEAN_MAPPING = BooleanMapping(
+    affirmative=["Sí", "SI", "Incentivo", "Convocatoria"], negative=["No", "NO"]
+)
+_DIRTY_VALUES = np.array(["  Región  de Los\tRíos ", "Subsidio\n", " Entorno  para la\u00a0innovación"])
+
+
+def build_text_frame(
+    rows: int, columns: int = 4, dirty_ratio: float = 0.02, seed: int = 42
+) -> pd.DataFrame:
+    """Synthetic text columns; ``dirty_ratio`` of the cells carry irregular whitespace."""
+
+    rng = np.random.default_rng(seed)
+    data: dict[str, pd.Series] = {}
+    for index in range(columns):
+        values = _VALUES[rng.integers(0, len(_VALUES), size=rows)].astype(object)
+        dirty = rng.random(rows) < dirty_ratio
+        values[dirty] = _DIRTY_VALUES[rng.integers(0, len(_DIRTY_VALUES), size=int(dirty.sum()))]
+        values[rng.random(rows) < 0.05] = None
+        data[f"texto_{index}"] = pd.Series(values, dtype="string")
+    return pd.DataFrame(data)
+
+
+def build_currency_frame(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Synthetic CLP amounts (``$269.980.000``) with ~10% blanks per column."""
+
+    rng = np.random.default_rng(seed)
+    data: dict[str, pd.Series] = {}
+    for column in CURRENCY_COLUMNS:
+        amounts = rng.integers(0, 2_000_000_000, size=rows)
+        text = pd.Series(amounts).map("${:,}".format).str.replace(",", ".", regex=False)
+        text = text.astype("string")
+        text[rng.random(rows) < 0.1] = pd.NA
+        data[column] = text
+    return pd.DataFrame(data)
+
+
+def build_boolean_frame(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Synthetic Sí/No columns with ~10% blanks and some unmapped values."""
+
+    rng = np.random.default_rng(seed)
+    data: dict[str, pd.Series] = {}
+    for column in BOOLEAN_COLUMNS:
+        values = _BOOLEAN_VALUES[rng.integers(0, len(_BOOLEAN_VALUES), size=rows)].copy()
+        values[rng.random(rows) < 0.1] = None
+        data[column] = pd.Series(values, dtype="string")
+    return pd.DataFrame(data)
+
+
+def _legacy_boolean_masks(frame: pd.DataFrame) -> pd.DataFrame:
+    affirmative = set(_BOOLEAN_MAPPING.affirmative)
+    negative = set(_BOOLEAN_MAPPING.negative)
+    for column in BOOLEAN_COLUMNS:
+        normalized = frame[column].astype(str).str.lower().str.strip()
+        bool_series = pd.Series(pd.NA, index=frame.index, dtype="boolean")
+        bool_series = bool_series.mask(normalized.isin(affirmative), True)
+        bool_series = bool_series.mask(normalized.isin(negative), False)
+        frame[column] = bool_series
+    return frame
+
+
+def _map_boolean_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    lookup = _BOOLEAN_MAPPING.lookup()
+    for column in BOOLEAN_COLUMNS:
+        frame[column], _ = map_booleans(frame[column], lookup)
+    return frame
+
+
+def _legacy_currency_chain(frame: pd.DataFrame) -> pd.DataFrame:
+    for column in CURRENCY_COLUMNS:
+        frame[column] = (
+            frame[column]
+            .astype("string")
+            .str.replace("$", "", regex=False)
+            .str.replace(".", "", regex=False)
+            .str.replace(",", "", regex=False)
+            .str.strip()
+        )
+        frame[column] = frame[column].replace("nan", pd.NA)
+        frame[column] = frame[column].astype("Int64")
+    return frame
+
+
+def _parse_currency_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    fmt = CurrencyFormat()
+    for column in CURRENCY_COLUMNS:
+        frame[column], _ = parse_currency(frame[column], fmt)
+    return frame
+
+
+def _time(label: str, func: Callable[[], pd.DataFrame], repeat: int) -> tuple[float, pd.DataFrame]:
+    best = float("inf")
+    result = pd.DataFrame()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<12} {best:8.3f} s")
+    return best, result
+
+
+def benchmark_text_cleaning(rows: int, repeat: int, dirty_ratio: float) -> None:
+    frame = build_text_frame(rows, dirty_ratio=dirty_ratio)
+    python = ProjectTransformer(EtlSettings(text_cleaning={"engine": "python"}))
+    vectorized = ProjectTransformer(EtlSettings())
+
+    print(f"_standardize_columns sobre {rows:,} filas x {frame.shape[1]} columnas")
+    plan, issues = vectorized.compile(frame.columns), TransformIssues()
+    slow, expected = _time("python", lambda: python._standardize_columns(frame.copy(), plan, issues), repeat)
+    fast, result = _time("vectorized", lambda: vectorized._standardize_columns(frame.copy(), plan, issues), repeat)
+    if not expected.astype("string").equals(result.astype("string")):
+        raise AssertionError("Vectorized text cleaning diverged from _clean_text")
+    print(f"speedup      {slow / fast:8.1f}x")
+
+
+def benchmark_currency(rows: int, repeat: int) -> None:
+    frame = build_currency_frame(rows)
+
+    print(f"_clean_currency_fields sobre {rows:,} filas x {len(CURRENCY_COLUMNS)} columnas")
+    slow, expected = _time("chain", lambda: _legacy_currency_chain(frame.copy()), repeat)
+    fast, result = _time("kernel", lambda: _parse_currency_columns(frame.copy()), repeat)
+    if not expected.equals(result):
+        raise AssertionError("Currency kernel diverged from the legacy chain")
+    print(f"speedup      {slow / fast:8.1f}x")
+
+
+def benchmark_booleans(rows: int, repeat: int) -> None:
+    frame = build_boolean_frame(rows)
+
+    print(f"_normalize_boolean_fields sobre {rows:,} filas x {len(BOOLEAN_COLUMNS)} columnas")
+    slow, expected = _time("masks", lambda: _legacy_boolean_masks(frame.copy()), repeat)
+    fast, result = _time("lookup", lambda: _map_boolean_columns(frame.copy()), repeat)
+    if not expected.equals(result):
+        raise AssertionError("Boolean lookup diverged from the isin masks")
+    print(f"speedup      {slow / fast:8.1f}x")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark ProjectTransformer steps")
+    parser.add_argument(
+        "--step",
+        choices=["text", "currency", "boolean", "all"],
+        default="all",
+        help="Paso del transformer a medir",
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Filas del frame sintético")
+    parser.add_argument("--repeat", type=int, default=1, help="Repeticiones por motor")
+    parser.add_argument(
+        "--dirty-ratio",
+        type=float,
+        default=0.02,
+        help="Fracción de celdas con espacios irregulares",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.step in ("text", "all"):
+        benchmark_text_cleaning(args.rows, args.repeat, args.dirty_ratio)
+    if args.step in ("currency", "all"):
+        benchmark_currency(args.rows, args.repeat)
+    if args.step in ("boolean", "all"):
+        benchmark_booleans(args.rows, args.repeat)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,100 @@
+"""Render every registered dashboard figure into ``docs/`` in one process.
+
+The processed dataset (through its region x year cube) is loaded once and the
+shared summaries are reused by every figure, which are then rendered
+concurrently. With ``--run-etl`` the ETL runs first in the same process and its
+Arrow table feeds the figures directly. Individual ``export_*_chart_html.py``
+scripts remain available.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pyarrow as pa
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from src.viz.figures import FIGURES, DashboardContext, export_figures
+
+DATA_PATH = PROJECT_ROOT / "data/processed/corfo_projects.parquet"
+OUTPUT_DIR = PROJECT_ROOT / "docs"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Exporta todas las visualizaciones a HTML")
+    parser.add_argument(
+        "--data",
+        type=Path,
+        default=DATA_PATH,
+        help="Parquet procesado por el ETL",
+    )
+    parser.add_argument(
+        "--run-etl",
+        action="store_true",
+        help="Ejecuta el ETL en el mismo proceso y grafica su tabla Arrow sin releer el Parquet",
+    )
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=PROJECT_ROOT / "config/settings.yaml",
+        help="YAML de configuración del ETL (con --run-etl)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=OUTPUT_DIR,
+        help="Carpeta destino de los HTML",
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=sorted(FIGURES),
+        help="Exporta solo las figuras indicadas",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Hilos usados para renderizar (por defecto uno por figura)",
+    )
+    return parser.parse_args()
+
+
+def run_etl_to_arrow(config_path: Path) -> pa.Table:
+    # Deferred so plain exports do not import the ETL stack.
+    from scripts.run_etl import build_extractor, build_loader
+    from src.core.config import PipelineSettings
+    from src.core.logger import configure_logging
+    from src.etl.transform import ProjectTransformer
+    from src.pipelines.duckdb_pipeline import DuckDbEtlPipeline
+    from src.pipelines.etl_pipeline import EtlPipeline
+
+    configure_logging()
+    settings = PipelineSettings.from_yaml(config_path)
+    loader = build_loader(settings)
+    if settings.etl.engine == "duckdb":
+        return DuckDbEtlPipeline(settings, loader).run(return_arrow=True)
+    pipeline = EtlPipeline(settings, build_extractor(settings), ProjectTransformer(settings.etl), loader)
+    return pipeline.run(return_arrow=True)
+
+
+def main() -> None:
+    args = parse_args()
+    start = time.perf_counter()
+    if args.run_etl:
+        context = DashboardContext.from_table(run_etl_to_arrow(args.config))
+    else:
+        context = DashboardContext.from_dataset(args.data)
+    paths = export_figures(context, args.output_dir, names=args.only, workers=args.workers)
+    for path in paths:
+        print(f"Archivo HTML (Plotly) generado en {path}")
+    print(f"{len(paths)} figuras exportadas en {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Write a synthetic raw CORFO CSV of arbitrary size for load tests."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from src.etl.synthetic import write_raw_csv
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate a synthetic CORFO raw CSV")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Filas a generar")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla del generador")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=PROJECT_ROOT / "data" / "interim" / "synthetic_raw.csv",
+        help="Ruta del CSV de salida",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    path = write_raw_csv(args.output, args.rows, seed=args.seed)
+    print(f"{args.rows:,} filas sintéticas escritas en {path}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -17,10 +17,12 @@ if str(PROJECT_ROOT) not in sys.path:
 
 from src.core.config import PipelineSettings
 from src.core.logger import configure_logging
-from src.etl.extract import CsvExtractor
-from src.etl.load import CsvParquetLoader
+from src.etl.extract import ArrowCsvExtractor, CsvExtractor, DataExtractor, MultiFileExtractor
+from src.etl.load import CompositeLoader, CsvParquetLoader, DataLoader, PartitionedParquetLoader
 from src.etl.transform import ProjectTransformer
+from src.pipelines.duckdb_pipeline import DuckDbEtlPipeline
 from src.pipelines.etl_pipeline import EtlPipeline
+from src.pipelines.incremental import IncrementalEtlPipeline
 
 
 def parse_args() -> argparse.Namespace:
@@ -41,9 +43,61 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help="Ruta opcional para el archivo de log",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-procesa solo las particiones (años) cuyo contenido cambió",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Retoma una corrida interrumpida desde los chunks guardados en paths.interim_dir",
+    )
     return parser.parse_args()
 
 
+def build_extractor(settings: PipelineSettings) -> DataExtractor:
+    etl = settings.etl
+    reader = ArrowCsvExtractor if etl.extractor == "arrow" else CsvExtractor
+    return MultiFileExtractor(
+        settings.paths.raw_files,
+        lambda path: reader(path, chunk_size=etl.chunk_size, memory_budget_mb=etl.chunk_memory_mb),
+        workers=etl.read_workers,
+        prefetch=etl.prefetch_chunks,
+        source_column=etl.source_column,
+    )
+
+
+def build_loader(settings: PipelineSettings) -> DataLoader:
+    output = settings.output
+    parquet_options = {
+        "compression": output.parquet_compression,
+        "compression_level": output.parquet_compression_level,
+        "use_dictionary": output.parquet_use_dictionary,
+    }
+    loader: DataLoader = CsvParquetLoader(
+        settings.processed_csv_path,
+        settings.processed_parquet_path,
+        feather_path=settings.processed_feather_path,
+        csv_compression=None if output.csv_compression == "none" else output.csv_compression,
+        row_group_size=output.row_group_size,
+        feather_compression=None if output.feather_compression == "uncompressed" else output.feather_compression,
+        concurrent=output.concurrent_writes,
+        **parquet_options,
+    )
+    dataset_path = settings.processed_dataset_path
+    if dataset_path is None:
+        return loader
+    partitioned = PartitionedParquetLoader(
+        dataset_path,
+        output.partition_by,
+        row_group_size=output.row_group_size,
+        buffer_memory_mb=output.dataset_buffer_mb,
+        **parquet_options,
+    )
+    return CompositeLoader([loader, partitioned])
+
+
 def main() -> None:
     load_dotenv()
     args = parse_args()
@@ -52,12 +106,25 @@ def main() -> None:
     overrides: Dict[str, Any] = json.loads(args.overrides) if args.overrides else {}
 
     settings = PipelineSettings.from_yaml(args.config, overrides)
-    extractor = CsvExtractor(settings.paths.raw_dataset, chunk_size=settings.etl.chunk_size)
-    transformer = ProjectTransformer(settings.etl)
-    loader = CsvParquetLoader(settings.processed_csv_path, settings.processed_parquet_path)
+    loader = build_loader(settings)
+    incremental = args.incremental or settings.etl.incremental
+
+    if args.resume and incremental:
+        raise SystemExit("--resume no se combina con el modo incremental")
+    if settings.etl.engine == "duckdb":
+        if incremental:
+            raise SystemExit("El modo incremental requiere etl.engine: pandas")
+        if args.resume:
+            raise SystemExit("--resume requiere etl.engine: pandas")
+        DuckDbEtlPipeline(settings, loader).run(materialize=False)
+        return
 
-    pipeline = EtlPipeline(settings, extractor, transformer, loader)
-    pipeline.run()
+    extractor = build_extractor(settings)
+    transformer = ProjectTransformer(settings.etl)
+    if incremental:
+        IncrementalEtlPipeline(settings, extractor, transformer, loader).run()
+    else:
+        EtlPipeline(settings, extractor, transformer, loader, resume=args.resume).run(materialize=False)
 
 
 if __name__ == "__main__":  # pragma: no cover
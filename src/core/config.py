@@ -2,14 +2,32 @@
 
 from __future__ import annotations
 
+import glob
+import hashlib
+import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Literal, Optional, Union
 
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
+# ETL knobs that change how fast a run goes but not what it produces.
+RUNTIME_FIELDS = {
+    "chunk_size",
+    "chunk_memory_mb",
+    "engine",
+    "duckdb",
+    "extractor",
+    "workers",
+    "read_workers",
+    "prefetch_chunks",
+    "executor",
+    "incremental",
+    "checkpoint",
+}
+
 
 class BooleanMapping(BaseModel):
     """Explicit text to boolean conversion references."""
@@ -22,37 +40,213 @@ class BooleanMapping(BaseModel):
     def _normalize_entries(cls, values: List[str]) -> List[str]:
         return [value.strip().lower() for value in values]
 
+    def lookup(self) -> Dict[str, bool]:
+        """Normalized text to boolean; negatives win when a value is in both lists."""
+
+        table = {value: True for value in self.affirmative}
+        table.update({value: False for value in self.negative})
+        return table
+
+
+class CurrencyFormat(BaseModel):
+    """Textual layout of amounts such as ``$1.234.567,50``."""
+
+    symbol: str = "$"
+    thousands: str = "."
+    decimal: str = ","
+
+    @model_validator(mode="after")
+    def _check_separators(self) -> "CurrencyFormat":
+        for separator in (self.thousands, self.decimal):
+            if len(separator) != 1 or not separator.isascii() or separator in "0123456789-":
+                raise ValueError(f"Invalid currency separator {separator!r}")
+        if self.thousands == self.decimal:
+            raise ValueError("Thousands and decimal separators must differ")
+        return self
+
+
+class ColumnSelection(BaseModel):
+    """Columns a step applies to: ``include`` (empty means all) minus ``exclude``."""
+
+    include: List[str] = Field(default_factory=list)
+    exclude: List[str] = Field(default_factory=list)
+
+    def select(self, columns: Iterable[str]) -> List[str]:
+        """Return the selected columns; an empty ``include`` means every column."""
+
+        excluded = set(self.exclude)
+        candidates = list(columns)
+        if self.include:
+            wanted = set(self.include)
+            candidates = [column for column in candidates if column in wanted]
+        return [column for column in candidates if column not in excluded]
+
+
+class TextCleaning(ColumnSelection):
+    """Scope and engine used to collapse whitespace in text columns."""
+
+    engine: Literal["vectorized", "python"] = "vectorized"
+
+
+class CategoricalEncoding(ColumnSelection):
+    """Low-cardinality text columns stored as categoricals with one dictionary per run.
+
+    A selected text column qualifies when, over the first ``sample_rows``
+    rows of the run (whatever the chunk size), it has at most
+    ``max_categories`` distinct values and they are at most ``max_ratio`` of
+    its non-null cells.
+    """
+
+    enabled: bool = True
+    max_categories: int = Field(default=1000, ge=1)
+    sample_rows: int = Field(default=10_000, ge=1)
+    max_ratio: float = Field(default=0.5, gt=0, le=1)
+
+
+class DerivedColumns(BaseModel):
+    """Analysis columns materialized by the ETL so readers do not recompute them."""
+
+    enabled: bool = True
+    region_column: str = "Región"
+    year_column: str = "Año Adjudicación"
+    target_region: str = "Region De Los Rios"
+
+
+class DuckDbOptions(BaseModel):
+    """Resources of the out-of-core engine; ``None`` keeps DuckDB's defaults."""
+
+    memory_limit: Optional[str] = None
+    threads: Optional[int] = Field(default=None, ge=1)
+
 
 class EtlSettings(BaseModel):
     chunk_size: int = 1000
+    # Target MB per chunk; ``chunk_size`` then only sizes the first, measured chunk.
+    chunk_memory_mb: Optional[float] = Field(default=None, gt=0)
+    engine: Literal["pandas", "duckdb"] = "pandas"
+    duckdb: DuckDbOptions = Field(default_factory=DuckDbOptions)
+    extractor: Literal["pandas", "arrow"] = "pandas"
+    workers: int = Field(default=1, ge=1)
+    executor: Literal["thread", "process"] = "thread"
+    # Raw files read at once, and chunks each may buffer ahead of the pipeline.
+    read_workers: int = Field(default=1, ge=1)
+    prefetch_chunks: int = Field(default=4, ge=1)
+    # Column filled with the raw file each row came from; ``None`` skips it.
+    source_column: Optional[str] = None
+    incremental: bool = False
+    # Persist transformed chunks to ``paths.interim_dir`` so a failed run can resume.
+    checkpoint: bool = False
+    partition_column: str = "Año Adjudicación"
+    text_cleaning: TextCleaning = Field(default_factory=TextCleaning)
     currency_columns: List[str] = Field(default_factory=list)
-    date_columns: List[str] = Field(default_factory=list)
+    currency_format: CurrencyFormat = Field(default_factory=CurrencyFormat)
+    # Column -> strptime format; ``None`` detects the format from the first chunk.
+    date_columns: Dict[str, Optional[str]] = Field(default_factory=dict)
     boolean_mappings: BooleanMapping = Field(default_factory=BooleanMapping)
+    derived_columns: DerivedColumns = Field(default_factory=DerivedColumns)
+    categoricals: CategoricalEncoding = Field(default_factory=CategoricalEncoding)
+
+    @field_validator("date_columns", mode="before")
+    @classmethod
+    def _date_columns_as_mapping(cls, value: Any) -> Any:
+        if isinstance(value, (list, tuple)):
+            return {column: None for column in value}
+        return value
+
+    def output_hash(self) -> str:
+        """Hash of the settings that shape the output, ignoring ``RUNTIME_FIELDS``."""
+
+        payload = self.model_dump(mode="json", exclude=RUNTIME_FIELDS)
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _project_path(value: Union[str, Path]) -> Path:
+    path = Path(value).expanduser()
+    if not path.is_absolute():
+        path = PROJECT_ROOT / path
+    return path
 
 
 class PathSettings(BaseModel):
-    raw_dataset: Path
+    # A file, a glob such as ``data/raw/*.csv.gz`` or a list of either.
+    raw_dataset: Union[Path, List[Path]]
     processed_dir: Path
     interim_dir: Path
 
-    @field_validator("raw_dataset", "processed_dir", "interim_dir", mode="before")
+    @field_validator("raw_dataset", mode="before")
+    @classmethod
+    def _resolve_raw(cls, value: Any) -> Union[Path, List[Path]]:
+        if isinstance(value, (list, tuple)):
+            return [_project_path(item) for item in value]
+        return _project_path(value)
+
+    @field_validator("processed_dir", "interim_dir", mode="before")
     @classmethod
     def _resolve_relative(cls, value: str) -> Path:
-        path = Path(value).expanduser()
-        if not path.is_absolute():
-            path = PROJECT_ROOT / path
-        return path
+        return _project_path(value)
+
+    @property
+    def raw_files(self) -> List[Path]:
+        """Raw input files in read order; each glob expands to its sorted matches."""
+
+        patterns = self.raw_dataset if isinstance(self.raw_dataset, list) else [self.raw_dataset]
+        files: List[Path] = []
+        for pattern in patterns:
+            if not glob.has_magic(str(pattern)):
+                files.append(pattern)
+                continue
+            matches = sorted(Path(match) for match in glob.glob(str(pattern)))
+            if not matches:
+                raise FileNotFoundError(f"No raw files match {pattern}")
+            files.extend(matches)
+        return files
 
 
 class OutputSettings(BaseModel):
     csv_name: str = "corfo_projects.csv"
     parquet_name: str = "corfo_projects.parquet"
+    dataset_name: Optional[str] = None
+    partition_by: List[str] = Field(
+        default_factory=lambda: ["Año Adjudicación", "Region_Normalizada"]
+    )
+    row_group_size: int = Field(default=64_000, gt=0)
+    # Arrow MB the partitioned dataset may hold in per-partition buffers.
+    dataset_buffer_mb: float = Field(default=256, gt=0)
+    # ``gzip``/``zstd`` append ``.gz``/``.zst`` to ``csv_name``.
+    csv_compression: Literal["none", "gzip", "zstd"] = "none"
+    parquet_compression: Literal["none", "snappy", "gzip", "brotli", "lz4", "zstd"] = "snappy"
+    parquet_compression_level: Optional[int] = None
+    # ``True``/``False`` for every column, or the columns to dictionary-encode.
+    parquet_use_dictionary: Union[bool, List[str]] = True
+    feather_name: Optional[str] = None
+    feather_compression: Literal["uncompressed", "lz4", "zstd"] = "uncompressed"
+    concurrent_writes: bool = True
+
+
+class MetricsSettings(BaseModel):
+    """Per-stage run report written after every ETL run when enabled."""
+
+    enabled: bool = False
+    report_dir: Path = Field(default=Path("logs"), validate_default=True)
+    prometheus_textfile: Optional[Path] = None
+    tracemalloc: bool = False
+
+    @field_validator("report_dir", "prometheus_textfile", mode="before")
+    @classmethod
+    def _resolve_relative(cls, value: Optional[str]) -> Optional[Path]:
+        if value is None:
+            return None
+        path = Path(value).expanduser()
+        if not path.is_absolute():
+            path = PROJECT_ROOT / path
+        return path
 
 
 class PipelineSettings(BaseModel):
     paths: PathSettings
     output: OutputSettings
     etl: EtlSettings
+    metrics: MetricsSettings = Field(default_factory=MetricsSettings)
 
     @classmethod
     def from_yaml(cls, config_path: Path, overrides: Optional[Dict[str, Any]] = None) -> "PipelineSettings":
@@ -78,12 +272,29 @@ class PipelineSettings(BaseModel):
 
     @property
     def processed_csv_path(self) -> Path:
-        return self.paths.processed_dir / self.output.csv_name
+        suffix = {"none": "", "gzip": ".gz", "zstd": ".zst"}[self.output.csv_compression]
+        return self.paths.processed_dir / f"{self.output.csv_name}{suffix}"
 
     @property
     def processed_parquet_path(self) -> Path:
         return self.paths.processed_dir / self.output.parquet_name
 
+    @property
+    def processed_feather_path(self) -> Optional[Path]:
+        """Arrow IPC copy of the output, or ``None`` when disabled."""
+
+        if not self.output.feather_name:
+            return None
+        return self.paths.processed_dir / self.output.feather_name
+
+    @property
+    def processed_dataset_path(self) -> Optional[Path]:
+        """Hive-partitioned Parquet directory, or ``None`` when disabled."""
+
+        if not self.output.dataset_name:
+            return None
+        return self.paths.processed_dir / self.output.dataset_name
+
     def ensure_output_dirs(self) -> None:
         self.paths.processed_dir.mkdir(parents=True, exist_ok=True)
         self.paths.interim_dir.mkdir(parents=True, exist_ok=True)
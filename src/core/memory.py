@@ -0,0 +1,21 @@
+"""In-memory footprint helpers shared by the ETL and the visualization layer."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+
+def downcast_integers(frame: pd.DataFrame) -> pd.DataFrame:
+    """Store integer columns (nullable ones included) in the narrowest type holding their values.
+
+    Meant for whole frames: the width depends on the values present, so chunks
+    of one ETL run could otherwise end up with different types.
+    """
+
+    for column in frame.columns:
+        series = frame[column]
+        if pd.api.types.is_integer_dtype(series):
+            narrowed = pd.to_numeric(series, downcast="integer")
+            if narrowed.dtype != series.dtype:
+                frame[column] = narrowed
+    return frame
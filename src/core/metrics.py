@@ -0,0 +1,245 @@
+"""Per-stage run metrics: wall and CPU time, throughput and memory high-water marks.
+
+Stages are timed with :meth:`RunMetrics.stage`. Code that should not depend on
+the pipeline (e.g. transformer steps) uses the module-level :func:`stage`, which
+records into whatever :class:`RunMetrics` is active in the current context and
+is a no-op otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+try:  # Not available on Windows.
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+PROMETHEUS_PREFIX = "corfo_etl"
+
+# Traced-memory peaks of the stages open in each thread, innermost last.
+# ``tracemalloc.reset_peak`` is global, so a nested stage folds the peak seen so
+# far into its parent's slot before resetting, and hands its own back on exit.
+_PEAKS = threading.local()
+
+
+def peak_rss_bytes() -> int:
+    """High-water mark of this process' resident set size, 0 if unknown."""
+
+    if resource is None:  # pragma: no cover
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def _peak_stack() -> list[int]:
+    if not hasattr(_PEAKS, "stack"):
+        _PEAKS.stack = []
+    return _PEAKS.stack
+
+
+@dataclass
+class StageStats:
+    """Totals for one stage, aggregated over every chunk it processed."""
+
+    calls: int = 0
+    rows: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    max_wall_seconds: float = 0.0
+    tracemalloc_peak_bytes: int = 0
+    max_rss_bytes: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def add(self, other: "StageStats") -> None:
+        self.calls += other.calls
+        self.rows += other.rows
+        self.wall_seconds += other.wall_seconds
+        self.cpu_seconds += other.cpu_seconds
+        self.max_wall_seconds = max(self.max_wall_seconds, other.max_wall_seconds)
+        self.tracemalloc_peak_bytes = max(self.tracemalloc_peak_bytes, other.tracemalloc_peak_bytes)
+        self.max_rss_bytes = max(self.max_rss_bytes, other.max_rss_bytes)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "rows_per_second": self.rows_per_second}
+
+
+@dataclass
+class StageSample:
+    """Handle yielded by :meth:`RunMetrics.stage`; ``rows`` may be set inside the block."""
+
+    rows: int = 0
+
+
+@dataclass
+class RunMetrics:
+    """Stage timings of one run, keyed by stage name in first-seen order.
+
+    A :class:`RunMetrics` is not locked: give each worker its own and
+    :meth:`merge` them on the coordinating thread.
+    """
+
+    stages: dict[str, StageStats] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.time)
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+
+    @contextmanager
+    def stage(self, name: str, rows: int = 0) -> Iterator[StageSample]:
+        sample = StageSample(rows=rows)
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            peaks = _peak_stack()
+            traced_before, peak = tracemalloc.get_traced_memory()
+            if peaks:
+                peaks[-1] = max(peaks[-1], peak)
+            peaks.append(traced_before)
+            tracemalloc.reset_peak()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield sample
+        finally:
+            wall = time.perf_counter() - wall_start
+            traced_peak = 0
+            if tracing:
+                traced_peak = max(peaks.pop(), tracemalloc.get_traced_memory()[1])
+                if peaks:
+                    peaks[-1] = max(peaks[-1], traced_peak)
+            stats = StageStats(
+                calls=1,
+                rows=sample.rows,
+                wall_seconds=wall,
+                cpu_seconds=time.thread_time() - cpu_start,
+                max_wall_seconds=wall,
+                tracemalloc_peak_bytes=max(traced_peak - traced_before, 0) if tracing else 0,
+                max_rss_bytes=peak_rss_bytes(),
+            )
+            self.stages.setdefault(name, StageStats()).add(stats)
+
+    def merge(self, other: "RunMetrics") -> None:
+        for name, stats in other.stages.items():
+            self.stages.setdefault(name, StageStats()).add(stats)
+
+    def report(self, **extra: Any) -> dict[str, Any]:
+        """JSON-serializable summary of the run."""
+
+        return {
+            "run_id": self.run_id,
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.started_at)),
+            "wall_seconds": time.time() - self.started_at,
+            "peak_rss_bytes": peak_rss_bytes(),
+            **extra,
+            "stages": {name: stats.as_dict() for name, stats in self.stages.items()},
+        }
+
+
+_ACTIVE: ContextVar[Optional[RunMetrics]] = ContextVar("run_metrics", default=None)
+
+
+@contextmanager
+def collecting(metrics: RunMetrics) -> Iterator[RunMetrics]:
+    """Make ``metrics`` the target of :func:`stage` within the block."""
+
+    token = _ACTIVE.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _ACTIVE.reset(token)
+
+
+def active() -> Optional[RunMetrics]:
+    """The :class:`RunMetrics` that :func:`stage` records into here, if any."""
+
+    return _ACTIVE.get()
+
+
+@contextmanager
+def stage(name: str, rows: int = 0) -> Iterator[StageSample]:
+    """Time a stage into the active :class:`RunMetrics`, if any."""
+
+    metrics = _ACTIVE.get()
+    if metrics is None:
+        yield StageSample(rows=rows)
+        return
+    with metrics.stage(name, rows) as sample:
+        yield sample
+
+
+@contextmanager
+def tracing(enabled: bool) -> Iterator[None]:
+    """Run the block under ``tracemalloc`` when ``enabled`` and not already tracing."""
+
+    started = enabled and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+def write_json_report(report: dict[str, Any], directory: Path, prefix: str = "etl_run") -> Path:
+    """Write ``report`` as ``<prefix>_<UTC timestamp>_<run id>.json`` under ``directory``.
+
+    The run id keeps runs started within the same second from overwriting
+    each other's report.
+    """
+
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = report["started_at"].replace("-", "").replace(":", "")
+    path = directory / f"{prefix}_{stamp}_{report['run_id']}.json"
+    path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def write_prometheus_textfile(report: dict[str, Any], path: Path) -> Path:
+    """Write ``report`` in the node_exporter textfile-collector format.
+
+    The file is replaced atomically so the collector never reads a partial one.
+    """
+
+    gauges = {
+        "stage_wall_seconds": ("Wall time spent in the stage.", "wall_seconds"),
+        "stage_cpu_seconds": ("CPU time spent in the stage.", "cpu_seconds"),
+        "stage_rows": ("Rows processed by the stage.", "rows"),
+        "stage_calls": ("Chunks processed by the stage.", "calls"),
+        "stage_rows_per_second": ("Stage throughput.", "rows_per_second"),
+        "stage_tracemalloc_peak_bytes": ("Largest traced allocation peak.", "tracemalloc_peak_bytes"),
+    }
+    lines: list[str] = []
+    for metric, (help_text, key) in gauges.items():
+        name = f"{PROMETHEUS_PREFIX}_{metric}"
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+        for stage_name, stats in report["stages"].items():
+            label = stage_name.replace("\\", "\\\\").replace('"', '\\"')
+            lines.append(f'{name}{{stage="{label}"}} {stats[key]}')
+    for metric, help_text, value in (
+        ("run_wall_seconds", "Wall time of the whole run.", report["wall_seconds"]),
+        ("run_rows", "Rows written by the run.", report.get("rows", 0)),
+        ("peak_rss_bytes", "Peak resident set size of the run.", report["peak_rss_bytes"]),
+        ("last_run_timestamp_seconds", "Unix time the run finished.", time.time()),
+    ):
+        name = f"{PROMETHEUS_PREFIX}_{metric}"
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {value}"]
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temporary.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    os.replace(temporary, path)
+    return path
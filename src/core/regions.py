@@ -0,0 +1,87 @@
+"""Region name normalization shared by the ETL and the visualization layer."""
+
+from __future__ import annotations
+
+import unicodedata
+from functools import lru_cache
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+# Official region names, north to south; normalized below to fix category order.
+_OFFICIAL_REGION_NAMES = (
+    "Región de Arica y Parinacota",
+    "Región de Tarapacá",
+    "Región de Antofagasta",
+    "Región de Atacama",
+    "Región de Coquimbo",
+    "Región de Valparaíso",
+    "Región Metropolitana de Santiago",
+    "Región del Libertador General Bernardo O'Higgins",
+    "Región del Maule",
+    "Región de Ñuble",
+    "Región del Biobío",
+    "Región de La Araucanía",
+    "Región de Los Ríos",
+    "Región de Los Lagos",
+    "Región de Aysén del General Carlos Ibáñez del Campo",
+    "Región de Magallanes y de la Antártica Chilena",
+)
+
+
+@lru_cache(maxsize=None)
+def _normalize_name(name: str) -> str:
+    ascii_name = (
+        unicodedata.normalize("NFKD", name)
+        .encode("ascii", "ignore")
+        .decode("utf-8")
+    )
+    return ascii_name.strip().title()
+
+
+def normalize_region(name: str | float) -> str | float:
+    if pd.isna(name):
+        return name
+    return _normalize_name(str(name))
+
+
+REGION_ORDER: tuple[str, ...] = tuple(_normalize_name(name) for name in _OFFICIAL_REGION_NAMES)
+
+
+def region_categories(values: Iterable[str]) -> list[str]:
+    """Stable category order: known regions north to south, then any extras sorted."""
+
+    known = set(REGION_ORDER)
+    extras = sorted({value for value in values if value not in known})
+    return [*REGION_ORDER, *extras]
+
+
+def normalize_regions(series: pd.Series) -> pd.Series:
+    """Normalize a region column once per distinct value.
+
+    The column is factorized and only the unique names are normalized (and
+    memoized across calls). The result is a ``Categorical`` ordered by
+    :func:`region_categories` so every chunk and reader shares the same layout.
+    """
+
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    normalized = [_normalize_name(str(value)) for value in uniques]
+    categories = pd.Index(region_categories(normalized))
+    positions = categories.get_indexer(normalized)
+    remapped = np.where(codes >= 0, positions[codes] if len(positions) else -1, -1)
+    return pd.Series(
+        pd.Categorical.from_codes(remapped, categories=categories),
+        index=series.index,
+        name=series.name,
+    )
+
+
+def as_region_categorical(series: pd.Series) -> pd.Series:
+    """Give an already normalized region column the shared category order."""
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        values = series.cat.categories
+    else:
+        values = series.dropna().unique()
+    return series.astype(pd.CategoricalDtype(region_categories(values)))
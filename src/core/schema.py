@@ -0,0 +1,111 @@
+"""Declared Arrow schema of the processed dataset shared by the ETL and the viz layer.
+
+:func:`conform_table` checks a table against :data:`PROCESSED_SCHEMA` and stamps
+it with :data:`SCHEMA_VERSION`, so a table handed from
+``EtlPipeline.run(return_arrow=True)`` to ``load_dataset_from_table`` is
+validated once. Bump the version whenever a declared column changes.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import pyarrow as pa
+
+SCHEMA_VERSION = 1
+SCHEMA_VERSION_KEY = b"corfo.schema_version"
+
+# Amount columns parsed from CLP text; the ETL, the cube and the readers share this list.
+CURRENCY_COLUMNS = [
+    "Financiamiento Innova",
+    "Aprobado Privado",
+    "Aprobado Privado Pecuniario",
+    "Monto Certificado Ley",
+]
+
+# Typed columns the dashboards rely on; any other column passes through as is.
+PROCESSED_SCHEMA = pa.schema(
+    [
+        pa.field("Código Proyecto", pa.large_string()),
+        pa.field("Región", pa.large_string()),
+        pa.field("Año Adjudicación", pa.int64()),
+        *(pa.field(column, pa.int64()) for column in CURRENCY_COLUMNS),
+        pa.field("Region_Normalizada", pa.dictionary(pa.int8(), pa.string())),
+        pa.field("es_los_rios", pa.bool_()),
+        pa.field("anio_dt", pa.timestamp("us")),
+    ],
+    metadata={SCHEMA_VERSION_KEY: str(SCHEMA_VERSION).encode()},
+)
+
+
+class SchemaError(ValueError):
+    """A table does not match the declared processed schema."""
+
+
+def schema_version(table: pa.Table) -> Optional[int]:
+    """Version stamped on ``table`` by :func:`conform_table`, if any."""
+
+    value = (table.schema.metadata or {}).get(SCHEMA_VERSION_KEY)
+    return int(value) if value is not None else None
+
+
+def conform_table(table: pa.Table, schema: pa.Schema = PROCESSED_SCHEMA) -> pa.Table:
+    """Validate ``table`` against ``schema`` and cast declared columns to it.
+
+    Declared columns must exist with a type of the same kind (e.g. ``int32``
+    for ``int64``, ``string`` for ``large_string``, or all-null); they are cast
+    safely, so lossy values raise :class:`SchemaError`. Dictionary-encoded text
+    (the ETL's categoricals) satisfies a plain text column and stays encoded.
+    Tables already stamped with the current version are returned untouched.
+    """
+
+    version = (schema.metadata or {}).get(SCHEMA_VERSION_KEY)
+    if version is not None and (table.schema.metadata or {}).get(SCHEMA_VERSION_KEY) == version:
+        return table
+
+    problems: list[str] = []
+    for declared in schema:
+        index = table.schema.get_field_index(declared.name)
+        if index < 0:
+            problems.append(f"missing column {declared.name!r}")
+            continue
+        actual = table.schema.field(index).type
+        if actual == declared.type:
+            continue
+        if pa.types.is_dictionary(actual) and not pa.types.is_dictionary(declared.type):
+            if _is_text(actual) and _is_text(declared.type):
+                continue
+        if not _same_kind(actual, declared.type):
+            problems.append(f"{declared.name!r} is {actual}, expected {declared.type}")
+            continue
+        try:
+            column = table.column(index).cast(declared.type, safe=True)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as error:
+            problems.append(f"{declared.name!r} cannot be cast to {declared.type}: {error}")
+            continue
+        table = table.set_column(index, table.schema.field(index).with_type(declared.type), column)
+    if problems:
+        raise SchemaError(f"Table does not match schema v{SCHEMA_VERSION}: " + "; ".join(problems))
+
+    metadata = dict(table.schema.metadata or {})
+    if version is not None:
+        metadata[SCHEMA_VERSION_KEY] = version
+    return table.replace_schema_metadata(metadata)
+
+
+def _same_kind(actual: pa.DataType, declared: pa.DataType) -> bool:
+    if pa.types.is_null(actual):
+        return True
+    kinds = (
+        pa.types.is_integer,
+        pa.types.is_boolean,
+        pa.types.is_timestamp,
+        _is_text,
+    )
+    return any(kind(actual) and kind(declared) for kind in kinds)
+
+
+def _is_text(data_type: pa.DataType) -> bool:
+    if pa.types.is_dictionary(data_type):
+        data_type = data_type.value_type
+    return pa.types.is_string(data_type) or pa.types.is_large_string(data_type)
@@ -2,10 +2,27 @@
 
 from __future__ import annotations
 
+import csv
+import io
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator, Optional, Protocol
+from typing import Any, Callable, Iterable, Iterator, Optional, Protocol, Sequence, Union
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+_LOGGER = logging.getLogger(__name__)
+
+# Suffixes decompressed on the fly, through Arrow so zstd needs no extra package.
+COMPRESSED_SUFFIXES = (".gz", ".zst", ".bz2", ".lz4")
+
+# ``DataFrame.attrs`` key holding the raw file a chunk was read from.
+SOURCE_FILE_ATTR = "source_file"
 
 
 class DataExtractor(Protocol):
@@ -15,6 +32,58 @@ class DataExtractor(Protocol):
         ...
 
 
+class ChunkSizer:
+    """Rows for the next chunk: ``initial_rows``, or a memory budget once measured.
+
+    Without ``budget_mb`` the size stays fixed. With it, every chunk's deep
+    memory footprint is observed and later chunks get as many rows as fit the
+    budget at the widest bytes/row seen so far, so a run of long ``Objetivo``
+    texts shrinks them. Chunks at most double from one to the next, which
+    limits the overshoot when narrow rows are followed by wide ones.
+    """
+
+    def __init__(self, initial_rows: int, budget_mb: Optional[float] = None) -> None:
+        self.rows = initial_rows
+        self._budget_bytes = None if budget_mb is None else budget_mb * (1 << 20)
+        self.bytes_per_row = 0.0
+
+    def observe(self, chunk: pd.DataFrame) -> None:
+        if self._budget_bytes is None or chunk.empty:
+            return
+        footprint = chunk.memory_usage(deep=True, index=False).sum()
+        self.bytes_per_row = max(self.bytes_per_row, footprint / len(chunk))
+        self.rows = max(1, min(int(self._budget_bytes // self.bytes_per_row), 2 * len(chunk)))
+
+
+def rechunk_batches(
+    batches: Iterable[pa.RecordBatch],
+    sizer: ChunkSizer,
+    to_pandas: Callable[[pa.Table, int], pd.DataFrame],
+) -> Iterator[pd.DataFrame]:
+    """Regroup Arrow ``batches`` into frames of ``sizer.rows`` rows.
+
+    ``to_pandas`` receives each slice and the row offset where it starts.
+    """
+
+    pending: list[pa.RecordBatch] = []
+    buffered = 0
+    offset = 0
+    for batch in batches:
+        pending.append(batch)
+        buffered += batch.num_rows
+        while buffered >= sizer.rows:
+            rows = sizer.rows
+            table = pa.Table.from_batches(pending)
+            chunk = to_pandas(table.slice(0, rows), offset)
+            sizer.observe(chunk)
+            yield chunk
+            offset += rows
+            rest = table.slice(rows)
+            pending, buffered = rest.to_batches(), rest.num_rows
+    if buffered:
+        yield to_pandas(pa.Table.from_batches(pending), offset)
+
+
 class CsvExtractor(DataExtractor):
     """Chunked CSV reader to minimize memory pressure."""
 
@@ -24,20 +93,223 @@ class CsvExtractor(DataExtractor):
         chunk_size: int,
         encoding: str = "utf-8",
         na_values: Optional[list[str]] = None,
+        memory_budget_mb: Optional[float] = None,
     ) -> None:
         self._csv_path = csv_path
         self._chunk_size = chunk_size
         self._encoding = encoding
         self._na_values = na_values or ["", "NA", "N/A", "null", "NULL"]
+        self._memory_budget_mb = memory_budget_mb
 
     def read(self) -> Iterator[pd.DataFrame]:
+        if not is_compressed(self._csv_path):
+            yield from self._read(self._csv_path)
+            return
+        with pa.input_stream(str(self._csv_path), compression="detect") as stream:
+            yield from self._read(stream)
+
+    def _read(self, source: Union[Path, pa.NativeFile]) -> Iterator[pd.DataFrame]:
         reader = pd.read_csv(
-            self._csv_path,
+            source,
             chunksize=self._chunk_size,
             dtype=str,
             encoding=self._encoding,
             na_values=self._na_values,
             keep_default_na=True,
         )
-        for chunk in reader:
-            yield chunk
+        sizer = ChunkSizer(self._chunk_size, self._memory_budget_mb)
+        with reader:
+            while True:
+                try:
+                    chunk = reader.get_chunk(sizer.rows)
+                except StopIteration:
+                    return
+                sizer.observe(chunk)
+                yield chunk
+
+
+# Tokens ``pd.read_csv`` treats as missing with ``keep_default_na=True``.
+PANDAS_DEFAULT_NA_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+
+def arrow_string_dtype() -> pd.StringDtype:
+    """Arrow-backed string dtype with ``NaN`` missing values, as ``dtype=str`` gives."""
+
+    try:
+        return pd.StringDtype("pyarrow", na_value=np.nan)
+    except TypeError:  # pandas < 2.3
+        return pd.StringDtype("pyarrow_numpy")
+
+
+class ArrowCsvExtractor(DataExtractor):
+    """Multithreaded CSV reader backed by ``pyarrow.csv.open_csv``.
+
+    Every column is declared as a string up front, so Arrow never guesses a
+    type from the first block and then fails on a later one; currency, date and
+    boolean columns keep their raw text for ``ProjectTransformer`` to parse.
+    Blocks are re-sliced into ``chunk_size`` rows and converted to
+    ``string[pyarrow]`` columns, matching the chunks of :class:`CsvExtractor`
+    (including their sizes under a ``memory_budget_mb``).
+    """
+
+    def __init__(
+        self,
+        csv_path: Path,
+        chunk_size: int,
+        encoding: str = "utf-8",
+        na_values: Optional[list[str]] = None,
+        block_size: int = 16 << 20,
+        memory_budget_mb: Optional[float] = None,
+    ) -> None:
+        self._csv_path = csv_path
+        self._chunk_size = chunk_size
+        self._encoding = encoding
+        extra = na_values or ["", "NA", "N/A", "null", "NULL"]
+        self._na_values = sorted(set(PANDAS_DEFAULT_NA_VALUES) | set(extra))
+        self._block_size = block_size
+        self._memory_budget_mb = memory_budget_mb
+
+    def read(self) -> Iterator[pd.DataFrame]:
+        reader = pacsv.open_csv(
+            self._csv_path,
+            read_options=pacsv.ReadOptions(
+                encoding=self._encoding,
+                block_size=self._block_size,
+                use_threads=True,
+            ),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types=self._schema(),
+                null_values=self._na_values,
+                strings_can_be_null=True,
+                quoted_strings_can_be_null=True,
+            ),
+        )
+        sizer = ChunkSizer(self._chunk_size, self._memory_budget_mb)
+        yield from rechunk_batches(reader, sizer, self._to_pandas)
+
+    def _schema(self) -> dict[str, pa.DataType]:
+        raw = pa.input_stream(str(self._csv_path), compression="detect")
+        with io.TextIOWrapper(raw, encoding=self._encoding, newline="") as handle:
+            header = next(csv.reader(handle), [])
+        return {name: pa.string() for name in header}
+
+    @staticmethod
+    def _to_pandas(table: pa.Table, offset: int) -> pd.DataFrame:
+        dtype = arrow_string_dtype()
+        frame = table.to_pandas(types_mapper=lambda _: dtype)
+        frame.index = pd.RangeIndex(offset, offset + len(frame))
+        return frame
+
+
+def is_compressed(path: Path) -> bool:
+    return path.suffix.lower() in COMPRESSED_SUFFIXES
+
+
+class _ReadFailed:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+_FILE_DONE = object()
+
+
+class MultiFileExtractor(DataExtractor):
+    """Reads several raw files concurrently, yielding their chunks file by file.
+
+    Up to ``workers`` files are read at once by per-file extractors from
+    ``extractor_factory``; each buffers at most ``prefetch`` chunks ahead of the
+    consumer, so memory stays bounded while later files are already being
+    parsed. Output order is the order of ``paths``. Every chunk records its file
+    in ``frame.attrs[SOURCE_FILE_ATTR]`` and, when ``source_column`` is set, in
+    that column too.
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[Path],
+        extractor_factory: Callable[[Path], DataExtractor],
+        workers: int = 1,
+        prefetch: int = 4,
+        source_column: Optional[str] = None,
+    ) -> None:
+        if not paths:
+            raise ValueError("MultiFileExtractor needs at least one file")
+        self._paths = list(paths)
+        self._factory = extractor_factory
+        self._workers = max(1, min(workers, len(self._paths)))
+        self._prefetch = prefetch
+        self._source_column = source_column
+
+    def read(self) -> Iterator[pd.DataFrame]:
+        if self._workers == 1:
+            for path in self._paths:
+                for chunk in self._factory(path).read():
+                    yield self._tag(chunk, path)
+            return
+
+        stop = threading.Event()
+        buffers: list[queue.Queue[Any]] = [queue.Queue(maxsize=self._prefetch) for _ in self._paths]
+        pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="extract")
+        try:
+            for path, buffer in zip(self._paths, buffers):
+                pool.submit(self._pump, path, buffer, stop)
+            for path, buffer in zip(self._paths, buffers):
+                _LOGGER.debug("Reading chunks of %s", path)
+                while True:
+                    item = buffer.get()
+                    if item is _FILE_DONE:
+                        break
+                    if isinstance(item, _ReadFailed):
+                        raise item.error
+                    yield item
+        finally:
+            # Unblocks producers waiting on a full buffer when the consumer stops early.
+            stop.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _pump(self, path: Path, buffer: "queue.Queue[Any]", stop: threading.Event) -> None:
+        try:
+            for chunk in self._factory(path).read():
+                if not self._put(buffer, self._tag(chunk, path), stop):
+                    return
+        except BaseException as error:  # handed to the consumer thread
+            self._put(buffer, _ReadFailed(error), stop)
+            return
+        self._put(buffer, _FILE_DONE, stop)
+
+    @staticmethod
+    def _put(buffer: "queue.Queue[Any]", item: Any, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _tag(self, chunk: pd.DataFrame, path: Path) -> pd.DataFrame:
+        chunk.attrs[SOURCE_FILE_ATTR] = str(path)
+        if self._source_column:
+            chunk[self._source_column] = pd.Series(str(path), index=chunk.index, dtype=arrow_string_dtype())
+        return chunk
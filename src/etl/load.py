@@ -2,26 +2,589 @@
 
 from __future__ import annotations
 
+import io
+import os
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Protocol
+from typing import IO, Any, Optional, Protocol, Sequence, Union, runtime_checkable
+from urllib.parse import quote
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.core.metrics import RunMetrics, active, stage
+from src.core.regions import normalize_regions
+
+HIVE_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+REGION_COLUMN = "Región"
+NORMALIZED_REGION_COLUMN = "Region_Normalizada"
 
 
 class DataLoader(Protocol):
-    """Generic interface for persisting dataframes."""
+    """Generic interface for persisting dataframes.
+
+    Loaders receive data either as a whole frame through ``save`` or as a
+    stream of chunks between ``open`` and ``close``; a failed run calls
+    ``abort`` instead of ``close``.
+    """
 
     def save(self, frame: pd.DataFrame) -> None:
         ...
 
+    def open(self) -> None:
+        ...
+
+    def write_chunk(self, frame: pd.DataFrame) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
+
+    def abort(self) -> None:
+        ...
+
+
+@runtime_checkable
+class StagedLoader(DataLoader, Protocol):
+    """Loader whose ``close`` is ``finish`` followed by ``publish``.
+
+    ``finish`` completes every write under temporary names and ``publish``
+    renames them into place, so several loaders can all finish before any of
+    them publishes. ``abort`` is still valid after ``finish``.
+    """
+
+    def finish(self) -> None:
+        ...
+
+    def publish(self) -> None:
+        ...
+
+
+def unify_schema(schema: pa.Schema) -> pa.Schema:
+    """Writer schema fitting every chunk of a run, inferred from the first one.
+
+    Columns inferred as ``null`` (all-NA text chunks) become strings, and
+    dictionary indices widen to ``int32`` (what Parquet reads back anyway), so
+    a categorical whose dictionary grows past 127 entries in a later chunk
+    still fits.
+    """
+
+    fields = []
+    for field in schema:
+        if pa.types.is_null(field.type):
+            field = field.with_type(pa.large_string())
+        elif pa.types.is_dictionary(field.type) and field.type.index_type.bit_width < 32:
+            field = field.with_type(pa.dictionary(pa.int32(), field.type.value_type, field.type.ordered))
+        fields.append(field)
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+def temporary_path(path: Path) -> Path:
+    """Sibling of ``path`` written first and renamed over it once complete."""
+
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+
+class _CsvSink:
+    """CSV through pandas, optionally gzip/zstd-compressed by an Arrow stream."""
+
+    name = "csv"
+
+    def __init__(self, path: Path, compression: Optional[str]) -> None:
+        self.path = path
+        self.temporary = temporary_path(path)
+        if compression:
+            stream = pa.output_stream(str(self.temporary), compression=compression)
+            self._handle: IO[str] = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+        else:
+            self._handle = self.temporary.open("w", encoding="utf-8", newline="")
+        self._header = True
+
+    def write(self, frame: pd.DataFrame, table: pa.Table) -> None:
+        frame.to_csv(self._handle, index=False, header=self._header)
+        self._header = False
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class _ParquetSink:
+    """Parquet file whose row groups hold ``row_group_size`` rows across chunks."""
+
+    name = "parquet"
+
+    def __init__(
+        self, path: Path, schema: pa.Schema, row_group_size: Optional[int], **options: Any
+    ) -> None:
+        self.path = path
+        self.temporary = temporary_path(path)
+        self._writer = pq.ParquetWriter(self.temporary, schema, **options)
+        self._row_group_size = row_group_size
+        self._pending: list[pa.Table] = []
+        self._pending_rows = 0
+
+    def write(self, frame: pd.DataFrame, table: pa.Table) -> None:
+        if self._row_group_size is None:
+            self._writer.write_table(table)
+            return
+        self._pending.append(table)
+        self._pending_rows += table.num_rows
+        if self._pending_rows >= self._row_group_size:
+            self._flush()
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._writer.write_table(pa.concat_tables(self._pending), row_group_size=self._row_group_size)
+            self._pending, self._pending_rows = [], 0
+
+
+class _FeatherSink:
+    """Arrow IPC file (Feather v2), one record batch per chunk.
+
+    Categoricals whose dictionary grows across chunks are written as
+    dictionary deltas, which the IPC file format allows (replacements it does
+    not). A chunk whose dictionary does not extend the one already written,
+    e.g. a column the encoder stopped encoding mid-run, is re-indexed against
+    it and its unseen values appended as a delta.
+    """
+
+    name = "feather"
+
+    def __init__(self, path: Path, schema: pa.Schema, compression: Optional[str]) -> None:
+        self.path = path
+        self.temporary = temporary_path(path)
+        self._sink = pa.OSFile(str(self.temporary), "wb")
+        self._writer = pa.ipc.new_file(
+            self._sink,
+            schema,
+            options=pa.ipc.IpcWriteOptions(compression=compression, emit_dictionary_deltas=True),
+        )
+        self._dictionaries: dict[str, pa.Array] = {}
+        # Value -> index in ``_dictionaries``, built once a column needs re-indexing.
+        self._codes: dict[str, dict[Any, int]] = {}
+
+    def write(self, frame: pd.DataFrame, table: pa.Table) -> None:
+        if any(pa.types.is_dictionary(field.type) for field in table.schema):
+            columns = [
+                self._as_delta(field.name, column.combine_chunks())
+                if pa.types.is_dictionary(field.type)
+                else column
+                for field, column in zip(table.schema, table.columns)
+            ]
+            table = pa.Table.from_arrays(columns, schema=table.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        self._writer.close()
+        self._sink.close()
+
+    def _as_delta(self, name: str, array: pa.DictionaryArray) -> pa.DictionaryArray:
+        written = self._dictionaries.get(name)
+        chunk = array.dictionary
+        if name not in self._codes and (
+            written is None
+            or (len(chunk) >= len(written) and chunk.slice(0, len(written)).equals(written))
+        ):
+            self._dictionaries[name] = chunk
+            return array
+        if written is None:
+            written = chunk.slice(0, 0)
+        codes = self._codes.get(name)
+        if codes is None:
+            codes = self._codes[name] = {value: index for index, value in enumerate(written.to_pylist())}
+        unseen = []
+        positions = np.empty(len(chunk), dtype=np.int32)
+        for index, value in enumerate(chunk.to_pylist()):
+            position = codes.get(value)
+            if position is None:
+                position = codes[value] = len(codes)
+                unseen.append(value)
+            positions[index] = position
+        if unseen:
+            written = pa.concat_arrays([written, pa.array(unseen, type=chunk.type)])
+            self._dictionaries[name] = written
+        indices = pa.array(positions).take(array.indices).cast(array.type.index_type)
+        return pa.DictionaryArray.from_arrays(indices, written)
+
+
+def _timed_write(sink: "_Sink", frame: pd.DataFrame, table: pa.Table) -> RunMetrics:
+    """Write one chunk to ``sink``, timed in the writer thread for the caller to merge."""
+
+    metrics = RunMetrics()
+    with metrics.stage(f"load.{sink.name}", len(frame)):
+        sink.write(frame, table)
+    return metrics
 
-class CsvParquetLoader(DataLoader):
-    """Writes both CSV and Parquet outputs to keep analysts flexible."""
 
-    def __init__(self, csv_path: Path, parquet_path: Path) -> None:
+_Sink = Union[_CsvSink, _ParquetSink, _FeatherSink]
+
+
+class CsvParquetLoader(StagedLoader):
+    """Writes CSV and Parquet outputs (plus optional Feather) to keep analysts flexible.
+
+    Each format has its own writer thread: a chunk is handed to all of them at
+    once and ``write_chunk`` returns while they run, so writing overlaps the
+    next chunk's transform and the pyarrow writers run alongside ``to_csv``
+    without holding the GIL. Chunks reach every writer in order. Files are
+    written under temporary names and renamed into place by ``close``;
+    ``abort`` deletes them, so readers never see a partial output.
+
+    Each sink's writes are timed as ``load.<format>`` in the thread that runs
+    them and merged into the :class:`~src.core.metrics.RunMetrics` active when
+    the loader was opened, so they show up even though the caller's ``load``
+    stage only covers handing chunks over and waiting for the previous one.
+    """
+
+    def __init__(
+        self,
+        csv_path: Path,
+        parquet_path: Path,
+        *,
+        feather_path: Optional[Path] = None,
+        csv_compression: Optional[str] = None,
+        compression: str = "snappy",
+        compression_level: Optional[int] = None,
+        use_dictionary: Union[bool, Sequence[str]] = True,
+        row_group_size: Optional[int] = None,
+        feather_compression: Optional[str] = None,
+        concurrent: bool = True,
+    ) -> None:
         self._csv_path = csv_path
         self._parquet_path = parquet_path
+        self._feather_path = feather_path
+        self._csv_compression = csv_compression
+        self._parquet_options: dict[str, Any] = {
+            "compression": compression,
+            "compression_level": compression_level,
+            "use_dictionary": use_dictionary if isinstance(use_dictionary, bool) else list(use_dictionary),
+        }
+        self._row_group_size = row_group_size
+        self._feather_compression = feather_compression
+        self._concurrent = concurrent
+        self._schema: Optional[pa.Schema] = None
+        self._sinks: list[_Sink] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: list[Future[RunMetrics]] = []
+        self._metrics: Optional[RunMetrics] = None
+
+    def save(self, frame: pd.DataFrame) -> None:
+        self.open()
+        try:
+            self.write_chunk(frame)
+        except BaseException:
+            self.abort()
+            raise
+        self.close()
+
+    def open(self) -> None:
+        self.abort()
+        self._schema = None
+        self._metrics = active()
+
+    def write_chunk(self, frame: pd.DataFrame) -> None:
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if self._schema is None:
+            self._schema = unify_schema(table.schema)
+            self._sinks = self._open_sinks(self._schema)
+        table = table.cast(self._schema)
+        self._wait()
+        if self._executor is None:
+            for sink in self._sinks:
+                with stage(f"load.{sink.name}", len(frame)):
+                    sink.write(frame, table)
+            return
+        self._pending = [self._executor.submit(_timed_write, sink, frame, table) for sink in self._sinks]
+
+    def close(self) -> None:
+        self.finish()
+        self.publish()
+
+    def finish(self) -> None:
+        try:
+            self._wait()
+            for sink in self._sinks:
+                sink.close()
+        except BaseException:
+            self.abort()
+            raise
+
+    def publish(self) -> None:
+        for sink in self._sinks:
+            os.replace(sink.temporary, sink.path)
+        self._release()
+
+    def abort(self) -> None:
+        """Stop writing and delete the temporary files; published outputs stay as they were."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        for sink in self._sinks:
+            try:
+                sink.close()
+            except Exception:  # already failed; the file is discarded anyway
+                pass
+            sink.temporary.unlink(missing_ok=True)
+        self._release()
+
+    def _open_sinks(self, schema: pa.Schema) -> list[_Sink]:
+        sinks: list[_Sink] = [
+            _CsvSink(self._csv_path, self._csv_compression),
+            _ParquetSink(self._parquet_path, schema, self._row_group_size, **self._parquet_options),
+        ]
+        if self._feather_path is not None:
+            sinks.append(_FeatherSink(self._feather_path, schema, self._feather_compression))
+        if self._concurrent:
+            self._executor = ThreadPoolExecutor(max_workers=len(sinks), thread_name_prefix="load")
+        return sinks
+
+    def _wait(self) -> None:
+        pending, self._pending = self._pending, []
+        for future in pending:
+            timings = future.result()
+            if self._metrics is not None:
+                self._metrics.merge(timings)
+
+    def _release(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._pending = []
+        self._sinks = []
+
+
+class PartitionedParquetLoader(StagedLoader):
+    """Writes a hive-partitioned Parquet dataset (``column=value`` directories).
+
+    Rows are buffered per partition and flushed as row groups of roughly
+    ``row_group_size`` rows with column statistics and a page index, so readers
+    can skip both whole partitions and row groups. Buffers across all
+    partitions are capped at ``buffer_memory_mb`` of Arrow data: past that the
+    largest one is flushed early, so memory stays bounded when there are many
+    partitions while row groups stay full-sized for any budget that holds a
+    row group per partition.
+    ``Region_Normalizada`` is derived from ``Región`` when it is requested but
+    absent from the chunk.
+
+    Like :class:`CsvParquetLoader`, the dataset is written to a temporary
+    sibling directory that ``close`` swaps into place and ``abort`` deletes.
+    """
+
+    def __init__(
+        self,
+        dataset_dir: Path,
+        partition_by: Sequence[str],
+        row_group_size: int = 64_000,
+        compression: str = "snappy",
+        compression_level: Optional[int] = None,
+        use_dictionary: Union[bool, Sequence[str]] = True,
+        buffer_memory_mb: float = 256,
+    ) -> None:
+        self._dataset_dir = dataset_dir
+        self._partition_by = list(partition_by)
+        self._row_group_size = row_group_size
+        self._buffer_bytes = int(buffer_memory_mb * 1024 * 1024)
+        self._parquet_options: dict[str, Any] = {
+            "compression": compression,
+            "compression_level": compression_level,
+            "use_dictionary": use_dictionary if isinstance(use_dictionary, bool) else list(use_dictionary),
+        }
+        self._schema: Optional[pa.Schema] = None
+        self._buffers: dict[tuple[str, ...], list[pa.Table]] = {}
+        self._buffered_rows: dict[tuple[str, ...], int] = {}
+        self._buffered_bytes: dict[tuple[str, ...], int] = {}
+        self._writers: dict[tuple[str, ...], pq.ParquetWriter] = {}
+        self._temporary = temporary_path(dataset_dir)
+
+    def save(self, frame: pd.DataFrame) -> None:
+        self.open()
+        try:
+            self.write_chunk(frame)
+        except BaseException:
+            self.abort()
+            raise
+        self.close()
+
+    def open(self) -> None:
+        self.abort()
+        self._schema = None
+        self._temporary.mkdir(parents=True)
+
+    def write_chunk(self, frame: pd.DataFrame) -> None:
+        with stage("load.dataset", len(frame)):
+            self._write_chunk(frame)
+
+    def _write_chunk(self, frame: pd.DataFrame) -> None:
+        frame = self._with_partition_columns(frame)
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        data = table.drop_columns(self._partition_by)
+        if self._schema is None:
+            self._schema = unify_schema(data.schema)
+        data = data.cast(self._schema)
+
+        groups = frame.groupby(self._partition_by, dropna=False, sort=False, observed=True).indices
+        if not groups:  # zero-row chunk
+            return
+        # One gather puts each partition's rows together; the parts are zero-copy slices.
+        data = data.take(np.concatenate(list(groups.values())))
+        offset = 0
+        for values, positions in groups.items():
+            key = self._partition_key(values)
+            part = data.slice(offset, len(positions))
+            offset += len(positions)
+            self._buffers.setdefault(key, []).append(part)
+            self._buffered_rows[key] = self._buffered_rows.get(key, 0) + len(positions)
+            self._buffered_bytes[key] = self._buffered_bytes.get(key, 0) + part.nbytes
+            if self._buffered_rows[key] >= self._row_group_size:
+                self._flush(key)
+        while self._buffered_bytes and sum(self._buffered_bytes.values()) > self._buffer_bytes:
+            self._flush(max(self._buffered_bytes, key=self._buffered_bytes.__getitem__))
+
+    def close(self) -> None:
+        self.finish()
+        self.publish()
+
+    def finish(self) -> None:
+        try:
+            for key in list(self._buffers):
+                self._flush(key)
+            self._close_writers()
+        except BaseException:
+            self.abort()
+            raise
+
+    def publish(self) -> None:
+        if not self._temporary.exists():
+            return
+        # A directory cannot be renamed over a non-empty one: move the old
+        # dataset aside first, so the new one appears in a single rename.
+        previous = self._dataset_dir.with_name(f"{self._temporary.name}.old")
+        if self._dataset_dir.exists():
+            os.replace(self._dataset_dir, previous)
+        os.replace(self._temporary, self._dataset_dir)
+        shutil.rmtree(previous, ignore_errors=True)
+
+    def abort(self) -> None:
+        """Drop buffered rows and the temporary dataset; the published one stays as it was."""
+
+        self._buffers.clear()
+        self._buffered_rows.clear()
+        self._buffered_bytes.clear()
+        writers, self._writers = self._writers, {}
+        for writer in writers.values():
+            try:
+                writer.close()
+            except Exception:  # already failed; the files are discarded anyway
+                pass
+        shutil.rmtree(self._temporary, ignore_errors=True)
+
+    def _close_writers(self) -> None:
+        writers, self._writers = self._writers, {}
+        for writer in writers.values():
+            writer.close()
+
+    def _with_partition_columns(self, frame: pd.DataFrame) -> pd.DataFrame:
+        if NORMALIZED_REGION_COLUMN in self._partition_by and NORMALIZED_REGION_COLUMN not in frame:
+            frame = frame.assign(
+                **{NORMALIZED_REGION_COLUMN: normalize_regions(frame[REGION_COLUMN])}
+            )
+        return frame
+
+    def _partition_key(self, values: object) -> tuple[str, ...]:
+        if not isinstance(values, tuple):
+            values = (values,)
+        return tuple(HIVE_NULL_PARTITION if pd.isna(value) else str(value) for value in values)
+
+    def _flush(self, key: tuple[str, ...]) -> None:
+        parts = self._buffers.pop(key, [])
+        self._buffered_rows.pop(key, None)
+        self._buffered_bytes.pop(key, None)
+        if not parts:
+            return
+        writer = self._writers.get(key)
+        if writer is None:
+            segments = (
+                f"{column}={quote(value, safe='')}"
+                for column, value in zip(self._partition_by, key)
+            )
+            directory = self._temporary.joinpath(*segments)
+            directory.mkdir(parents=True, exist_ok=True)
+            writer = pq.ParquetWriter(
+                directory / "part-0.parquet",
+                self._schema,
+                write_statistics=True,
+                write_page_index=True,
+                **self._parquet_options,
+            )
+            self._writers[key] = writer
+        table = pa.concat_tables(parts)
+        if any(pa.types.is_dictionary(field.type) for field in table.schema):
+            # Many small parts, each with its chunk's dictionary, are slow to
+            # write one by one; a single dictionary per row group is not.
+            table = table.unify_dictionaries().combine_chunks()
+        writer.write_table(table, row_group_size=self._row_group_size)
+
+
+class CompositeLoader(StagedLoader):
+    """Fans every call out to several loaders, e.g. flat files plus a dataset.
+
+    ``close`` finishes every loader before any of them publishes, and a
+    failure aborts the loaders not yet published, so one failing output does
+    not leave the others half-replaced or its temporaries behind.
+    """
+
+    def __init__(self, loaders: Sequence[DataLoader]) -> None:
+        self._loaders = list(loaders)
 
     def save(self, frame: pd.DataFrame) -> None:
-        frame.to_csv(self._csv_path, index=False)
-        frame.to_parquet(self._parquet_path, index=False)
+        for loader in self._loaders:
+            loader.save(frame)
+
+    def open(self) -> None:
+        for loader in self._loaders:
+            loader.open()
+
+    def write_chunk(self, frame: pd.DataFrame) -> None:
+        for loader in self._loaders:
+            loader.write_chunk(frame)
+
+    def close(self) -> None:
+        self.finish()
+        self.publish()
+
+    def finish(self) -> None:
+        """Finish the staged loaders and close the others (their close cannot be split)."""
+
+        try:
+            for loader in self._loaders:
+                if isinstance(loader, StagedLoader):
+                    loader.finish()
+                else:
+                    loader.close()
+        except BaseException:
+            self.abort()
+            raise
+
+    def publish(self) -> None:
+        for index, loader in enumerate(self._loaders):
+            if not isinstance(loader, StagedLoader):
+                continue
+            try:
+                loader.publish()
+            except BaseException:
+                for remaining in self._loaders[index:]:
+                    remaining.abort()
+                raise
+
+    def abort(self) -> None:
+        for loader in self._loaders:
+            try:
+                loader.abort()
+            except Exception:  # keep cleaning up the others
+                pass
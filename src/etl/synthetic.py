@@ -0,0 +1,183 @@
+"""Seeded synthetic stand-in for the raw CORFO export, used by the benchmarks.
+
+:func:`generate_raw_frame` reproduces the 37-column layout of
+``corfo_idie_los_rios_recursos_anuales.csv`` as text, with category
+frequencies, null ratios and value formats (``$7.000.000`` amounts, mixed
+date layouts, ``Sí``/``No`` flags) close to the real file, so the ETL and the
+dashboard builders do the same work at any row count.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+# name -> (kind, parameters); insertion order is the raw column order.
+RAW_SCHEMA: dict[str, tuple[str, Any]] = {
+    "Código Proyecto": ("code", None),
+    "Foco Apoyo": ("choice", {
+        "Desarrolla innovación": 0.293,
+        "Desarrolla innovación con I+D": 0.267,
+        "Entorno para la innovación": 0.207,
+        "Renuévate": 0.198,
+        "Consolida y Expande": 0.035,
+    }),
+    "Tipo Intervención": ("choice", {"Subsidio": 0.875, "Ley": 0.125}),
+    "Instrumento": ("labels", ("Instrumento", 119, 0.0)),
+    "Instrumento Homologado": ("labels", ("Instrumento homologado", 47, 0.0)),
+    "Estado Data": ("choice", {"FINALIZADO": 0.852, "VIGENTE": 0.146, "DESISTIDO": 0.002}),
+    "Tipo Persona": ("choice", {
+        "Persona Jurídica constituida en Chile": 0.817,
+        "PERSONA JURIDICA COMERCIAL": 0.125,
+        "Persona Natural": 0.051,
+        None: 0.007,
+    }),
+    "Rut Beneficiario": ("rut", None),
+    "Beneficiario": ("labels", ("BENEFICIARIO", 1100, 0.0)),
+    "Título": ("text", ("Desarrollo de", 0.0)),
+    "Objetivo": ("text", ("Evaluar el potencial de", 0.001)),
+    "Año Adjudicación": ("year", (2009, 2025, 0.001)),
+    "Financiamiento Innova": ("currency", (0.054, 0.07, 500_000_000)),
+    "Aprobado Privado": ("currency", (0.054, 0.07, 300_000_000)),
+    "Aprobado Privado Pecuniario": ("currency", (0.054, 0.07, 300_000_000)),
+    "Monto Certificado Ley": ("currency", (0.875, 0.0, 900_000_000)),
+    "Tipo Innovación": ("choice", {"Producto": 0.432, "Servicio": 0.309, "Proceso": 0.203, None: 0.056}),
+    "Mercado Objetivo": ("labels", ("Mercado", 29, 0.0)),
+    "Criterio Mujer": ("choice", {"No": 0.83, "Incentivo": 0.059, "Convocatoria": 0.056, "no aplica": 0.055}),
+    "Género": ("choice", {"Masculino": 0.675, "Femenino": 0.317, "Sin determinar": 0.007, None: 0.001}),
+    "Sostenible": ("choice", {"No": 0.529, "Sí": 0.471}),
+    "ODS principal": ("labels", ("ODS", 15, 0.492)),
+    "Meta principal": ("labels", ("Meta", 83, 0.553)),
+    "Economía Circular": ("choice", {None: 0.557, "No": 0.299, "Sí": 0.144}),
+    "Modelo de Circularidad": ("labels", ("Modelo", 5, 0.855)),
+    "Región": ("choice", {
+        "Región del Biobío": 0.353,
+        "Región de los Lagos": 0.34,
+        "Región de La Araucanía": 0.203,
+        "Región de Los Ríos": 0.104,
+    }),
+    "Tramo Ventas": ("choice", {
+        "Grande": 0.343,
+        "Pequeña": 0.221,
+        "Microempresa": 0.211,
+        "Sin ventas": 0.127,
+        "Mediana": 0.098,
+    }),
+    "Inicio Actividad Económica": ("date", 0.044),
+    "Sector Económico": ("labels", ("Sector", 40, 0.055)),
+    "Patron principal asociado": ("labels", ("Patrón", 13, 0.855)),
+    "Tipo proyecto": ("labels", ("Tipo proyecto", 5, 0.573)),
+    "R principal": ("labels", ("R", 9, 0.877)),
+    "Estrategia R Principal": ("labels", ("Estrategia", 3, 0.856)),
+    "Ley REP": ("choice", {"No": 0.88, None: 0.098, "Sí": 0.021}),
+    "Ley REP (Sí/No)": ("labels", ("Producto prioritario", 3, 0.979)),
+    "ERNC": ("labels", ("Energía", 7, 0.968)),
+    "Tendencia Final": ("labels", ("Tendencia", 20, 0.0)),
+}
+RAW_COLUMNS: tuple[str, ...] = tuple(RAW_SCHEMA)
+
+_CODE_PREFIXES = np.array(["PATI", "IRS", "PDT", "BPE", "BP", "ITE2", "CVID", "SN2"], dtype=object)
+_TEXT_TOPICS = np.array(
+    [
+        "tecnologías para la acuicultura",
+        "un sistema de diagnóstico temprano",
+        "valorización de residuos orgánicos",
+        "prototipos de alimentos funcionales",
+        "servicios de ingeniería sostenible",
+        "capacidades de innovación regional",
+    ],
+    dtype=object,
+)
+
+
+def generate_raw_frame(rows: int, seed: int = 0, start: int = 0) -> pd.DataFrame:
+    """``rows`` synthetic raw rows as text columns, deterministic for a ``seed``.
+
+    ``start`` offsets the row numbers used in project codes so consecutive
+    calls (see :func:`write_raw_csv`) keep codes unique.
+    """
+
+    rng = np.random.default_rng([seed, start])
+    ids = np.arange(start, start + rows)
+    data = {
+        column: _generate_column(rng, kind, params, ids)
+        for column, (kind, params) in RAW_SCHEMA.items()
+    }
+    return pd.DataFrame(data, columns=list(RAW_COLUMNS)).astype("str")
+
+
+def write_raw_csv(
+    path: Path, rows: int, seed: int = 0, chunk_size: int = 100_000
+) -> Path:
+    """Write a synthetic raw CSV of ``rows`` rows without holding it all in memory."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        for start in range(0, rows, chunk_size):
+            chunk = generate_raw_frame(min(chunk_size, rows - start), seed=seed, start=start)
+            chunk.to_csv(handle, index=False, header=start == 0)
+    return path
+
+
+def _generate_column(
+    rng: np.random.Generator, kind: str, params: Any, ids: np.ndarray
+) -> np.ndarray:
+    rows = len(ids)
+    if kind == "choice":
+        return _choice(rng, params, rows)
+    if kind == "labels":
+        prefix, cardinality, null_ratio = params
+        # Zipf-like weights: a few labels dominate, as in the real columns.
+        weights = 1.0 / np.arange(1, cardinality + 1)
+        labels = {f"{prefix} {index + 1}": weight for index, weight in enumerate(weights)}
+        values = _choice(rng, labels, rows)
+        return _with_nulls(rng, values, null_ratio)
+    if kind == "code":
+        years = rng.integers(9, 26, size=rows).astype(str).astype(object)
+        prefixes = _CODE_PREFIXES[rng.integers(0, len(_CODE_PREFIXES), size=rows)]
+        return years + prefixes + "-" + (ids + 10_000).astype(str).astype(object)
+    if kind == "rut":
+        numbers = rng.integers(50_000_000, 99_999_999, size=rows).astype(str).astype(object)
+        digits = np.array(list("0123456789K"), dtype=object)[rng.integers(0, 11, size=rows)]
+        return numbers + "-" + digits
+    if kind == "text":
+        prefix, null_ratio = params
+        topics = _TEXT_TOPICS[rng.integers(0, len(_TEXT_TOPICS), size=rows)]
+        values = prefix + " " + topics + " " + ids.astype(str).astype(object)
+        return _with_nulls(rng, values, null_ratio)
+    if kind == "year":
+        first, last, null_ratio = params
+        values = rng.integers(first, last + 1, size=rows).astype(str).astype(object)
+        return _with_nulls(rng, values, null_ratio)
+    if kind == "currency":
+        null_ratio, zero_ratio, high = params
+        amounts = rng.integers(100_000, high, size=rows)
+        text = pd.Series(amounts).map("${:,}".format).str.replace(",", ".", regex=False)
+        values = text.to_numpy(dtype=object)
+        values[rng.random(rows) < zero_ratio] = "0"
+        return _with_nulls(rng, values, null_ratio)
+    if kind == "date":
+        days = rng.integers(np.datetime64("1980-01-01").astype(int), np.datetime64("2024-12-31").astype(int), size=rows)
+        dates = np.datetime_as_string(days.astype("datetime64[D]")).astype(object)
+        # The real column mixes three layouts of the same day.
+        layout = rng.random(rows)
+        values = np.where(layout < 0.6, dates + " 0:00:00", dates)
+        values = np.where(layout > 0.99, dates + "T00:00:00Z", values)
+        return _with_nulls(rng, values.astype(object), params)
+    raise ValueError(f"Unknown synthetic column kind {kind!r}")
+
+
+def _choice(rng: np.random.Generator, weights: Mapping[Optional[str], float], rows: int) -> np.ndarray:
+    values = np.array(list(weights), dtype=object)
+    probabilities = np.array(list(weights.values()), dtype=float)
+    return values[rng.choice(len(values), size=rows, p=probabilities / probabilities.sum())]
+
+
+def _with_nulls(rng: np.random.Generator, values: np.ndarray, null_ratio: float) -> np.ndarray:
+    if null_ratio:
+        values = values.copy()
+        values[rng.random(len(values)) < null_ratio] = None
+    return values
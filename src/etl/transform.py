@@ -3,14 +3,264 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable, Protocol
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, Iterable, Mapping, Optional, Protocol, Sequence, runtime_checkable
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
-from src.core.config import EtlSettings
+from src.core.config import CategoricalEncoding, CurrencyFormat, DerivedColumns, EtlSettings
+from src.core.metrics import stage
+from src.core.regions import normalize_regions
 
 _LOGGER = logging.getLogger(__name__)
 
+# Formats tried, in order, when a date column has no declared format. Day-first
+# layouts only: the source data is Chilean.
+DATE_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%d-%m-%Y %H:%M:%S",
+    "%d-%m-%Y",
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y",
+    "%Y/%m/%d",
+)
+DATE_SAMPLE_SIZE = 200
+_DATE_DTYPE = "datetime64[us]"
+BOOLEAN_COLUMN_TOKENS = ("mujer", "sostenible", "economía circular", "ley rep", "criterio")
+
+# Every character for which ``str.isspace`` is true, i.e. what ``str.split()``
+# splits on. Spelled out literally so Python ``re`` and pyarrow's RE2 agree.
+WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
+_WHITESPACE_RUN = f"[{WHITESPACE}]+"
+CURRENCY_SPACE = " \t\n\r\x0b\x0c"
+# Largest float64 below 2**63, so rounded amounts always fit in int64.
+MAX_AMOUNT = float(2**63 - 1024)
+# A cell needs work only if it holds whitespace other than isolated inner spaces.
+_DIRTY_WHITESPACE = "[" + WHITESPACE.replace(" ", "") + "]|  |^ | $"
+
+
+def normalize_whitespace(series: pd.Series) -> pd.Series:
+    """Vectorized equivalent of ``ProjectTransformer._clean_text``.
+
+    Runs of whitespace collapse to a single space and the ends are trimmed.
+    Only cells that actually contain irregular whitespace are rewritten, and
+    non-string cells (``NaN`` included) are returned untouched.
+    """
+
+    if _is_arrow_string(series):
+        # Arrow-backed strings: match in pyarrow directly, skipping pandas'
+        # per-call pattern checks and the dtype inference below.
+        matches = pc.match_substring_regex(series.array.__arrow_array__(), _DIRTY_WHITESPACE)
+        if not pc.any(matches).as_py():
+            return series
+        dirty = matches.fill_null(False).to_numpy(zero_copy_only=False)
+    else:
+        if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+            return series
+        if pd.api.types.infer_dtype(series, skipna=True) not in {"string", "mixed", "mixed-integer"}:
+            return series
+        dirty = series.str.contains(_DIRTY_WHITESPACE, regex=True, na=False).to_numpy(dtype=bool)
+    if not dirty.any():
+        return series
+    cleaned = series.copy()
+    cleaned[dirty] = series[dirty].str.replace(_WHITESPACE_RUN, " ", regex=True).str.strip(" ")
+    return cleaned
+
+
+def parse_currency(series: pd.Series, fmt: CurrencyFormat) -> tuple[pd.Series, int]:
+    """Parse amounts into ``Int64`` pesos with pyarrow kernels, without regexes.
+
+    The symbol, surrounding whitespace and thousands separators are dropped, the
+    decimal separator is honoured (fractions round half away from zero) and a
+    leading ``-`` marks negatives. Blank cells become ``NA``; anything else that
+    is not a number is rejected to ``NA`` and counted in the returned total.
+    """
+
+    values = pa.array(series, from_pandas=True)
+    if not pa.types.is_string(values.type) and not pa.types.is_large_string(values.type):
+        values = pc.cast(values, pa.string())
+    if len(fmt.symbol) == 1:
+        values = pc.utf8_trim(values, fmt.symbol + CURRENCY_SPACE)
+    else:
+        values = pc.utf8_trim(pc.replace_substring(values, fmt.symbol, ""), CURRENCY_SPACE)
+    values = pc.replace_substring(values, fmt.thousands, "")
+
+    amounts: pa.Array | None = None
+    rejected = 0
+    if not pc.any(pc.match_substring(values, fmt.decimal)).as_py():
+        try:
+            # Fast path: plain integers (the usual CLP layout) cast in one pass.
+            amounts = pc.cast(values, pa.int64())
+        except pa.ArrowInvalid:
+            amounts = None
+    if amounts is None:
+        amounts, rejected = _parse_currency_strict(values, fmt)
+
+    parsed = pd.Series(
+        amounts.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get),
+        name=series.name,
+    )
+    parsed.index = series.index
+    return parsed, rejected
+
+
+def _parse_currency_strict(values: pa.Array, fmt: CurrencyFormat) -> tuple[pa.Array, int]:
+    """Validating path for chunks with decimals, blanks, signs or garbage."""
+
+    values = pc.utf8_trim(values, CURRENCY_SPACE)
+    if fmt.decimal != ".":
+        values = pc.replace_substring(values, fmt.decimal, ".")
+    negative = pc.starts_with(values, "-")
+    # ``-$1.000``: the symbol may follow the sign.
+    magnitude = pc.utf8_trim(
+        pc.if_else(negative, pc.utf8_slice_codeunits(values, 1), values),
+        CURRENCY_SPACE,
+    )
+    if pc.any(pc.starts_with(magnitude, fmt.symbol)).as_py():
+        magnitude = pc.if_else(
+            pc.starts_with(magnitude, fmt.symbol),
+            pc.utf8_trim(pc.utf8_slice_codeunits(magnitude, len(fmt.symbol)), CURRENCY_SPACE),
+            magnitude,
+        )
+    digits = pc.replace_substring(magnitude, ".", "", max_replacements=1)
+    blank = pc.equal(values, "")
+    magnitude = pc.if_else(pc.ascii_is_decimal(digits), magnitude, pa.scalar(None, magnitude.type))
+    amounts = pc.round(pc.cast(magnitude, pa.float64()), round_mode="half_towards_infinity")
+    amounts = pc.if_else(pc.less(amounts, MAX_AMOUNT), amounts, pa.scalar(None, pa.float64()))
+    rejected = pc.sum(pc.and_(pc.is_null(amounts), pc.invert(blank))).as_py() or 0
+
+    amounts = pc.cast(amounts, pa.int64())
+    return pc.if_else(negative, pc.negate(amounts), amounts), rejected
+
+
+def infer_boolean_columns(columns: Iterable[str]) -> list[str]:
+    """Columns whose name carries one of :data:`BOOLEAN_COLUMN_TOKENS`."""
+
+    return [col for col in columns if any(token in col.lower() for token in BOOLEAN_COLUMN_TOKENS)]
+
+
+def map_booleans(series: pd.Series, lookup: Mapping[str, bool]) -> tuple[pd.Series, int]:
+    """Map a text column to ``boolean`` through one lookup per distinct value.
+
+    Values are matched case-insensitively after trimming. Missing cells stay
+    ``NA``; present values absent from ``lookup`` also become ``NA`` and are
+    counted in the returned total.
+    """
+
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    mapped = [lookup.get(str(value).strip().lower()) for value in uniques]
+    known = np.array([value is not None for value in mapped], dtype=bool)
+    truth = np.array([bool(value) for value in mapped], dtype=bool)
+
+    present = codes >= 0
+    safe_codes = np.where(present, codes, 0)
+    if len(uniques):
+        values = truth[safe_codes] & present
+        mask = ~(known[safe_codes] & present)
+    else:
+        values = np.zeros(len(codes), dtype=bool)
+        mask = np.ones(len(codes), dtype=bool)
+    unmapped = int(np.count_nonzero(mask & present))
+    result = pd.Series(
+        pd.arrays.BooleanArray(values, mask), index=series.index, name=series.name
+    )
+    return result, unmapped
+
+
+def detect_date_format(series: pd.Series, sample_size: int = DATE_SAMPLE_SIZE) -> Optional[str]:
+    """Format of :data:`DATE_FORMATS` matching most sampled non-blank values.
+
+    Ties go to the earlier format; ``None`` if no format matches any value.
+    """
+
+    sample = series.dropna()
+    sample = sample[sample.astype(str).str.strip() != ""].head(sample_size)
+    best, best_hits = None, 0
+    for fmt in DATE_FORMATS:
+        hits = int(pd.to_datetime(sample, format=fmt, exact=True, errors="coerce").notna().sum())
+        if hits > best_hits:
+            best, best_hits = fmt, hits
+        if best_hits == len(sample):
+            break
+    return best
+
+
+def parse_dates(series: pd.Series, fmt: Optional[str]) -> tuple[pd.Series, int]:
+    """Parse each distinct value once: ``fmt``, then :data:`DATE_FORMATS`, then ISO 8601.
+
+    Values off ``fmt`` (``1993-01-01`` next to ``1993-01-01 0:00:00``) are
+    retried against the known day-first layouts in order, as the DuckDB engine
+    does, so ``05/06/2020`` is always 5 June. Whatever is left is tried as
+    ISO 8601 (a trailing ``Z``, offsets) and then element-wise, day-first
+    unless the value starts with the year; all of it is converted to UTC wall
+    time. Non-blank values that still fail become ``NaT`` and are counted.
+    """
+
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    values = pd.Series(uniques, dtype=object)
+    if fmt is None:
+        parsed = pd.Series(np.full(len(values), np.datetime64("NaT"), dtype=_DATE_DTYPE))
+    else:
+        parsed = pd.to_datetime(values, format=fmt, errors="coerce", utc=False)
+        if parsed.dt.tz is not None:
+            parsed = parsed.dt.tz_convert(None)
+        parsed = parsed.astype(_DATE_DTYPE)
+    missing = parsed.isna()
+    for layout in DATE_FORMATS:
+        if not missing.any():
+            break
+        if layout == fmt:
+            continue
+        recovered = pd.to_datetime(values[missing], format=layout, exact=True, errors="coerce")
+        parsed[missing] = recovered.astype(_DATE_DTYPE)
+        missing = parsed.isna()
+    failed_values = np.zeros(len(values), dtype=bool)
+    if missing.any():
+        rest = values[missing]
+        recovered = pd.to_datetime(rest, format="ISO8601", errors="coerce", utc=True)
+        # Anything else is read element-wise, day-first unless it leads with the year.
+        year_first = rest.astype(str).str.match(r"\s*\d{4}").to_numpy()
+        for dayfirst, subset in ((False, year_first), (True, ~year_first)):
+            subset = subset & recovered.isna().to_numpy()
+            if subset.any():
+                recovered[subset] = pd.to_datetime(
+                    rest[subset], format="mixed", dayfirst=dayfirst, errors="coerce", utc=True
+                )
+        parsed[missing] = recovered.dt.tz_localize(None).astype(_DATE_DTYPE)
+        blank = rest.astype(str).str.strip() == ""
+        failed_values[missing.to_numpy()] = (recovered.isna() & ~blank).to_numpy()
+
+    dates = parsed.to_numpy()
+    present = codes >= 0
+    result = np.full(len(codes), np.datetime64("NaT"), dtype=_DATE_DTYPE)
+    result[present] = dates[codes[present]]
+    failed = int(np.bincount(codes[present], minlength=len(values))[failed_values].sum())
+    return pd.Series(result, index=series.index, name=series.name), failed
+
+
+def derive_columns(frame: pd.DataFrame, options: DerivedColumns) -> pd.DataFrame:
+    """Add ``Region_Normalizada``, ``es_los_rios`` and ``anio_dt`` in place."""
+
+    if not options.enabled:
+        return frame
+    if options.region_column in frame:
+        frame["Region_Normalizada"] = normalize_regions(frame[options.region_column])
+        frame["es_los_rios"] = frame["Region_Normalizada"].eq(options.target_region)
+    if options.year_column in frame:
+        year = pd.to_numeric(frame[options.year_column], errors="coerce").astype("Int64")
+        frame[options.year_column] = year
+        frame["anio_dt"] = pd.to_datetime(year, format="%Y", errors="coerce")
+    return frame
+
 
 class DataTransformer(Protocol):
     """Callable transforming DataFrame chunks."""
@@ -19,22 +269,190 @@ class DataTransformer(Protocol):
         ...
 
 
-class ProjectTransformer(DataTransformer):
-    """Domain-specific transformer encapsulating business rules."""
+@dataclass(frozen=True)
+class TransformPlan:
+    """Columns each ``ProjectTransformer`` step rewrites, resolved for one chunk schema.
+
+    ``date_formats`` holds the declared or detected format of each date column
+    known so far; columns without one are parsed through the fallbacks.
+    """
+
+    columns: tuple[str, ...]
+    text: tuple[str, ...]
+    currency: tuple[str, ...]
+    booleans: tuple[str, ...]
+    dates: tuple[str, ...]
+    date_formats: Mapping[str, Optional[str]] = field(default_factory=dict)
+
+
+@dataclass
+class TransformIssues:
+    """Present values each step could not convert and set to NA, per column."""
+
+    rejected_currency: dict[str, int] = field(default_factory=dict)
+    unmapped_booleans: dict[str, int] = field(default_factory=dict)
+    unparsed_dates: dict[str, int] = field(default_factory=dict)
+
+    def merge(self, other: "TransformIssues") -> None:
+        for item in fields(self):
+            totals = getattr(self, item.name)
+            for column, count in getattr(other, item.name).items():
+                totals[column] = totals.get(column, 0) + count
+
+    def as_dict(self) -> dict[str, dict[str, int]]:
+        """Non-empty counters by name, for summaries and run reports."""
+
+        counters = {item.name: getattr(self, item.name) for item in fields(self)}
+        return {name: dict(counts) for name, counts in counters.items() if counts}
+
+
+@runtime_checkable
+class PlannedTransformer(DataTransformer, Protocol):
+    """Transformer split so workers only run the side-effect free part.
+
+    ``prepare`` runs in the pipeline's thread and resolves everything stateful
+    (plan compilation, date format detection); ``apply`` is a pure function of
+    the chunk and the plan, safe in threads or pickled to processes; its
+    issues are handed back to ``record``. Detected date formats can be read
+    and restored, so a resumed run parses like the one it continues.
+    """
+
+    def prepare(self, frame: pd.DataFrame) -> TransformPlan:
+        ...
+
+    def apply(self, frame: pd.DataFrame, plan: TransformPlan) -> tuple[pd.DataFrame, TransformIssues]:
+        ...
+
+    def record(self, issues: TransformIssues) -> None:
+        ...
+
+    @property
+    def date_formats(self) -> dict[str, Optional[str]]:
+        ...
+
+    def restore_date_formats(self, formats: Mapping[str, Optional[str]]) -> None:
+        ...
+
+
+class ProjectTransformer(PlannedTransformer):
+    """Domain-specific transformer encapsulating business rules.
+
+    Which columns each step touches is compiled into a :class:`TransformPlan`
+    once per distinct chunk schema (normally once per run), so chunks only pay
+    for the columns they rewrite. Chunks are never mutated: each step assigns
+    its outputs to a shallow copy, so untouched columns are shared, not copied.
+    Date formats left to detection are detected by ``prepare`` on the first
+    chunk with values and frozen into the plan, so concurrent workers all
+    parse with the same one.
+    """
 
     def __init__(self, settings: EtlSettings) -> None:
         self._settings = settings
+        self.issues = TransformIssues()
+        self._boolean_lookup = settings.boolean_mappings.lookup()
+        self._plans: dict[tuple[str, ...], TransformPlan] = {}
+        self._date_formats: dict[str, Optional[str]] = {
+            column: fmt for column, fmt in settings.date_columns.items() if fmt
+        }
+
+    @property
+    def rejected_currency(self) -> dict[str, int]:
+        return self.issues.rejected_currency
+
+    @property
+    def unmapped_booleans(self) -> dict[str, int]:
+        return self.issues.unmapped_booleans
+
+    @property
+    def unparsed_dates(self) -> dict[str, int]:
+        return self.issues.unparsed_dates
+
+    @property
+    def date_formats(self) -> dict[str, Optional[str]]:
+        """Declared and detected date formats; ``None`` when detection found none."""
+
+        return dict(self._date_formats)
+
+    def restore_date_formats(self, formats: Mapping[str, Optional[str]]) -> None:
+        """Reuse formats detected by an earlier run of the same input."""
+
+        self._date_formats.update(formats)
+
+    def compile(self, columns: Iterable[str]) -> TransformPlan:
+        """Plan for chunks with ``columns``; built and validated once per schema."""
+
+        schema = tuple(columns)
+        plan = self._plans.get(schema)
+        if plan is None:
+            plan = self._plans[schema] = self._build_plan(schema)
+        return plan
+
+    def prepare(self, frame: pd.DataFrame) -> TransformPlan:
+        """Plan for ``frame``, detecting the formats of date columns seen with values for the first time."""
+
+        plan = self.compile(frame.columns)
+        for column in plan.dates:
+            if column not in self._date_formats and frame[column].notna().any():
+                fmt = self._date_formats[column] = detect_date_format(frame[column])
+                if fmt is None:
+                    _LOGGER.warning("Date column %s: no fixed format matched, parsing element-wise", column)
+        known = self._date_formats
+        formats = {column: known[column] for column in plan.dates if column in known}
+        if formats != plan.date_formats:
+            plan = self._plans[plan.columns] = replace(plan, date_formats=formats)
+        return plan
+
+    def _build_plan(self, columns: tuple[str, ...]) -> TransformPlan:
+        present = set(columns)
+        for kind, configured in (
+            ("Currency", self._settings.currency_columns),
+            ("Date", self._settings.date_columns),
+        ):
+            for column in configured:
+                if column not in present:
+                    _LOGGER.warning("%s column %s missing in input", kind, column)
+        return TransformPlan(
+            columns=columns,
+            text=tuple(self._settings.text_cleaning.select(columns)),
+            currency=tuple(column for column in self._settings.currency_columns if column in present),
+            booleans=tuple(infer_boolean_columns(columns)),
+            dates=tuple(column for column in self._settings.date_columns if column in present),
+        )
 
     def transform(self, frame: pd.DataFrame) -> pd.DataFrame:
-        current = frame.copy()
-        current = self._standardize_columns(current)
-        current = self._clean_currency_fields(current)
-        current = self._normalize_boolean_fields(current)
-        current = self._parse_dates(current)
-        return current
+        transformed, issues = self.apply(frame, self.prepare(frame))
+        self.record(issues)
+        return transformed
+
+    def apply(self, frame: pd.DataFrame, plan: TransformPlan) -> tuple[pd.DataFrame, TransformIssues]:
+        """Run every step of ``plan`` on ``frame``; touches no transformer state."""
 
-    def _standardize_columns(self, frame: pd.DataFrame) -> pd.DataFrame:
-        return frame.apply(lambda col: col.map(self._clean_text))
+        issues = TransformIssues()
+        current = frame.copy(deep=False)
+        for step in (
+            self._standardize_columns,
+            self._clean_currency_fields,
+            self._normalize_boolean_fields,
+            self._parse_dates,
+            self._derive_columns,
+        ):
+            with stage(f"transform.{step.__name__.lstrip('_')}", len(current)):
+                current = step(current, plan, issues)
+        return current, issues
+
+    def record(self, issues: TransformIssues) -> None:
+        self.issues.merge(issues)
+
+    def _standardize_columns(
+        self, frame: pd.DataFrame, plan: TransformPlan, issues: TransformIssues
+    ) -> pd.DataFrame:
+        python = self._settings.text_cleaning.engine == "python"
+        for column in plan.text:
+            series = frame[column]
+            cleaned = series.map(self._clean_text) if python else normalize_whitespace(series)
+            if cleaned is not series:
+                frame[column] = cleaned
+        return frame
 
     @staticmethod
     def _clean_text(value: object) -> object:
@@ -42,47 +460,252 @@ class ProjectTransformer(DataTransformer):
             return " ".join(value.strip().split())
         return value
 
-    def _clean_currency_fields(self, frame: pd.DataFrame) -> pd.DataFrame:
-        for column in self._settings.currency_columns:
-            if column not in frame:
-                _LOGGER.warning("Currency column %s missing in chunk", column)
-                continue
-            frame[column] = (
-                frame[column]
-                .astype(str)
-                .str.replace("$", "", regex=False)
-                .str.replace(".", "", regex=False)
-                .str.replace(",", "", regex=False)
-                .str.strip()
-            )
-            frame[column] = frame[column].replace("nan", pd.NA)
-            frame[column] = frame[column].astype("Int64")
+    def _clean_currency_fields(
+        self, frame: pd.DataFrame, plan: TransformPlan, issues: TransformIssues
+    ) -> pd.DataFrame:
+        for column in plan.currency:
+            frame[column], rejected = parse_currency(frame[column], self._settings.currency_format)
+            if rejected:
+                issues.rejected_currency[column] = rejected
+                _LOGGER.warning("Currency column %s: %s unparseable values set to NA", column, rejected)
         return frame
 
-    def _normalize_boolean_fields(self, frame: pd.DataFrame) -> pd.DataFrame:
-        affirmative = set(value.lower() for value in self._settings.boolean_mappings.affirmative)
-        negative = set(value.lower() for value in self._settings.boolean_mappings.negative)
+    def _normalize_boolean_fields(
+        self, frame: pd.DataFrame, plan: TransformPlan, issues: TransformIssues
+    ) -> pd.DataFrame:
+        for column in plan.booleans:
+            frame[column], unmapped = map_booleans(frame[column], self._boolean_lookup)
+            if unmapped:
+                issues.unmapped_booleans[column] = unmapped
+                _LOGGER.warning("Boolean column %s: %s unmapped values set to NA", column, unmapped)
+        return frame
 
-        bool_columns = self._infer_boolean_columns(frame.columns)
-        for column in bool_columns:
-            series = frame[column]
-            normalized = series.astype(str).str.lower().str.strip()
-            bool_series = pd.Series(pd.NA, index=series.index, dtype="boolean")
-            bool_series = bool_series.mask(normalized.isin(affirmative), True)
-            bool_series = bool_series.mask(normalized.isin(negative), False)
-            frame[column] = bool_series
+    def _parse_dates(
+        self, frame: pd.DataFrame, plan: TransformPlan, issues: TransformIssues
+    ) -> pd.DataFrame:
+        for column in plan.dates:
+            frame[column], failed = parse_dates(frame[column], plan.date_formats.get(column))
+            if failed:
+                issues.unparsed_dates[column] = failed
+                _LOGGER.warning("Date column %s: %s unparseable values set to NaT", column, failed)
         return frame
 
-    @staticmethod
-    def _infer_boolean_columns(columns: Iterable[str]) -> list[str]:
-        tokens = {"mujer", "sostenible", "economía circular", "ley rep", "criterio"}
-        return [col for col in columns if any(token in col.lower() for token in tokens)]
+    def _derive_columns(
+        self, frame: pd.DataFrame, plan: TransformPlan, issues: TransformIssues
+    ) -> pd.DataFrame:
+        return derive_columns(frame, self._settings.derived_columns)
+
+
+class CategoricalEncoder(DataTransformer):
+    """Encodes low-cardinality text columns as categoricals sharing one dictionary.
+
+    Columns are chosen on the first ``sample_rows`` rows (see
+    :class:`CategoricalEncoding`): :meth:`push` holds chunks back until the
+    sample is full and :meth:`drain` releases whatever is held at the end of
+    the input, so the choice does not depend on the chunk size. ``transform``
+    encodes right away, choosing on the first chunk if nothing was pushed.
+    Already categorical columns keep their category order. Later chunks reuse
+    the codes of known values and append new ones, so every chunk's categories
+    extend the previous chunk's and writers can emit them as dictionary deltas.
+    A column whose dictionary passes ``max_categories`` is dropped: it stays
+    text for the rest of the run, so dictionaries never grow without bound;
+    :meth:`concat` re-encodes it over the whole run, as the written files hold
+    it. ``memory`` holds the deep size of the encoded columns before and after.
+    """
+
+    def __init__(self, options: CategoricalEncoding) -> None:
+        self._options = options
+        self._columns: Optional[list[str]] = None
+        self._categories: dict[str, pd.Index] = {}
+        # pyarrow copies of ``_categories`` for arrow-backed string chunks.
+        self._dictionaries: dict[str, pa.Array] = {}
+        self._overflowed: set[str] = set()
+        self._held: list[pd.DataFrame] = []
+        self._held_rows = 0
+        self.memory: dict[str, dict[str, int]] = {}
+
+    @property
+    def columns(self) -> list[str]:
+        """Columns still encoded; overflowed ones are left out."""
+
+        return [column for column in self._columns or [] if column not in self._overflowed]
+
+    def push(self, frame: pd.DataFrame) -> list[pd.DataFrame]:
+        """Encoded chunks ready to write; none while the detection sample fills."""
+
+        if self._columns is not None:
+            return [self.transform(frame)]
+        self._held.append(frame)
+        self._held_rows += len(frame)
+        return self.drain() if self._held_rows >= self._options.sample_rows else []
+
+    def drain(self) -> list[pd.DataFrame]:
+        """Encode and release the chunks held for detection."""
 
-    def _parse_dates(self, frame: pd.DataFrame) -> pd.DataFrame:
-        for column in self._settings.date_columns:
+        held, self._held, self._held_rows = self._held, [], 0
+        if held and self._columns is None:
+            sample, rows = [], 0
+            for frame in held:
+                sample.append(frame.iloc[: self._options.sample_rows - rows])
+                rows += len(sample[-1])
+            self._choose(pd.concat(sample, ignore_index=True))
+        return [self.transform(frame) for frame in held]
+
+    def transform(self, frame: pd.DataFrame) -> pd.DataFrame:
+        if self._columns is None:
+            self._choose(frame)
+        encoded = frame.copy(deep=False)
+        for column in self.columns:
             if column not in frame:
-                _LOGGER.warning("Date column %s missing in chunk", column)
                 continue
-            parsed = pd.to_datetime(frame[column], errors="coerce", utc=False)
-            frame[column] = parsed
-        return frame
+            series = frame[column]
+            if column not in self._categories and not series.notna().any():
+                continue  # nothing to learn a category dtype from yet
+            encoded[column] = result = self._encode(column, series)
+            usage = self.memory.setdefault(column, {"before": 0, "after": 0})
+            usage["before"] += int(series.memory_usage(deep=True, index=False))
+            usage["after"] += int(result.memory_usage(deep=True, index=False))
+        return encoded
+
+    def align(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Give ``frame`` the final dictionaries, so encoded chunks concatenate as categoricals.
+
+        Columns that overflowed after ``frame`` was encoded are decoded back to text.
+        """
+
+        aligned = frame.copy(deep=False)
+        for column in frame.columns:
+            series = frame[column]
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                continue
+            if column in self._overflowed:
+                aligned[column] = _decoded(series)
+            elif column in self._categories and len(series.cat.categories) < len(self._categories[column]):
+                aligned[column] = series.cat.set_categories(self._categories[column])
+        return aligned
+
+    def concat(self, frames: Sequence[pd.DataFrame]) -> pd.DataFrame:
+        """Concatenate encoded chunks with the column types the written files have.
+
+        Overflowed columns are re-encoded over the whole run, with categories in
+        first-seen order like the dictionaries the writers accumulated.
+        """
+
+        result = pd.concat([self.align(frame) for frame in frames], ignore_index=True)
+        for column in sorted(self._overflowed & set(result.columns)):
+            values = result[column]
+            result[column] = pd.Categorical(values, categories=pd.unique(values.dropna()))
+        return result
+
+    def memory_report(self) -> dict[str, Any]:
+        """Bytes of the encoded columns before and after, in total and per column."""
+
+        return {
+            "bytes_before": sum(usage["before"] for usage in self.memory.values()),
+            "bytes_after": sum(usage["after"] for usage in self.memory.values()),
+            "columns": {column: dict(usage) for column, usage in self.memory.items()},
+        }
+
+    def _choose(self, sample: pd.DataFrame) -> None:
+        self._columns = self._detect(sample)
+        for column in self._columns:
+            if not isinstance(sample[column].dtype, pd.CategoricalDtype):
+                # Typed from the sample, so a chunk where the column is all-NA
+                # still gets a categorical of the right dtype.
+                dtype = sample[column].dropna().infer_objects().dtype
+                self._categories[column] = pd.Index([], dtype=dtype)
+        if self._columns:
+            _LOGGER.info("Encoding as categoricals: %s", ", ".join(self._columns))
+
+    def _detect(self, frame: pd.DataFrame) -> list[str]:
+        options = self._options
+        selected = []
+        for column in options.select(frame.columns):
+            series = frame[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                selected.append(column)
+                continue
+            if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+                continue
+            present = int(series.count())
+            distinct = series.nunique(dropna=True)
+            if present and distinct <= options.max_categories and distinct <= options.max_ratio * present:
+                selected.append(column)
+        return selected
+
+    def _encode(self, column: str, series: pd.Series) -> pd.Series:
+        if _is_arrow_string(series):
+            codes = self._arrow_codes(column, series)
+        else:
+            codes = self._pandas_codes(column, series)
+        if codes is None:  # passed ``max_categories`` with this chunk
+            return _decoded(series)
+        return pd.Series(
+            pd.Categorical.from_codes(codes, categories=self._categories[column], validate=False),
+            index=series.index,
+            name=series.name,
+        )
+
+    def _pandas_codes(self, column: str, series: pd.Series) -> Optional[np.ndarray]:
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes, uniques = series.cat.codes.to_numpy(), series.cat.categories
+        else:
+            codes, uniques = pd.factorize(series, use_na_sentinel=True)
+        categories = self._categories.get(column, uniques[:0])
+        positions = categories.get_indexer(uniques)
+        if (positions < 0).any() or column not in self._categories:
+            extended = self._extend(column, categories, uniques[positions < 0])
+            if extended is None:
+                return None
+            positions = extended.get_indexer(uniques)
+        return np.where(codes >= 0, positions[codes] if len(positions) else -1, -1)
+
+    def _arrow_codes(self, column: str, series: pd.Series) -> Optional[np.ndarray]:
+        """Codes looked up by pyarrow against the column's cached dictionary."""
+
+        values = series.array.__arrow_array__()
+        categories = self._categories.get(column, pd.Index([], dtype=series.dtype))
+        dictionary = self._dictionaries.get(column)
+        if dictionary is None:
+            dictionary = pa.array(categories, type=values.type, from_pandas=True)
+            if isinstance(dictionary, pa.ChunkedArray):  # arrow-backed categories
+                dictionary = dictionary.combine_chunks()
+            self._dictionaries[column] = dictionary
+        codes = pc.index_in(values, value_set=dictionary)
+        unseen = pc.and_(pc.is_null(codes), pc.is_valid(values))
+        if pc.any(unseen).as_py() or column not in self._categories:
+            new = pc.unique(pc.filter(values, unseen))
+            if self._extend(column, categories, pd.Index(new.to_pylist(), dtype=categories.dtype)) is None:
+                return None
+            dictionary = self._dictionaries[column] = pa.concat_arrays([dictionary, new])
+            codes = pc.index_in(values, value_set=dictionary)
+        return codes.fill_null(-1).to_numpy()
+
+    def _extend(self, column: str, categories: pd.Index, new: pd.Index) -> Optional[pd.Index]:
+        """Append ``new`` to the column's categories, or drop the column past ``max_categories``."""
+
+        if len(categories) + len(new) > self._options.max_categories:
+            self._overflowed.add(column)
+            self._categories.pop(column, None)
+            self._dictionaries.pop(column, None)
+            _LOGGER.warning(
+                "Categorical column %s passed %s categories; left as text for the rest of the run",
+                column,
+                self._options.max_categories,
+            )
+            return None
+        categories = self._categories[column] = categories.append(new)
+        self._dictionaries.pop(column, None)
+        return categories
+
+
+def _decoded(series: pd.Series) -> pd.Series:
+    """``series`` back in the dtype of its categories when it is categorical."""
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.astype(series.cat.categories.dtype)
+    return series
+
+
+def _is_arrow_string(series: pd.Series) -> bool:
+    return isinstance(series.dtype, pd.StringDtype) and series.dtype.storage == "pyarrow"
@@ -7,13 +7,70 @@ scripts and notebooks.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
 from pathlib import Path
 from typing import Union
 
+import plotly
 from plotly.graph_objects import Figure
 
 PathLike = Union[str, Path]
 
+MANIFEST_NAME = ".ncnvert-manifest.json"
+_MANIFEST_LOCK = threading.Lock()
+
+
+def figure_fingerprint(figure: Figure, **options: object) -> str:
+    """Content hash of ``figure`` plus every option that shapes the HTML."""
+
+    payload = json.dumps(
+        {"plotly": plotly.__version__, "options": options},
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha256(payload.encode("utf-8"))
+    digest.update(figure.to_json().encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _content_hash(path: Path) -> str:
+    """SHA-256 of the file at ``path``, empty if it cannot be read."""
+
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def _write_atomically(path: Path, text: str) -> None:
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        temporary.write_text(text, encoding="utf-8")
+        os.replace(temporary, path)
+    finally:
+        temporary.unlink(missing_ok=True)
+
+
+def _read_manifest(directory: Path) -> dict[str, dict[str, str]]:
+    path = directory / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _record_fingerprint(output_path: Path, fingerprint: str, html: str) -> None:
+    entry = {"figure": fingerprint, "html": hashlib.sha256(html.encode("utf-8")).hexdigest()}
+    with _MANIFEST_LOCK:
+        manifest = _read_manifest(output_path.parent)
+        manifest[output_path.name] = entry
+        _write_atomically(output_path.parent / MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True))
+
 
 def figure_to_html(
     figure: Figure,
@@ -23,6 +80,7 @@ def figure_to_html(
     include_plotlyjs: str | bool = "cdn",
     full_html: bool = True,
     auto_open: bool = False,
+    skip_unchanged: bool = True,
 ) -> Path:
     """Persist ``figure`` as an HTML document at ``output_path``.
 
@@ -43,11 +101,36 @@ def figure_to_html(
         makes the output easier to embed inside static hosting setups.
     auto_open:
         Open the generated file in the default browser when ``True``.
+    skip_unchanged:
+        Hash the figure JSON together with the export options and, when it
+        matches the entry recorded in the sidecar ``.ncnvert-manifest.json`` of
+        the output directory and the file on disk still hashes to the HTML
+        written then, skip serializing and writing. Unchanged figures therefore
+        keep their bytes and their mtime; deleted or edited files are rewritten.
     """
 
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    fingerprint = ""
+    if skip_unchanged:
+        fingerprint = figure_fingerprint(
+            figure,
+            title=title,
+            include_plotlyjs=include_plotlyjs,
+            full_html=full_html,
+        )
+        with _MANIFEST_LOCK:
+            cached = _read_manifest(output_path.parent).get(output_path.name)
+        if (
+            isinstance(cached, dict)
+            and cached.get("figure") == fingerprint
+            and cached.get("html") == _content_hash(output_path)
+        ):
+            if auto_open:
+                _open_in_browser(output_path)
+            return output_path
+
     html = figure.to_html(
         include_plotlyjs=include_plotlyjs,
         full_html=full_html,
@@ -59,11 +142,17 @@ def figure_to_html(
             "<title>Plotly Figure</title>", f"<title>{title}</title>", 1
         )
 
-    output_path.write_text(html, encoding="utf-8")
+    _write_atomically(output_path, html)
+    if fingerprint:
+        _record_fingerprint(output_path, fingerprint, html)
 
     if auto_open:
-        import webbrowser  # Local import to avoid importing when unused.
-
-        webbrowser.open(output_path.as_uri())
+        _open_in_browser(output_path)
 
     return output_path
+
+
+def _open_in_browser(output_path: Path) -> None:
+    import webbrowser  # Local import to avoid importing when unused.
+
+    webbrowser.open(output_path.as_uri())
@@ -0,0 +1,169 @@
+"""Chunk checkpoints that let an interrupted ETL run resume where it stopped."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.etl.extract import SOURCE_FILE_ATTR, DataExtractor
+from src.etl.transform import TransformIssues
+
+_LOGGER = logging.getLogger(__name__)
+
+CHECKPOINT_DIR_NAME = "checkpoint"
+MANIFEST_NAME = "manifest.jsonl"
+
+
+def input_signature(paths: Sequence[Path]) -> dict[str, list[int]]:
+    """Size and modification time of every raw file, to spot changed input."""
+
+    signature = {}
+    for path in paths:
+        stat = path.stat()
+        signature[str(path)] = [stat.st_size, stat.st_mtime_ns]
+    return signature
+
+
+class ChunkCheckpoint:
+    """Transformed chunks persisted as Parquet files plus an extractor offset manifest.
+
+    The manifest is a JSON-lines file: a header with the ETL settings hash and
+    the raw input signature, then one line per chunk with its file, the raw
+    row offset where it starts, its row count, the transformer issues it
+    produced and the date formats in use. Chunk files are renamed into
+    place before their line is appended, so a run killed at any point leaves a
+    consistent prefix; a torn last line is ignored on resume. Offsets count
+    transformed rows, which match raw rows since transformers keep every row.
+    """
+
+    def __init__(self, directory: Path, settings_hash: str, inputs: dict[str, list[int]]) -> None:
+        self.directory = directory
+        self._header = {"settings_hash": settings_hash, "inputs": inputs}
+        self._chunks: list[dict[str, Any]] = []
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.directory / MANIFEST_NAME
+
+    @property
+    def offset(self) -> int:
+        """Raw rows already transformed and checkpointed."""
+
+        return sum(entry["rows"] for entry in self._chunks)
+
+    @property
+    def date_formats(self) -> dict[str, Optional[str]]:
+        """Date formats the checkpointed chunks were parsed with."""
+
+        return dict(self._chunks[-1].get("date_formats", {})) if self._chunks else {}
+
+    def start(self, resume: bool) -> int:
+        """Reload the previous checkpoint when ``resume`` and it still applies.
+
+        Otherwise the directory is cleared and a new manifest begun. Returns the
+        number of checkpointed chunks.
+        """
+
+        if resume:
+            chunks = self._read_manifest()
+            if chunks is not None:
+                # Rewritten so a torn entry does not sit before the new ones.
+                self._write_manifest(chunks)
+                return len(chunks)
+        self.clear()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._write_manifest([])
+        return 0
+
+    def completed(self) -> Iterator[tuple[pd.DataFrame, TransformIssues]]:
+        """The checkpointed chunks with their issues, in extractor order."""
+
+        for entry in self._chunks:
+            frame = pq.read_table(self.directory / entry["file"]).to_pandas()
+            if entry.get("source") is not None:
+                frame.attrs[SOURCE_FILE_ATTR] = entry["source"]
+            yield frame, TransformIssues(**entry.get("issues", {}))
+
+    def save(
+        self,
+        frame: pd.DataFrame,
+        issues: Optional[TransformIssues] = None,
+        date_formats: Optional[Mapping[str, Optional[str]]] = None,
+    ) -> None:
+        """Persist one transformed chunk, then record it in the manifest."""
+
+        offset = self.offset
+        name = f"chunk-{len(self._chunks):06d}.parquet"
+        partial = self.directory / f".{name}.tmp"
+        pq.write_table(pa.Table.from_pandas(frame, preserve_index=False), partial)
+        os.replace(partial, self.directory / name)
+        entry = {
+            "file": name,
+            "offset": offset,
+            "rows": len(frame),
+            "source": frame.attrs.get(SOURCE_FILE_ATTR),
+            "issues": issues.as_dict() if issues is not None else {},
+            "date_formats": dict(date_formats or {}),
+        }
+        with self.manifest_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+        self._chunks.append(entry)
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self._chunks = []
+
+    def _read_manifest(self) -> Optional[list[dict[str, Any]]]:
+        if not self.manifest_path.exists():
+            _LOGGER.warning("No checkpoint in %s; starting from the first chunk.", self.directory)
+            return None
+        entries = []
+        for line in self.manifest_path.read_text(encoding="utf-8").splitlines():
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:  # torn write of the last entry
+                break
+        if not entries or entries[0] != self._header:
+            _LOGGER.warning("Checkpoint was written for other settings or input; starting over.")
+            return None
+        chunks = []
+        for entry in entries[1:]:
+            if not (self.directory / entry["file"]).exists():
+                break
+            chunks.append(entry)
+        return chunks
+
+    def _write_manifest(self, chunks: list[dict[str, Any]]) -> None:
+        lines = [json.dumps(self._header), *(json.dumps(entry) for entry in chunks)]
+        partial = self.manifest_path.with_name(f".{MANIFEST_NAME}.tmp")
+        partial.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        os.replace(partial, self.manifest_path)
+        self._chunks = chunks
+
+
+class SkipRows:
+    """Extractor wrapper dropping the first ``rows`` raw rows."""
+
+    def __init__(self, extractor: DataExtractor, rows: int) -> None:
+        self._extractor = extractor
+        self._rows = rows
+
+    def read(self) -> Iterator[pd.DataFrame]:
+        remaining = self._rows
+        for chunk in self._extractor.read():
+            if remaining >= len(chunk):
+                remaining -= len(chunk)
+                continue
+            if remaining:
+                chunk, remaining = chunk.iloc[remaining:], 0
+            yield chunk
@@ -0,0 +1,264 @@
+"""Out-of-core ETL engine running the ``ProjectTransformer`` rules inside DuckDB.
+
+The raw CSV files are scanned by DuckDB and cleaned by a single SQL query (text
+cleanup, currency, boolean and date columns), spilling to
+``paths.interim_dir`` when it exceeds ``etl.duckdb.memory_limit``. Results
+stream back as Arrow record batches of ``etl.chunk_size`` rows (regrouped to
+``etl.chunk_memory_mb`` when set), get the derived analysis columns in pandas
+and reach the usual loaders, so memory stays bounded by one chunk regardless of
+the input size.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterator, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+
+from src.core.config import CurrencyFormat, DerivedColumns, PipelineSettings
+from src.etl.extract import PANDAS_DEFAULT_NA_VALUES, ChunkSizer, arrow_string_dtype, rechunk_batches
+from src.etl.load import DataLoader
+from src.etl.transform import (
+    CURRENCY_SPACE,
+    DATE_FORMATS,
+    DATE_SAMPLE_SIZE,
+    MAX_AMOUNT,
+    WHITESPACE,
+    derive_columns,
+    detect_date_format,
+    infer_boolean_columns,
+)
+from src.pipelines.etl_pipeline import EtlPipeline
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover - optional engine
+    duckdb = None  # type: ignore[assignment]
+
+_LOGGER = logging.getLogger(__name__)
+
+SPILL_DIR_NAME = "duckdb_spill"
+
+
+def _literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _chars(characters: str) -> str:
+    """SQL expression for a string made of ``characters`` (control chars included)."""
+
+    return " || ".join(f"chr({ord(character)})" for character in characters)
+
+
+def _regex_class(characters: str) -> str:
+    return "[" + "".join(f"\\x{{{ord(character):x}}}" for character in characters) + "]"
+
+
+def clean_text_sql(expression: str) -> str:
+    """``normalize_whitespace``: collapse whitespace runs and trim, dirty cells only."""
+
+    dirty = _literal(_regex_class(WHITESPACE.replace(" ", "")) + "|  |^ | $")
+    run = _literal(_regex_class(WHITESPACE) + "+")
+    return (
+        f"CASE WHEN regexp_matches({expression}, {dirty}) "
+        f"THEN trim(regexp_replace({expression}, {run}, ' ', 'g')) ELSE {expression} END"
+    )
+
+
+def currency_text_sql(expression: str, fmt: CurrencyFormat) -> str:
+    """First ``parse_currency`` layer: drop symbol, spaces and thousands; ``.`` decimals."""
+
+    space = _chars(CURRENCY_SPACE)
+    symbol = _literal(fmt.symbol)
+    if len(fmt.symbol) == 1:
+        value = f"trim({expression}, {symbol} || {space})"
+    else:
+        value = f"trim(replace({expression}, {symbol}, ''), {space})"
+    value = f"trim(replace({value}, {_literal(fmt.thousands)}, ''), {space})"
+    return f"replace({value}, {_literal(fmt.decimal)}, '.')"
+
+
+def currency_sign_sql(expression: str, fmt: CurrencyFormat) -> str:
+    """Second layer: ``-$1000`` and ``- 1000`` become ``-1000``."""
+
+    space = _chars(CURRENCY_SPACE)
+    symbol = _literal(fmt.symbol)
+    magnitude = f"trim({expression}[2:], {space})"
+    unsigned = (
+        f"CASE WHEN starts_with({magnitude}, {symbol}) "
+        f"THEN trim({magnitude}[{len(fmt.symbol) + 1}:], {space}) ELSE {magnitude} END"
+    )
+    return f"CASE WHEN starts_with({expression}, '-') THEN '-' || {unsigned} ELSE {expression} END"
+
+
+def currency_value_sql(expression: str) -> str:
+    """Last layer: BIGINT pesos; integers cast exactly, fractions round half away from zero."""
+
+    rounded = f"round(CAST({expression} AS DOUBLE))"
+    return (
+        f"CASE WHEN regexp_full_match({expression}, '-?[0-9]+') "
+        f"THEN TRY_CAST({expression} AS BIGINT) "
+        f"WHEN regexp_full_match({expression}, '-?([0-9]+\\.[0-9]*|\\.[0-9]+)') "
+        f"AND abs({rounded}) < {MAX_AMOUNT!r} THEN CAST({rounded} AS BIGINT) END"
+    )
+
+
+def boolean_sql(expression: str, lookup: dict[str, bool]) -> str:
+    """``map_booleans``: case-insensitive match on the trimmed value, else ``NULL``."""
+
+    if not lookup:
+        return "CAST(NULL AS BOOLEAN)"
+    edges = _regex_class(WHITESPACE) + "+"
+    key = f"lower(regexp_replace({expression}, {_literal(f'^{edges}|{edges}$')}, '', 'g'))"
+    branches = " ".join(
+        f"WHEN {_literal(value)} THEN {'true' if truth else 'false'}" for value, truth in lookup.items()
+    )
+    return f"CASE {key} {branches} END"
+
+
+def date_sql(expression: str, fmt: Optional[str]) -> str:
+    """``parse_dates``: exact ``fmt`` first, then the known layouts and ISO 8601 in UTC."""
+
+    fallbacks = ", ".join(_literal(candidate) for candidate in DATE_FORMATS)
+    parts = [f"try_strptime({expression}, {_literal(fmt)})"] if fmt else []
+    parts += [
+        f"try_strptime({expression}, [{fallbacks}])",
+        f"CAST(TRY_CAST({expression} AS TIMESTAMPTZ) AS TIMESTAMP)",
+    ]
+    return f"coalesce({', '.join(parts)})"
+
+
+class DuckDbTransformQuery:
+    """Extractor yielding raw CSV chunks already cleaned by DuckDB."""
+
+    def __init__(self, settings: PipelineSettings) -> None:
+        if duckdb is None:
+            raise ImportError("etl.engine='duckdb' requires the duckdb package (pip install duckdb)")
+        self._raw_files = settings.paths.raw_files
+        self._spill_dir = settings.paths.interim_dir / SPILL_DIR_NAME
+        self._etl = settings.etl
+
+    def read(self) -> Iterator[pd.DataFrame]:
+        connection = self._connect()
+        try:
+            columns = self._columns(connection)
+            query = self.build_query(columns, self._date_formats(connection, columns))
+            reader = connection.execute(query).to_arrow_reader(self._etl.chunk_size)
+            sizer = ChunkSizer(self._etl.chunk_size, self._etl.chunk_memory_mb)
+            yield from rechunk_batches(reader, sizer, lambda table, offset: _to_pandas(table))
+        finally:
+            connection.close()
+
+    def build_query(self, columns: list[str], date_formats: dict[str, Optional[str]]) -> str:
+        """Chain of ``SELECT * REPLACE`` layers, so each intermediate is computed once."""
+
+        etl = self._etl
+        currency = [column for column in etl.currency_columns if column in columns]
+        booleans = [column for column in infer_boolean_columns(columns) if column not in currency]
+        dates = [column for column in date_formats if column not in currency and column not in booleans]
+        lookup = etl.boolean_mappings.lookup()
+
+        layers = [
+            {column: clean_text_sql(_identifier(column)) for column in etl.text_cleaning.select(columns)},
+            {column: currency_text_sql(_identifier(column), etl.currency_format) for column in currency},
+            {column: currency_sign_sql(_identifier(column), etl.currency_format) for column in currency},
+            {
+                **{column: currency_value_sql(_identifier(column)) for column in currency},
+                **{column: boolean_sql(_identifier(column), lookup) for column in booleans},
+                **{column: date_sql(_identifier(column), date_formats[column]) for column in dates},
+            },
+        ]
+        query = f"SELECT * FROM {self._scan()}"
+        for layer in layers:
+            if layer:
+                replaced = ", ".join(
+                    f"{expression} AS {_identifier(column)}" for column, expression in layer.items()
+                )
+                query = f"SELECT * REPLACE ({replaced}) FROM ({query})"
+        return query
+
+    def _connect(self) -> "duckdb.DuckDBPyConnection":
+        self._spill_dir.mkdir(parents=True, exist_ok=True)
+        connection = duckdb.connect()
+        connection.execute(f"SET temp_directory = {_literal(str(self._spill_dir))}")
+        connection.execute("SET TimeZone = 'UTC'")
+        if self._etl.duckdb.memory_limit:
+            connection.execute(f"SET memory_limit = {_literal(self._etl.duckdb.memory_limit)}")
+        if self._etl.duckdb.threads:
+            connection.execute(f"SET threads = {int(self._etl.duckdb.threads)}")
+        return connection
+
+    def _scan(self) -> str:
+        # Same missing-value tokens as ``CsvExtractor`` (a subset of pandas' defaults).
+        # Files are read in list order and decompressed by extension.
+        na_values = ", ".join(_literal(value) for value in PANDAS_DEFAULT_NA_VALUES)
+        files = ", ".join(_literal(str(path)) for path in self._raw_files)
+        source = self._etl.source_column
+        filename = f", filename = {_literal(source)}" if source else ""
+        return (
+            f"read_csv([{files}], header = true, all_varchar = true, "
+            f"quote = '\"', escape = '\"', nullstr = [{na_values}]{filename})"
+        )
+
+    def _columns(self, connection: "duckdb.DuckDBPyConnection") -> list[str]:
+        return [row[0] for row in connection.execute(f"DESCRIBE SELECT * FROM {self._scan()}").fetchall()]
+
+    def _date_formats(
+        self, connection: "duckdb.DuckDBPyConnection", columns: list[str]
+    ) -> dict[str, Optional[str]]:
+        formats: dict[str, Optional[str]] = {}
+        for column, fmt in self._etl.date_columns.items():
+            if column not in columns:
+                _LOGGER.warning("Date column %s missing in input", column)
+                continue
+            if fmt is None:
+                sample = connection.execute(
+                    f"SELECT {_identifier(column)} FROM {self._scan()} "
+                    f"WHERE {_identifier(column)} IS NOT NULL LIMIT {DATE_SAMPLE_SIZE}"
+                ).fetchall()
+                fmt = detect_date_format(pd.Series([row[0] for row in sample], dtype=object))
+            formats[column] = fmt
+        return formats
+
+
+class _DerivedColumnsTransformer:
+    """Adds the derived analysis columns to chunks DuckDB already cleaned."""
+
+    def __init__(self, options: DerivedColumns) -> None:
+        self._options = options
+
+    def transform(self, frame: pd.DataFrame) -> pd.DataFrame:
+        return derive_columns(frame, self._options)
+
+
+class DuckDbEtlPipeline(EtlPipeline):
+    """:class:`EtlPipeline` whose chunks come out of a DuckDB query.
+
+    Output matches the pandas engine; loaders, run summaries and metrics are
+    shared with it.
+    """
+
+    def __init__(self, settings: PipelineSettings, loader: DataLoader) -> None:
+        super().__init__(
+            settings,
+            DuckDbTransformQuery(settings),
+            _DerivedColumnsTransformer(settings.etl.derived_columns),
+            loader,
+        )
+
+
+def _to_pandas(batch: Union[pa.RecordBatch, pa.Table]) -> pd.DataFrame:
+    string_dtype = arrow_string_dtype()
+    mapping = {
+        pa.string(): string_dtype,
+        pa.large_string(): string_dtype,
+        pa.int64(): pd.Int64Dtype(),
+        pa.bool_(): pd.BooleanDtype(),
+    }
+    return batch.to_pandas(types_mapper=mapping.get)
@@ -3,20 +3,102 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Deque, Iterable, Iterator, Literal, Optional, Union, overload
 
 import pandas as pd
+import pyarrow as pa
 
 from src.core.config import PipelineSettings
-from src.etl.extract import DataExtractor
-from src.etl.load import DataLoader
-from src.etl.transform import DataTransformer
+from src.core.metrics import (
+    RunMetrics,
+    collecting,
+    tracing,
+    write_json_report,
+    write_prometheus_textfile,
+)
+from src.core.schema import conform_table
+from src.etl.extract import SOURCE_FILE_ATTR, DataExtractor
+from src.etl.load import DataLoader, unify_schema
+from src.etl.transform import (
+    CategoricalEncoder,
+    DataTransformer,
+    PlannedTransformer,
+    TransformIssues,
+    TransformPlan,
+)
+from src.pipelines.checkpoint import CHECKPOINT_DIR_NAME, ChunkCheckpoint, SkipRows, input_signature
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class RunSummary:
+    """Lightweight outcome of a run that did not materialize the dataset."""
+
+    rows: int = 0
+    chunks: int = 0
+    columns: list[str] = field(default_factory=list)
+    null_counts: dict[str, int] = field(default_factory=dict)
+    # Rows per raw file, for extractors that tag chunks with their source.
+    sources: dict[str, int] = field(default_factory=dict)
+    # Bytes of the categorical columns before and after encoding.
+    categoricals: dict[str, Any] = field(default_factory=dict)
+    # Values set to NA by the transformer, per counter and column.
+    issues: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def update(self, frame: pd.DataFrame) -> None:
+        self.rows += len(frame)
+        self.chunks += 1
+        source = frame.attrs.get(SOURCE_FILE_ATTR)
+        if source is not None:
+            self.sources[source] = self.sources.get(source, 0) + len(frame)
+        if not self.columns:
+            self.columns = [str(column) for column in frame.columns]
+        for column, count in frame.isna().sum().items():
+            self.null_counts[str(column)] = self.null_counts.get(str(column), 0) + int(count)
+
+
+_TransformResult = tuple[pd.DataFrame, Optional[TransformIssues], RunMetrics]
+
+
+def _transform_chunk(
+    transformer: DataTransformer, chunk: pd.DataFrame, plan: Optional[TransformPlan] = None
+) -> _TransformResult:
+    """Transform one chunk, returning the issues and step timings it produced.
+
+    Module-level so process workers can unpickle it. With a ``plan`` (from
+    ``PlannedTransformer.prepare`` in the parent) only the pure ``apply`` runs
+    here; issues and metrics travel back with the result instead of being
+    shared across threads or lost in a process's copy of the transformer.
+    """
+
+    metrics = RunMetrics()
+    issues = None
+    with collecting(metrics), metrics.stage("transform", len(chunk)):
+        if plan is None:
+            transformed = transformer.transform(chunk)
+        else:
+            transformed, issues = transformer.apply(chunk, plan)  # type: ignore[attr-defined]
+    return transformed, issues, metrics
+
+
 class EtlPipeline:
-    """Coordinates extract-transform-load dependencies."""
+    """Coordinates extract-transform-load dependencies.
+
+    Transformed chunks pass through a :class:`CategoricalEncoder` on the way
+    to the loader (unless ``etl.categoricals.enabled`` is off). It runs here,
+    in chunk order, rather than in the transform workers so each output gets
+    a single dictionary per column whatever the executor.
+
+    With ``etl.checkpoint`` every transformed chunk is also saved under
+    ``paths.interim_dir`` until the run succeeds. ``resume=True`` replays the
+    chunks a failed run checkpointed into the loader and only extracts and
+    transforms the rows after them.
+    """
 
     def __init__(
         self,
@@ -24,26 +106,288 @@ class EtlPipeline:
         extractor: DataExtractor,
         transformer: DataTransformer,
         loader: DataLoader,
+        resume: bool = False,
     ) -> None:
         self._settings = settings
         self._extractor = extractor
         self._transformer = transformer
         self._loader = loader
+        self._resume = resume
+        self._encoder: Optional[CategoricalEncoder] = None
+        self._issues = TransformIssues()
+        self.metrics = RunMetrics()
+
+    @overload
+    def run(self, *, materialize: Literal[True] = ..., return_arrow: Literal[False] = ...) -> pd.DataFrame:
+        ...
+
+    @overload
+    def run(self, *, materialize: Literal[False], return_arrow: Literal[False] = ...) -> RunSummary:
+        ...
+
+    @overload
+    def run(self, *, materialize: bool = ..., return_arrow: Literal[True]) -> pa.Table:
+        ...
+
+    def run(
+        self, *, materialize: bool = True, return_arrow: bool = False
+    ) -> Union[pd.DataFrame, RunSummary, pa.Table]:
+        """Stream every chunk into the loader.
+
+        With ``materialize=False`` transformed chunks are released as soon as
+        they are written and only a :class:`RunSummary` is returned, so memory
+        stays flat regardless of the input size. With ``return_arrow=True`` the
+        result is an Arrow table validated against ``PROCESSED_SCHEMA``, ready
+        for ``load_dataset_from_table`` without a disk round-trip.
+        """
 
-    def run(self) -> pd.DataFrame:
         self._settings.ensure_output_dirs()
+        self.metrics = RunMetrics()
+        self._issues = TransformIssues()
         frames: list[pd.DataFrame] = []
-        total_rows = 0
+        tables: list[pa.Table] = []
+        summary = RunSummary()
+        checkpoint = self._open_checkpoint()
 
-        for chunk in self._extractor.read():
-            transformed = self._transformer.transform(chunk)
-            frames.append(transformed)
-            total_rows += len(transformed)
+        with tracing(self._settings.metrics.tracemalloc), self._loading():
+            for transformed in self._written_chunks(self._checkpointed_chunks(checkpoint), summary):
+                if return_arrow:
+                    with self.metrics.stage("arrow", len(transformed)):
+                        tables.append(pa.Table.from_pandas(transformed, preserve_index=False))
+                elif materialize:
+                    frames.append(transformed)
+        if checkpoint is not None:
+            checkpoint.clear()
 
-        if not frames:
+        if not summary.chunks:
             raise ValueError("Extractor produced zero chunks; aborting load.")
 
-        final_frame = pd.concat(frames, ignore_index=True)
-        self._loader.save(final_frame)
-        _LOGGER.info("ETL completed: %s rows.", total_rows)
-        return final_frame
+        _LOGGER.info("ETL completed: %s rows.", summary.rows)
+        summary.issues = self._issues.as_dict()
+        self._log_categoricals(summary)
+        if len(summary.sources) > 1:
+            _LOGGER.info(
+                "Rows per file: %s",
+                ", ".join(f"{source}={rows}" for source, rows in summary.sources.items()),
+            )
+        result: Union[pd.DataFrame, RunSummary, pa.Table] = summary
+        if return_arrow:
+            with self.metrics.stage("arrow.validate", summary.rows):
+                schema = unify_schema(tables[0].schema)
+                result = conform_table(pa.concat_tables(table.cast(schema) for table in tables))
+        elif materialize:
+            if self._encoder is not None:
+                result = self._encoder.concat(frames)
+            else:
+                result = pd.concat(frames, ignore_index=True)
+        self._report_metrics(summary)
+        return result
+
+    @contextmanager
+    def _loading(self) -> Iterator[None]:
+        """Open the loader; close it on success, abort it if the block raises.
+
+        Each output starts a fresh categorical encoder. ``load`` times what the
+        pipeline spends in ``write_chunk``: with concurrent writes that is
+        handing the chunk over and waiting for the previous one, while the
+        writes themselves are reported by the loader as ``load.<format>``.
+        """
+
+        options = self._settings.etl.categoricals
+        self._encoder = CategoricalEncoder(options) if options.enabled else None
+        # Loaders time their own writes (``load.<format>``) into ``self.metrics``.
+        with collecting(self.metrics):
+            self._loader.open()
+            try:
+                yield
+            except BaseException:
+                self._loader.abort()
+                raise
+            with self.metrics.stage("load.close"):
+                try:
+                    self._loader.close()
+                except BaseException:
+                    # Loaders abort themselves on a failed close; this covers those that do not.
+                    self._loader.abort()
+                    raise
+
+    def _written_chunks(self, chunks: Iterable[pd.DataFrame], summary: RunSummary) -> Iterator[pd.DataFrame]:
+        """Encode and write ``chunks``, yielding each frame as written.
+
+        The encoder may hold the first chunks back until its detection sample
+        is full; they are written then, or once ``chunks`` is exhausted.
+        """
+
+        for chunk in chunks:
+            if self._encoder is None:
+                yield self._write_chunk(chunk, summary)
+                continue
+            with self.metrics.stage("transform.encode_categoricals", len(chunk)):
+                encoded = self._encoder.push(chunk)
+            for frame in encoded:
+                yield self._write_chunk(frame, summary)
+        if self._encoder is not None:
+            with self.metrics.stage("transform.encode_categoricals"):
+                encoded = self._encoder.drain()
+            for frame in encoded:
+                yield self._write_chunk(frame, summary)
+
+    def _write_chunk(self, frame: pd.DataFrame, summary: RunSummary) -> pd.DataFrame:
+        """Write one (already encoded) chunk; returns it."""
+
+        if self._encoder is not None:
+            summary.categoricals = self._encoder.memory_report()
+        with self.metrics.stage("load", len(frame)):
+            self._loader.write_chunk(frame)
+        summary.update(frame)
+        return frame
+
+    @staticmethod
+    def _log_categoricals(summary: RunSummary) -> None:
+        report = summary.categoricals
+        if report.get("columns"):
+            _LOGGER.info(
+                "Categorical encoding: %s columns, %.1f MB -> %.1f MB in memory.",
+                len(report["columns"]),
+                report["bytes_before"] / 2**20,
+                report["bytes_after"] / 2**20,
+            )
+
+    def _report_metrics(self, summary: RunSummary) -> None:
+        options = self._settings.metrics
+        if not options.enabled:
+            return
+        _LOGGER.info(
+            "Stage timings: %s",
+            ", ".join(f"{name}={stats.wall_seconds:.3f}s" for name, stats in self.metrics.stages.items()),
+        )
+        extra: dict[str, Any] = {"sources": summary.sources} if summary.sources else {}
+        if summary.categoricals:
+            extra["categoricals"] = summary.categoricals
+        if summary.issues:
+            extra["issues"] = summary.issues
+        report = self.metrics.report(rows=summary.rows, chunks=summary.chunks, **extra)
+        path = write_json_report(report, options.report_dir)
+        _LOGGER.info("Run report written to %s", path)
+        if options.prometheus_textfile is not None:
+            write_prometheus_textfile(report, options.prometheus_textfile)
+
+    def _open_checkpoint(self) -> Optional[ChunkCheckpoint]:
+        if not (self._settings.etl.checkpoint or self._resume):
+            return None
+        checkpoint = ChunkCheckpoint(
+            self._settings.paths.interim_dir / CHECKPOINT_DIR_NAME,
+            self._settings.etl.output_hash(),
+            input_signature(self._settings.paths.raw_files),
+        )
+        chunks = checkpoint.start(self._resume)
+        if chunks:
+            _LOGGER.info(
+                "Resuming from checkpoint: %s chunks (%s rows) already transformed.",
+                chunks,
+                checkpoint.offset,
+            )
+        return checkpoint
+
+    def _checkpointed_chunks(self, checkpoint: Optional[ChunkCheckpoint]) -> Iterator[pd.DataFrame]:
+        """Checkpointed chunks first, then the rest of the input, saving each one."""
+
+        if checkpoint is None:
+            yield from self._transformed_chunks()
+            return
+        planned = isinstance(self._transformer, PlannedTransformer)
+        if planned and checkpoint.date_formats:
+            # Parse the rest with the formats the failed run detected.
+            self._transformer.restore_date_formats(checkpoint.date_formats)  # type: ignore[union-attr]
+        replayed = iter(checkpoint.completed())
+        while True:
+            with self.metrics.stage("checkpoint.replay") as sample:
+                item = next(replayed, None)
+                sample.rows = 0 if item is None else len(item[0])
+            if item is None:
+                break
+            frame, issues = item
+            self._record(issues)
+            yield frame
+
+        original, self._extractor = self._extractor, SkipRows(self._extractor, checkpoint.offset)
+        try:
+            for transformed, issues in self._transformed_results():
+                with self.metrics.stage("checkpoint.write", len(transformed)):
+                    checkpoint.save(
+                        transformed,
+                        issues,
+                        self._transformer.date_formats if planned else {},  # type: ignore[union-attr]
+                    )
+                yield transformed
+        finally:
+            self._extractor = original
+
+    def _extracted_chunks(self) -> Iterator[pd.DataFrame]:
+        chunks = iter(self._extractor.read())
+        while True:
+            with self.metrics.stage("extract") as sample:
+                chunk = next(chunks, None)
+                sample.rows = 0 if chunk is None else len(chunk)
+            if chunk is None:
+                return
+            yield chunk
+
+    def _transformed_chunks(self) -> Iterator[pd.DataFrame]:
+        for transformed, _ in self._transformed_results():
+            yield transformed
+
+    def _transformed_results(self) -> Iterator[tuple[pd.DataFrame, TransformIssues]]:
+        """Transformed chunks in extractor order, each with the issues already recorded."""
+
+        workers = self._settings.etl.workers
+        if workers <= 1:
+            for chunk in self._extracted_chunks():
+                yield self._collect(_transform_chunk(self._transformer, chunk, self._prepare(chunk)))
+            return
+
+        _LOGGER.info(
+            "Transforming chunks with %s %s workers.", workers, self._settings.etl.executor
+        )
+        with self._build_executor(workers) as executor:
+            yield from self._transform_concurrently(executor, max_pending=2 * workers)
+
+    def _build_executor(self, workers: int) -> Executor:
+        if self._settings.etl.executor == "process":
+            return ProcessPoolExecutor(max_workers=workers)
+        return ThreadPoolExecutor(max_workers=workers)
+
+    def _transform_concurrently(
+        self, executor: Executor, max_pending: int
+    ) -> Iterator[tuple[pd.DataFrame, TransformIssues]]:
+        # Futures are drained FIFO, so output keeps the extractor order while at
+        # most ``max_pending`` chunks are held in memory at once.
+        pending: Deque[Future[_TransformResult]] = deque()
+        for chunk in self._extracted_chunks():
+            plan = self._prepare(chunk)
+            pending.append(executor.submit(_transform_chunk, self._transformer, chunk, plan))
+            if len(pending) >= max_pending:
+                yield self._collect(pending.popleft().result())
+        while pending:
+            yield self._collect(pending.popleft().result())
+
+    def _prepare(self, chunk: pd.DataFrame) -> Optional[TransformPlan]:
+        """Resolve the transformer's stateful part here, once, before any worker sees the chunk."""
+
+        if isinstance(self._transformer, PlannedTransformer):
+            return self._transformer.prepare(chunk)
+        return None
+
+    def _collect(self, result: _TransformResult) -> tuple[pd.DataFrame, TransformIssues]:
+        transformed, issues, metrics = result
+        self.metrics.merge(metrics)
+        if issues is None:
+            issues = TransformIssues()
+        else:
+            self._record(issues)
+        return transformed, issues
+
+    def _record(self, issues: TransformIssues) -> None:
+        self._issues.merge(issues)
+        if isinstance(self._transformer, PlannedTransformer):
+            self._transformer.record(issues)
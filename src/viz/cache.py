@@ -0,0 +1,110 @@
+"""Arrow IPC cache of frames returned by ``load_dataset``.
+
+Entries are uncompressed Feather (Arrow IPC) files under ``data/interim``,
+keyed by the processed file's fingerprint and the requested columns, so a new
+kernel or export script converts an already typed frame instead of re-reading
+and re-deriving the Parquet or CSV output. Entries of a source are replaced as soon
+as the source changes, and the least recently used ones are evicted once the
+cache exceeds ``max_bytes``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Sequence
+
+import pandas as pd
+import pyarrow.feather as feather
+
+from src.core.config import PROJECT_ROOT
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = PROJECT_ROOT / "data" / "interim" / "dataset_cache"
+DEFAULT_MAX_BYTES = 2 << 30
+SUFFIX = ".arrow"
+# Bump when the frames ``load_dataset`` builds change shape or types.
+_FORMAT_VERSION = "2"
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+class DatasetCache:
+    """LRU cache of loaded frames, bounded by total size on disk.
+
+    The fingerprint is the source's size and modification time, so a lookup
+    costs one ``stat``, mapping the entry and ``Table.to_pandas``. The mapping
+    avoids reading and decoding the file, but the conversion copies the
+    columns (categoricals, strings, nullable integers) into pandas blocks, so a
+    hit is proportional to the frame's size rather than constant.
+    """
+
+    def __init__(self, directory: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self._directory = directory
+        self._max_bytes = max_bytes
+
+    def get(self, source: Path, columns: Optional[Sequence[str]] = None) -> Optional[pd.DataFrame]:
+        entry = self._entry_path(source, columns)
+        try:
+            table = feather.read_table(entry, memory_map=True)
+        except FileNotFoundError:
+            return None
+        os.utime(entry)  # recency for LRU eviction; atime is unreliable (noatime)
+        return table.to_pandas()
+
+    def put(self, source: Path, columns: Optional[Sequence[str]], frame: pd.DataFrame) -> Path:
+        entry = self._entry_path(source, columns)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        current = self._version_prefix(source)
+        for stale in self._directory.glob(f"{self._source_key(source)}_*{SUFFIX}"):
+            if not stale.name.startswith(current):
+                stale.unlink(missing_ok=True)
+        temporary = entry.with_name(f".{entry.name}.{os.getpid()}.tmp")
+        # Uncompressed, so readers can map the buffers without decoding them.
+        feather.write_feather(frame, temporary, compression="uncompressed")
+        os.replace(temporary, entry)
+        self._evict(keep=entry)
+        return entry
+
+    def invalidate(self, source: Optional[Path] = None) -> int:
+        """Drop the entries of ``source``, or every entry; returns how many."""
+
+        pattern = f"{self._source_key(source)}_*{SUFFIX}" if source is not None else f"*{SUFFIX}"
+        removed = 0
+        for entry in self._directory.glob(pattern):
+            entry.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def size_bytes(self) -> int:
+        return sum(entry.stat().st_size for entry in self._directory.glob(f"*{SUFFIX}"))
+
+    def _entry_path(self, source: Path, columns: Optional[Sequence[str]]) -> Path:
+        selection = _digest("\x1f".join(columns) if columns is not None else "*")
+        return self._directory / f"{self._version_prefix(source)}{selection}{SUFFIX}"
+
+    def _version_prefix(self, source: Path) -> str:
+        stat = source.stat()
+        version = _digest(f"{_FORMAT_VERSION}:{stat.st_size}:{stat.st_mtime_ns}")
+        return f"{self._source_key(source)}_{version}_"
+
+    @staticmethod
+    def _source_key(source: Path) -> str:
+        return _digest(str(source.resolve()))
+
+    def _evict(self, keep: Path) -> None:
+        entries = sorted(self._directory.glob(f"*{SUFFIX}"), key=lambda entry: entry.stat().st_mtime)
+        total = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if total <= self._max_bytes:
+                break
+            if entry == keep:
+                continue
+            total -= entry.stat().st_size
+            entry.unlink(missing_ok=True)
+            _LOGGER.debug("Evicted %s from the dataset cache", entry.name)
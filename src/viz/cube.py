@@ -0,0 +1,127 @@
+"""Region x year aggregate cube backing every dashboard view.
+
+The cube is built in a single grouped pass over the project-level data and
+persisted next to the processed Parquet file, so charts and ad-hoc region
+queries slice a few hundred rows instead of rescanning every project.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from src.core.regions import as_region_categorical
+from src.core.schema import CURRENCY_COLUMNS
+
+REGION = "Region_Normalizada"
+YEAR = "anio_dt"
+KEYS = [REGION, YEAR]
+CUBE_CURRENCY_COLUMNS = CURRENCY_COLUMNS
+# Project-level columns needed to build the cube.
+CUBE_SOURCE_COLUMNS = [*KEYS, "Código Proyecto", *CUBE_CURRENCY_COLUMNS]
+
+
+def sum_column(column: str) -> str:
+    return f"{column}__sum"
+
+
+def count_column(column: str) -> str:
+    return f"{column}__count"
+
+
+def mean_column(column: str) -> str:
+    return f"{column}__mean"
+
+
+def cube_path_for(dataset_path: Path) -> Path:
+    """Location of the cube persisted next to ``dataset_path``."""
+
+    return dataset_path.with_name(f"{dataset_path.stem}_cube.parquet")
+
+
+def is_cube(frame: pd.DataFrame) -> bool:
+    return "filas" in frame and "Código Proyecto" not in frame
+
+
+def build_region_year_cube(frame: pd.DataFrame) -> pd.DataFrame:
+    """Counts, sums and means of every currency column per region and year.
+
+    ``filas`` counts rows, ``proyectos`` non-null project codes. Rows without a
+    year are kept under ``NaT`` so region totals still include them.
+    """
+
+    aggregations: dict[str, tuple[str, str]] = {
+        "filas": ("Código Proyecto", "size"),
+        "proyectos": ("Código Proyecto", "count"),
+    }
+    for column in CUBE_CURRENCY_COLUMNS:
+        if column in frame:
+            aggregations[sum_column(column)] = (column, "sum")
+            aggregations[count_column(column)] = (column, "count")
+            aggregations[mean_column(column)] = (column, "mean")
+
+    cube = (
+        frame.groupby(KEYS, observed=True, dropna=False)
+        .agg(**aggregations)
+        .reset_index()
+    )
+    cube = cube[cube[REGION].notna()].reset_index(drop=True)
+    cube[REGION] = as_region_categorical(cube[REGION])
+    return cube
+
+
+def save_cube(cube: pd.DataFrame, path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cube.to_parquet(path, index=False)
+    return path
+
+
+def load_cube(path: Path) -> pd.DataFrame:
+    cube = pd.read_parquet(path)
+    cube[REGION] = as_region_categorical(cube[REGION])
+    return cube
+
+
+def load_region_year_cube(dataset_path: Path, *, rebuild: bool = False) -> pd.DataFrame:
+    """Return the cube for the processed Parquet at ``dataset_path``.
+
+    The persisted cube is reused while it is newer than the dataset; otherwise
+    it is rebuilt from the few source columns it needs and saved again.
+    """
+
+    path = cube_path_for(dataset_path)
+    if not rebuild and path.exists() and path.stat().st_mtime >= dataset_path.stat().st_mtime:
+        return load_cube(path)
+
+    # Deferred: los_rios_data imports this module at load time.
+    from src.viz.los_rios_data import load_dataset
+
+    source = load_dataset(dataset_path, columns=_available_sources(dataset_path))
+    cube = build_region_year_cube(source)
+    save_cube(cube, path)
+    return cube
+
+
+def slice_cube(
+    cube: pd.DataFrame,
+    *,
+    regions: Optional[Iterable[str]] = None,
+    years: Optional[Iterable[int]] = None,
+) -> pd.DataFrame:
+    """Ad-hoc filter on the cube by normalized region and/or year."""
+
+    mask = pd.Series(True, index=cube.index)
+    if regions is not None:
+        mask &= cube[REGION].isin(list(regions))
+    if years is not None:
+        mask &= cube[YEAR].dt.year.isin([int(year) for year in years])
+    return cube[mask]
+
+
+def _available_sources(dataset_path: Path) -> list[str]:
+    names = set(pq.read_schema(dataset_path).names)
+    derived = {REGION, YEAR}
+    return [column for column in CUBE_SOURCE_COLUMNS if column in names or column in derived]
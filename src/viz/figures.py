@@ -0,0 +1,306 @@
+"""Plotly figure builders and the registry used to export the dashboard.
+
+Each :class:`FigureSpec` renders one page of ``docs/`` from a shared
+:class:`DashboardContext`, so the cube, the region summary and the color map
+are computed once no matter how many figures are exported.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pyarrow as pa
+
+from src.ncnvert import figure_to_html
+from src.viz.cube import CUBE_SOURCE_COLUMNS, build_region_year_cube
+from src.viz.los_rios_data import (
+    PALETTE,
+    SECONDARY_COLOR,
+    TARGET_REGION,
+    build_panel_finance,
+    build_region_color_map,
+    build_region_summary,
+    build_yearly_region_projects,
+    load_dataset_from_table,
+    load_region_year_cube,
+    select_top_regions,
+)
+
+
+def build_bar_figure(summary: pd.DataFrame) -> go.Figure:
+    bar_df = summary.copy()
+    bar_df["color"] = np.where(bar_df["es_los_rios"], PALETTE["los_rios"], PALETTE["otras"])
+
+    fig = go.Figure(
+        go.Bar(
+            x=bar_df["Region_Normalizada"],
+            y=bar_df["total_innova_mm"],
+            marker_color=bar_df["color"],
+            text=bar_df["total_innova_mm"].round(1),
+            textposition="outside",
+            hovertemplate=(
+                "Región: %{x}<br>Financiamiento: %{y:.1f} MM CLP<br>Proyectos: %{customdata}"
+            ),
+            customdata=bar_df["proyectos"],
+        )
+    )
+
+    los_rios_row = bar_df[bar_df["es_los_rios"]]
+    if not los_rios_row.empty:
+        row = los_rios_row.iloc[0]
+        fig.add_annotation(
+            x=row["Region_Normalizada"],
+            y=row["total_innova_mm"],
+            text="Región de Los Ríos",
+            showarrow=True,
+            arrowcolor=PALETTE["los_rios"],
+            arrowhead=2,
+            ay=-80,
+        )
+
+    fig.update_layout(
+        title="Financiamiento Innova por región (millones CLP)",
+        xaxis_title="Región",
+        yaxis_title="Financiamiento (MM CLP)",
+        xaxis_tickangle=-35,
+        bargap=0.25,
+        margin=dict(l=40, r=20, t=60, b=120),
+    )
+
+    return fig
+
+
+def build_line_chart(
+    yearly_projects: pd.DataFrame,
+    top_regions: list[str],
+    color_map: dict[str, str],
+) -> go.Figure:
+    fig = go.Figure()
+    for region in top_regions:
+        region_data = yearly_projects[yearly_projects["Region_Normalizada"] == region]
+        display_name = "Región de Los Ríos" if region == TARGET_REGION else region
+        fig.add_trace(
+            go.Scatter(
+                x=region_data["anio_dt"],
+                y=region_data["proyectos"],
+                mode="lines+markers" if region == TARGET_REGION else "lines",
+                name=display_name,
+                line=dict(
+                    color=color_map[region],
+                    width=4 if region == TARGET_REGION else 2,
+                    dash="solid" if region == TARGET_REGION else "dash",
+                ),
+                hovertemplate="Año %{x|%Y}<br>Proyectos %{y}<extra>"
+                + display_name
+                + "</extra>",
+            )
+        )
+
+    fig.update_layout(
+        title="Conteo de proyectos adjudicados por año (Top regiones)",
+        xaxis_title="Año",
+        yaxis_title="Número de proyectos",
+        legend_title="Región",
+    )
+    return fig
+
+
+def build_finance_figure(
+    panel_finance: pd.DataFrame,
+    top_regions: list[str],
+    color_map: dict[str, str],
+    metric_column: str,
+    title: str,
+    yaxis_title: str,
+    annotate_peak: bool = False,
+) -> go.Figure:
+    frame = panel_finance.dropna(subset=["anio_dt"]).copy()
+    fig = go.Figure()
+    for region in top_regions:
+        region_data = frame[frame["Region_Normalizada"] == region]
+        display_name = "Región de Los Ríos" if region == TARGET_REGION else region
+        fig.add_trace(
+            go.Scatter(
+                x=region_data["anio_dt"],
+                y=region_data[metric_column] / 1e6,
+                mode="lines+markers" if region == TARGET_REGION else "lines",
+                name=display_name,
+                line=dict(
+                    color=color_map[region],
+                    width=4 if region == TARGET_REGION else 2,
+                    dash="solid" if region == TARGET_REGION else "dash",
+                ),
+                hovertemplate="%{x|%Y}: %{y:.1f} MM<extra>"
+                + title
+                + " - "
+                + display_name
+                + "</extra>",
+            )
+        )
+
+    if annotate_peak:
+        los_rios_data = frame[frame["Region_Normalizada"] == TARGET_REGION]
+        if not los_rios_data.empty:
+            peak_row = los_rios_data.loc[los_rios_data[metric_column].idxmax()]
+            fig.add_annotation(
+                x=peak_row["anio_dt"],
+                y=peak_row[metric_column] / 1e6,
+                text=f"Pico Los Ríos: {peak_row['anio_dt'].year} ({peak_row[metric_column] / 1e6:.1f} MM)",
+                arrowhead=2,
+                arrowcolor=SECONDARY_COLOR,
+                ax=60,
+                ay=-60,
+                showarrow=True,
+            )
+
+    fig.update_layout(
+        title=title,
+        xaxis_title="Año",
+        yaxis_title=yaxis_title,
+        hovermode="x unified",
+        legend_title="Región",
+        height=400,
+    )
+
+    fig.update_xaxes(
+        rangeselector=dict(
+            buttons=[
+                dict(count=3, label="3y", step="year", stepmode="backward"),
+                dict(count=5, label="5y", step="year", stepmode="backward"),
+                dict(step="all", label="Todo"),
+            ]
+        ),
+        rangeslider=dict(visible=True),
+        type="date",
+    )
+    return fig
+
+
+@dataclass
+class DashboardContext:
+    """Lazily computed inputs shared by every figure of one export run."""
+
+    cube: pd.DataFrame
+
+    @classmethod
+    def from_dataset(cls, dataset_path: Path) -> "DashboardContext":
+        return cls(cube=load_region_year_cube(dataset_path))
+
+    @classmethod
+    def from_table(cls, table: pa.Table) -> "DashboardContext":
+        """Context for a table handed over in-process by the ETL."""
+
+        return cls(cube=build_region_year_cube(load_dataset_from_table(table, CUBE_SOURCE_COLUMNS)))
+
+    @cached_property
+    def summary(self) -> pd.DataFrame:
+        return build_region_summary(self.cube)
+
+    @cached_property
+    def top_regions(self) -> list[str]:
+        return select_top_regions(self.summary)
+
+    @cached_property
+    def color_map(self) -> dict[str, str]:
+        return build_region_color_map(self.top_regions)
+
+    @cached_property
+    def yearly_projects(self) -> pd.DataFrame:
+        return build_yearly_region_projects(self.cube, self.top_regions)
+
+    @cached_property
+    def panel_finance(self) -> pd.DataFrame:
+        return build_panel_finance(self.cube, self.top_regions)
+
+    def warm(self) -> "DashboardContext":
+        """Compute every shared input up front (before rendering in threads)."""
+
+        for name in ("summary", "top_regions", "color_map", "yearly_projects", "panel_finance"):
+            getattr(self, name)
+        return self
+
+
+@dataclass(frozen=True)
+class FigureSpec:
+    """How to build one figure and where to publish it."""
+
+    name: str
+    output_name: str
+    title: str
+    build: Callable[[DashboardContext], go.Figure]
+
+
+FIGURES: dict[str, FigureSpec] = {}
+
+
+def register_figure(spec: FigureSpec) -> FigureSpec:
+    if spec.name in FIGURES:
+        raise ValueError(f"Figure {spec.name!r} is already registered")
+    FIGURES[spec.name] = spec
+    return spec
+
+
+register_figure(
+    FigureSpec(
+        name="financiamiento_bar",
+        output_name="plotly_los_rios_financiamiento_bar.html",
+        title="Financiamiento Innova por región",
+        build=lambda context: build_bar_figure(context.summary),
+    )
+)
+register_figure(
+    FigureSpec(
+        name="proyectos_line",
+        output_name="plotly_los_rios_proyectos_line.html",
+        title="Conteo anual de proyectos",
+        build=lambda context: build_line_chart(
+            context.yearly_projects, context.top_regions, context.color_map
+        ),
+    )
+)
+register_figure(
+    FigureSpec(
+        name="financiamiento_innova",
+        output_name="plotly_los_rios_financiamiento_innova.html",
+        title="Financiamiento Innova por región",
+        build=lambda context: build_finance_figure(
+            context.panel_finance,
+            context.top_regions,
+            context.color_map,
+            metric_column="total_innova",
+            title="Financiamiento Innova (MM CLP)",
+            yaxis_title="Monto (MM CLP)",
+            annotate_peak=True,
+        ),
+    )
+)
+
+
+def render_figure(spec: FigureSpec, context: DashboardContext, output_dir: Path) -> Path:
+    return figure_to_html(spec.build(context), output_dir / spec.output_name, title=spec.title)
+
+
+def export_figures(
+    context: DashboardContext,
+    output_dir: Path,
+    *,
+    names: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+) -> list[Path]:
+    """Render the selected registered figures concurrently into ``output_dir``.
+
+    Shared inputs are computed before the pool starts so threads only build
+    and serialize figures. Paths are returned in registry order.
+    """
+
+    specs = [FIGURES[name] for name in (names if names is not None else FIGURES)]
+    context.warm()
+    with ThreadPoolExecutor(max_workers=workers or len(specs) or 1) as executor:
+        return list(executor.map(lambda spec: render_figure(spec, context, output_dir), specs))
@@ -2,12 +2,28 @@
 
 from __future__ import annotations
 
-import unicodedata
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from src.core.memory import downcast_integers
+from src.core.regions import as_region_categorical, normalize_regions
+from src.core.schema import CURRENCY_COLUMNS, conform_table
+from src.viz.cache import DatasetCache
+from src.viz.cube import (
+    build_region_year_cube,
+    count_column,
+    is_cube,
+    load_region_year_cube,
+    slice_cube,
+    sum_column,
+)
 
 TARGET_REGION = "Region De Los Rios"
 PALETTE = {
@@ -15,13 +31,22 @@ PALETTE = {
     "otras": "#9CA3AF",
 }
 SECONDARY_COLOR = "#1D4ED8"
-CURRENCY_COLUMNS = [
+DEFAULT_COLOR_SEQUENCE = px.colors.qualitative.G10
+# Columns the ETL materializes, mapped to the raw column they derive from.
+DERIVED_COLUMN_SOURCES = {
+    "Region_Normalizada": "Región",
+    "es_los_rios": "Región",
+    "anio_dt": "Año Adjudicación",
+}
+# Everything the dashboard builders read from the project-level data.
+DASHBOARD_COLUMNS = [
+    "Código Proyecto",
     "Financiamiento Innova",
     "Aprobado Privado",
-    "Aprobado Privado Pecuniario",
-    "Monto Certificado Ley",
+    "Region_Normalizada",
+    "anio_dt",
+    "es_los_rios",
 ]
-DEFAULT_COLOR_SEQUENCE = px.colors.qualitative.G10
 
 
 __all__ = [
@@ -30,7 +55,14 @@ __all__ = [
     "SECONDARY_COLOR",
     "CURRENCY_COLUMNS",
     "DEFAULT_COLOR_SEQUENCE",
+    "DASHBOARD_COLUMNS",
+    "DatasetCache",
     "load_dataset",
+    "load_dataset_from_table",
+    "load_partitioned_dataset",
+    "build_region_year_cube",
+    "load_region_year_cube",
+    "slice_cube",
     "build_region_summary",
     "select_top_regions",
     "build_region_color_map",
@@ -39,53 +71,164 @@ __all__ = [
 ]
 
 
-def normalize_region(name: str | float) -> str | float:
-    if pd.isna(name):
-        return name
-    ascii_name = (
-        unicodedata.normalize("NFKD", str(name))
-        .encode("ascii", "ignore")
-        .decode("utf-8")
-    )
-    return ascii_name.strip().title()
-
-
 def coerce_numeric(series: pd.Series) -> pd.Series:
     return pd.to_numeric(series, errors="coerce")
 
 
-def load_dataset(path: Path) -> pd.DataFrame:
+def load_dataset(
+    path: Path,
+    columns: Optional[Sequence[str]] = None,
+    *,
+    cache: Optional[DatasetCache] = None,
+) -> pd.DataFrame:
+    """Load the processed ETL output, preferably the typed Parquet file.
+
+    With ``columns`` only those columns are decoded. ``Region_Normalizada``,
+    ``anio_dt`` and ``es_los_rios`` come materialized from the ETL; they are
+    only recomputed for older outputs (or the CSV copy) that lack them.
+    Low-cardinality text columns arrive as categoricals from the ETL, and
+    integer columns are narrowed to the smallest type holding their values.
+    With a ``cache`` the finished frame is read back from it (mapped, then
+    converted to pandas) while ``path`` is unchanged.
+    """
+
     if not path.exists():
         raise FileNotFoundError(
             f"No se encontró {path}. Ejecuta el ETL antes de continuar."
         )
+    if cache is not None:
+        cached = cache.get(path, columns)
+        if cached is not None:
+            return cached
+
+    if path.suffix == ".parquet":
+        available = pq.read_schema(path).names
+        frame = pd.read_parquet(path, columns=_columns_to_read(columns, available))
+    else:
+        frame = pd.read_csv(path)
+        frame.columns = [col.strip() for col in frame.columns]
+
+    frame = _finish_frame(frame)
+    if columns is not None:
+        frame = frame[list(columns)]
+    if cache is not None:
+        cache.put(path, columns, frame)
+    return frame
+
+
+def load_dataset_from_table(table: pa.Table, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """In-process counterpart of :func:`load_dataset` for ``EtlPipeline.run(return_arrow=True)``.
+
+    ``table`` is validated against the declared processed schema unless it
+    already carries its version stamp, then converted without touching disk.
+    """
+
+    table = conform_table(table)
+    wanted = _columns_to_read(columns, table.column_names)
+    if wanted is not None:
+        table = table.select(wanted)
+    frame = _finish_frame(table.to_pandas())
+    if columns is not None:
+        frame = frame[list(columns)]
+    return frame
+
+
+def _columns_to_read(
+    columns: Optional[Sequence[str]], available: Sequence[str]
+) -> Optional[list[str]]:
+    if columns is None:
+        return None
+    wanted = [column for column in columns if column in available]
+    for column in columns:
+        source = DERIVED_COLUMN_SOURCES.get(column)
+        if column not in available and source is not None and source not in wanted:
+            wanted.append(source)
+    return wanted
+
+
+def _finish_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Derived columns completed, then integers narrowed (the whole frame is known here)."""
 
-    frame = pd.read_csv(path)
-    frame.columns = [col.strip() for col in frame.columns]
-    frame["Region_Normalizada"] = frame["Región"].map(normalize_region)
+    return downcast_integers(_complete_derived_columns(frame))
+
+
+def _complete_derived_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    if "Region_Normalizada" in frame:
+        frame["Region_Normalizada"] = as_region_categorical(frame["Region_Normalizada"])
+    elif "Región" in frame:
+        frame["Region_Normalizada"] = normalize_regions(frame["Región"])
 
     for column in CURRENCY_COLUMNS:
-        if column in frame:
+        if column in frame and not pd.api.types.is_numeric_dtype(frame[column]):
             frame[column] = coerce_numeric(frame[column])
 
-    frame["Año Adjudicación"] = pd.to_numeric(frame["Año Adjudicación"], errors="coerce")
-    frame["anio_dt"] = pd.to_datetime(
-        frame["Año Adjudicación"].astype("Int64"), format="%Y", errors="coerce"
-    )
-    frame["es_los_rios"] = frame["Region_Normalizada"].eq(TARGET_REGION)
+    if "Año Adjudicación" in frame and not pd.api.types.is_numeric_dtype(frame["Año Adjudicación"]):
+        frame["Año Adjudicación"] = pd.to_numeric(frame["Año Adjudicación"], errors="coerce")
+    if "anio_dt" in frame and not pd.api.types.is_datetime64_any_dtype(frame["anio_dt"]):
+        frame["anio_dt"] = pd.to_datetime(frame["anio_dt"], errors="coerce")
+    elif "anio_dt" not in frame and "Año Adjudicación" in frame:
+        frame["anio_dt"] = pd.to_datetime(
+            frame["Año Adjudicación"].astype("Int64"), format="%Y", errors="coerce"
+        )
+    if "es_los_rios" not in frame and "Region_Normalizada" in frame:
+        frame["es_los_rios"] = frame["Region_Normalizada"].eq(TARGET_REGION)
     return frame
 
 
-def build_region_summary(frame: pd.DataFrame) -> pd.DataFrame:
-    summary = (
-        frame.groupby("Region_Normalizada")
-        .agg(
-            total_innova=("Financiamiento Innova", "sum"),
-            proyectos=("Código Proyecto", "count"),
-            promedio_privado=("Aprobado Privado", "mean"),
+def load_partitioned_dataset(
+    path: Path,
+    *,
+    regions: Optional[Iterable[str]] = None,
+    years: Optional[Iterable[int]] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """Read the hive-partitioned ETL output pushing filters down to pyarrow.
+
+    ``regions`` (normalized names) and ``years`` prune whole partition
+    directories before any byte is read, and ``columns`` limits the Parquet
+    columns decoded. Derived columns are added when their inputs are present.
+    """
+
+    if not path.exists():
+        raise FileNotFoundError(
+            f"No se encontró {path}. Ejecuta el ETL antes de continuar."
         )
-        .reset_index()
+
+    dataset = ds.dataset(path, format="parquet", partitioning="hive")
+    predicate = None
+    if regions is not None:
+        predicate = ds.field("Region_Normalizada").isin(list(regions))
+    if years is not None:
+        year_filter = ds.field("Año Adjudicación").isin([int(year) for year in years])
+        predicate = year_filter if predicate is None else predicate & year_filter
+
+    table = dataset.to_table(
+        columns=list(columns) if columns is not None else None,
+        filter=predicate,
     )
+    return _finish_frame(table.to_pandas())
+
+
+def build_region_summary(frame: pd.DataFrame) -> pd.DataFrame:
+    """Totals per region; ``frame`` may be project-level data or the cube."""
+
+    cube = _as_cube(frame)
+    totals = cube.groupby("Region_Normalizada", observed=True)[
+        [
+            "proyectos",
+            sum_column("Financiamiento Innova"),
+            sum_column("Aprobado Privado"),
+            count_column("Aprobado Privado"),
+        ]
+    ].sum()
+    summary = pd.DataFrame(
+        {
+            "total_innova": totals[sum_column("Financiamiento Innova")],
+            "proyectos": totals["proyectos"],
+            "promedio_privado": totals[sum_column("Aprobado Privado")]
+            / totals[count_column("Aprobado Privado")].replace(0, np.nan),
+        }
+    ).reset_index()
     summary["es_los_rios"] = summary["Region_Normalizada"].eq(TARGET_REGION)
     summary = summary.sort_values("total_innova", ascending=False)
     summary["total_innova_mm"] = summary["total_innova"] / 1e6
@@ -121,21 +264,34 @@ def build_region_color_map(
 
 
 def build_yearly_region_projects(df: pd.DataFrame, regions: Sequence[str]) -> pd.DataFrame:
-    filtered = df[df["Region_Normalizada"].isin(regions)]
-    return (
-        filtered.groupby(["anio_dt", "Region_Normalizada"])
-        .size()
-        .reset_index(name="proyectos")
+    cube = _region_year_slice(df, regions)
+    return cube[["anio_dt", "Region_Normalizada", "filas"]].rename(
+        columns={"filas": "proyectos"}
     )
 
 
 def build_panel_finance(df: pd.DataFrame, regions: Sequence[str]) -> pd.DataFrame:
-    filtered = df[df["Region_Normalizada"].isin(regions)]
-    return (
-        filtered.groupby(["anio_dt", "Region_Normalizada"])
-        .agg(
-            total_innova=("Financiamiento Innova", "sum"),
-            aporte_privado=("Aprobado Privado", "sum"),
-        )
-        .reset_index()
+    cube = _region_year_slice(df, regions)
+    return cube[
+        [
+            "anio_dt",
+            "Region_Normalizada",
+            sum_column("Financiamiento Innova"),
+            sum_column("Aprobado Privado"),
+        ]
+    ].rename(
+        columns={
+            sum_column("Financiamiento Innova"): "total_innova",
+            sum_column("Aprobado Privado"): "aporte_privado",
+        }
     )
+
+
+def _as_cube(frame: pd.DataFrame) -> pd.DataFrame:
+    return frame if is_cube(frame) else build_region_year_cube(frame)
+
+
+def _region_year_slice(frame: pd.DataFrame, regions: Sequence[str]) -> pd.DataFrame:
+    cube = slice_cube(_as_cube(frame), regions=regions)
+    cube = cube[cube["anio_dt"].notna()]
+    return cube.sort_values(["anio_dt", "Region_Normalizada"]).reset_index(drop=True)
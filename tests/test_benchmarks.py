@@ -0,0 +1,111 @@
+"""pytest-benchmark suite over a synthetic CORFO export.
+
+Skipped unless pytest-benchmark is installed. Sizes come from
+``CORFO_BENCH_ROWS`` (comma separated, default ``10000``), e.g.::
+
+    CORFO_BENCH_ROWS=10000,100000,1000000 pytest tests/test_benchmarks.py \\
+        --benchmark-autosave --benchmark-compare
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.core.config import PROJECT_ROOT, PipelineSettings
+from src.etl.extract import CsvExtractor
+from src.etl.load import CsvParquetLoader
+from src.etl.synthetic import write_raw_csv
+from src.etl.transform import ProjectTransformer
+from src.viz.los_rios_data import (
+    build_panel_finance,
+    build_region_summary,
+    build_yearly_region_projects,
+    load_dataset,
+    select_top_regions,
+)
+
+SIZES = [int(value) for value in os.environ.get("CORFO_BENCH_ROWS", "10000").split(",")]
+ROUNDS = int(os.environ.get("CORFO_BENCH_ROUNDS", "3"))
+SETTINGS = PipelineSettings.from_yaml(PROJECT_ROOT / "config" / "settings.yaml")
+
+
+@dataclass
+class SyntheticRun:
+    rows: int
+    csv_path: Path
+    parquet_path: Path
+    raw: pd.DataFrame
+    transformed: pd.DataFrame
+    dataset: pd.DataFrame
+    regions: list[str]
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda rows: f"{rows}rows")
+def synthetic(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> SyntheticRun:
+    rows = request.param
+    directory = tmp_path_factory.mktemp(f"synthetic_{rows}")
+    csv_path = write_raw_csv(directory / "raw.csv", rows, seed=42)
+    raw = pd.concat(CsvExtractor(csv_path, chunk_size=SETTINGS.etl.chunk_size).read(), ignore_index=True)
+    transformed = ProjectTransformer(SETTINGS.etl).transform(raw)
+    parquet_path = directory / "processed.parquet"
+    CsvParquetLoader(directory / "processed.csv", parquet_path).save(transformed)
+    dataset = load_dataset(parquet_path)
+    regions = select_top_regions(build_region_summary(dataset))
+    return SyntheticRun(rows, csv_path, parquet_path, raw, transformed, dataset, regions)
+
+
+def _run(benchmark, synthetic: SyntheticRun, func):  # type: ignore[no-untyped-def]
+    benchmark.extra_info["rows"] = synthetic.rows
+    return benchmark.pedantic(func, rounds=ROUNDS, iterations=1, warmup_rounds=0)
+
+
+def test_extract(benchmark, synthetic: SyntheticRun) -> None:  # type: ignore[no-untyped-def]
+    extractor = CsvExtractor(synthetic.csv_path, chunk_size=SETTINGS.etl.chunk_size)
+
+    rows = _run(benchmark, synthetic, lambda: sum(len(chunk) for chunk in extractor.read()))
+
+    assert rows == synthetic.rows
+
+
+def test_transform(benchmark, synthetic: SyntheticRun) -> None:  # type: ignore[no-untyped-def]
+    transformer = ProjectTransformer(SETTINGS.etl)
+
+    result = _run(benchmark, synthetic, lambda: transformer.transform(synthetic.raw))
+
+    assert len(result) == synthetic.rows
+
+
+def test_loader_save(benchmark, synthetic: SyntheticRun, tmp_path: Path) -> None:  # type: ignore[no-untyped-def]
+    loader = CsvParquetLoader(tmp_path / "out.csv", tmp_path / "out.parquet")
+
+    _run(benchmark, synthetic, lambda: loader.save(synthetic.transformed))
+
+    assert (tmp_path / "out.parquet").exists()
+
+
+def test_load_dataset(benchmark, synthetic: SyntheticRun) -> None:  # type: ignore[no-untyped-def]
+    result = _run(benchmark, synthetic, lambda: load_dataset(synthetic.parquet_path))
+
+    assert len(result) == synthetic.rows
+
+
+@pytest.mark.parametrize(
+    "builder",
+    [
+        lambda frame, regions: build_region_summary(frame),
+        build_yearly_region_projects,
+        build_panel_finance,
+    ],
+    ids=["region_summary", "yearly_region_projects", "panel_finance"],
+)
+def test_builders(benchmark, synthetic: SyntheticRun, builder) -> None:  # type: ignore[no-untyped-def]
+    result = _run(benchmark, synthetic, lambda: builder(synthetic.dataset, synthetic.regions))
+
+    assert not result.empty
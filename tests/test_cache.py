@@ -0,0 +1,68 @@
+"""Tests for the memory-mapped dataset cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.viz.cache import DatasetCache
+from src.viz.los_rios_data import load_dataset
+
+
+def _write_dataset(path: Path, rows: int = 6) -> Path:
+    pd.DataFrame(
+        {
+            "Código Proyecto": [f"P-{index}" for index in range(rows)],
+            "Región": ["Región de Los Ríos", "Región del Biobío"] * (rows // 2),
+            "Año Adjudicación": pd.array([2020 + index % 3 for index in range(rows)], dtype="Int64"),
+            "Financiamiento Innova": pd.array([index * 1000 for index in range(rows)], dtype="Int64"),
+        }
+    ).to_parquet(path, index=False)
+    return path
+
+
+def test_cached_frames_match_and_skip_the_source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    dataset = _write_dataset(tmp_path / "corfo_projects.parquet")
+    cache = DatasetCache(tmp_path / "cache")
+    columns = ["Region_Normalizada", "Financiamiento Innova"]
+
+    expected_full = load_dataset(dataset, cache=cache)
+    expected_subset = load_dataset(dataset, columns, cache=cache)
+
+    def _fail(*args: object, **kwargs: object) -> pd.DataFrame:
+        raise AssertionError("cache hit expected")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(pd, "read_parquet", _fail)
+        pd.testing.assert_frame_equal(load_dataset(dataset, cache=cache), expected_full)
+        pd.testing.assert_frame_equal(load_dataset(dataset, columns, cache=cache), expected_subset)
+
+    # Rewriting the source replaces its entries instead of serving stale frames.
+    _write_dataset(dataset, rows=8)
+    os.utime(dataset, ns=(0, dataset.stat().st_mtime_ns + 1))
+    assert len(load_dataset(dataset, cache=cache)) == 8
+    assert len(list((tmp_path / "cache").glob("*.arrow"))) == 1
+
+    assert cache.invalidate(dataset) == 1
+    assert cache.get(dataset) is None
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    datasets = [_write_dataset(tmp_path / f"dataset_{index}.parquet") for index in range(3)]
+    probe = DatasetCache(tmp_path / "probe")
+    entry_size = probe.put(datasets[0], None, load_dataset(datasets[0])).stat().st_size
+    cache = DatasetCache(tmp_path / "cache", max_bytes=2 * entry_size)
+
+    load_dataset(datasets[0], cache=cache)
+    load_dataset(datasets[1], cache=cache)
+    first = cache._entry_path(datasets[0], None)
+    os.utime(first, (0, 0))
+    assert cache.get(datasets[0]) is not None  # refreshes its recency
+    load_dataset(datasets[2], cache=cache)
+
+    assert cache.get(datasets[0]) is not None
+    assert cache.get(datasets[1]) is None
+    assert cache.size_bytes() <= 2 * entry_size
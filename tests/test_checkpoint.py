@@ -0,0 +1,123 @@
+"""Tests for chunk checkpoints and resumed ETL runs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.core.config import EtlSettings, PipelineSettings
+from src.etl.extract import CsvExtractor
+from src.etl.load import CsvParquetLoader
+from src.etl.transform import ProjectTransformer, TransformIssues, TransformPlan
+from src.pipelines.checkpoint import CHECKPOINT_DIR_NAME, MANIFEST_NAME
+from src.pipelines.etl_pipeline import EtlPipeline, RunSummary
+
+
+class _FailingTransformer(ProjectTransformer):
+    """Counts transformed rows and raises on chunk ``fail_at`` (1-based)."""
+
+    def __init__(self, settings: EtlSettings, fail_at: int = 0) -> None:
+        super().__init__(settings)
+        self.fail_at = fail_at
+        self.calls = 0
+        self.rows_seen = 0
+
+    def apply(self, frame: pd.DataFrame, plan: TransformPlan) -> tuple[pd.DataFrame, TransformIssues]:
+        self.calls += 1
+        if self.calls == self.fail_at:
+            raise MemoryError("simulated crash")
+        self.rows_seen += len(frame)
+        return super().apply(frame, plan)
+
+
+def _settings(tmp_path: Path, **etl: object) -> PipelineSettings:
+    settings = PipelineSettings(
+        paths={
+            "raw_dataset": tmp_path / "raw.csv",
+            "processed_dir": tmp_path / "processed",
+            "interim_dir": tmp_path / "interim",
+        },
+        output={},
+        etl={
+            "currency_columns": ["Financiamiento Innova"],
+            "date_columns": ["Inicio"],
+            "checkpoint": True,
+            **etl,
+        },
+    )
+    if not settings.paths.raw_dataset.exists():
+        amounts = [f"${index}.000" for index in range(20)]
+        amounts[1] = amounts[14] = "n/d"
+        pd.DataFrame(
+            {
+                "Código Proyecto": [f"P-{index}" for index in range(20)],
+                "Región": ["Región de Los Ríos", " Región del  Biobío "] * 10,
+                "Financiamiento Innova": amounts,
+                # Detected as day-first on the first chunk; the later ones alone would give ISO.
+                "Inicio": ["24/11/2021"] * 8 + [f"2020-01-{day:02d}" for day in range(1, 12)] + ["sin fecha"],
+            }
+        ).to_csv(settings.paths.raw_dataset, index=False)
+    return settings
+
+
+def _run(settings: PipelineSettings, transformer: ProjectTransformer, resume: bool = False) -> RunSummary:
+    return EtlPipeline(
+        settings,
+        CsvExtractor(settings.paths.raw_dataset, chunk_size=settings.etl.chunk_size),
+        transformer,
+        CsvParquetLoader(settings.processed_csv_path, settings.processed_parquet_path),
+        resume=resume,
+    ).run(materialize=False)
+
+
+def test_resume_replays_checkpointed_chunks_and_transforms_the_rest(tmp_path: Path) -> None:
+    settings = _settings(tmp_path, chunk_size=4)
+    checkpoint_dir = settings.paths.interim_dir / CHECKPOINT_DIR_NAME
+    with pytest.raises(MemoryError):
+        _run(settings, _FailingTransformer(settings.etl, fail_at=3))
+
+    assert not settings.processed_parquet_path.exists()
+    assert sorted(path.name for path in checkpoint_dir.iterdir()) == [
+        "chunk-000000.parquet",
+        "chunk-000001.parquet",
+        MANIFEST_NAME,
+    ]
+    # A torn entry from a crash mid-append is ignored.
+    with (checkpoint_dir / MANIFEST_NAME).open("a", encoding="utf-8") as handle:
+        handle.write('{"file": "chunk-0000')
+
+    # Chunk sizes may change between runs; rows are skipped, not chunks.
+    resumed = _settings(tmp_path, chunk_size=3)
+    transformer = _FailingTransformer(resumed.etl)
+    summary = _run(resumed, transformer, resume=True)
+
+    (tmp_path / "reference").mkdir()
+    reference = _settings(tmp_path / "reference", chunk_size=20)
+    expected = _run(reference, _FailingTransformer(reference.etl))
+    assert transformer.rows_seen == 12
+    # Formats and issues of the checkpointed chunks carry over to the resumed run.
+    assert transformer.date_formats == {"Inicio": "%d/%m/%Y"}
+    assert summary.issues == expected.issues == {
+        "rejected_currency": {"Financiamiento Innova": 2},
+        "unparsed_dates": {"Inicio": 1},
+    }
+    assert not checkpoint_dir.exists()
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(resumed.processed_parquet_path), pd.read_parquet(reference.processed_parquet_path)
+    )
+    assert resumed.processed_csv_path.read_bytes() == reference.processed_csv_path.read_bytes()
+
+
+def test_resume_starts_over_when_settings_changed(tmp_path: Path) -> None:
+    settings = _settings(tmp_path, chunk_size=4)
+    with pytest.raises(MemoryError):
+        _run(settings, _FailingTransformer(settings.etl, fail_at=4))
+
+    changed = _settings(tmp_path, chunk_size=4, currency_columns=[])
+    transformer = _FailingTransformer(changed.etl)
+    _run(changed, transformer, resume=True)
+
+    assert transformer.rows_seen == 20
+    assert pd.read_parquet(changed.processed_parquet_path)["Financiamiento Innova"].iloc[0] == "$0.000"
@@ -0,0 +1,62 @@
+"""Tests for the region x year aggregate cube."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+from src.viz.cube import build_region_year_cube, cube_path_for, load_region_year_cube, slice_cube
+from src.viz.los_rios_data import (
+    build_panel_finance,
+    build_region_summary,
+    build_yearly_region_projects,
+)
+
+
+def _projects() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Código Proyecto": ["A", "B", "C", None, "E"],
+            "Region_Normalizada": [
+                "Region De Los Rios",
+                "Region De Los Rios",
+                "Region Del Biobio",
+                "Region De Los Rios",
+                "Region Del Biobio",
+            ],
+            "anio_dt": pd.to_datetime(["2024", "2024", "2024", "2025", None], format="%Y"),
+            "Financiamiento Innova": pd.array([10, 20, 30, 40, 50], dtype="Int64"),
+            "Aprobado Privado": pd.array([1, None, 3, 4, 5], dtype="Int64"),
+        }
+    )
+
+
+def test_builders_give_same_result_from_projects_or_cube() -> None:
+    projects = _projects()
+    cube = build_region_year_cube(projects)
+    regions = ["Region De Los Rios", "Region Del Biobio"]
+
+    summary = build_region_summary(cube)
+    los_rios = summary.set_index("Region_Normalizada").loc["Region De Los Rios"]
+
+    assert los_rios["total_innova"] == 70
+    assert los_rios["proyectos"] == 2
+    assert los_rios["promedio_privado"] == 2.5
+    pd.testing.assert_frame_equal(summary, build_region_summary(projects))
+    pd.testing.assert_frame_equal(
+        build_panel_finance(cube, regions), build_panel_finance(projects, regions)
+    )
+    yearly = build_yearly_region_projects(cube, regions)
+    assert yearly["proyectos"].tolist() == [1, 2, 1]
+    assert len(slice_cube(cube, regions=["Region Del Biobio"], years=[2024])) == 1
+
+
+def test_cube_is_persisted_next_to_dataset(tmp_path: Path) -> None:
+    dataset_path = tmp_path / "corfo_projects.parquet"
+    _projects().to_parquet(dataset_path, index=False)
+
+    cube = load_region_year_cube(dataset_path)
+
+    assert cube_path_for(dataset_path).exists()
+    pd.testing.assert_frame_equal(load_region_year_cube(dataset_path), cube)
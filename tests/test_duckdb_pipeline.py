@@ -0,0 +1,80 @@
+"""Parity between the pandas ETL and the DuckDB out-of-core engine."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+from src.core.config import PipelineSettings
+from src.etl.extract import CsvExtractor
+from src.etl.transform import ProjectTransformer
+from src.pipelines.duckdb_pipeline import DuckDbEtlPipeline
+from src.pipelines.etl_pipeline import EtlPipeline
+
+
+class _MemoryLoader:
+    def __init__(self) -> None:
+        self.chunks: list[pd.DataFrame] = []
+
+    def save(self, frame: pd.DataFrame) -> None:
+        self.chunks = [frame]
+
+    def open(self) -> None:
+        self.chunks = []
+
+    def write_chunk(self, frame: pd.DataFrame) -> None:
+        self.chunks.append(frame)
+
+    def close(self) -> None:
+        pass
+
+
+RAW_CSV = (
+    "Código Proyecto,Título,Financiamiento Innova,Criterio Mujer,Inicio Actividad Económica,"
+    "Región,Año Adjudicación\n"
+    'P-1,"  Proyecto \t piloto ",$1.234.567,Sí,2021-11-24 0:00:00,Región de Los Ríos,2021\n'
+    'P-2,"Línea uno\nlínea dos","$1.234,50",Incentivo,1993-01-01,Región del Biobío,2020\n'
+    "P-3,NA,-$1.000,no aplica,1993-01-01T00:00:00Z,Región de los Lagos,\n"
+    "P-4,Sin cambios,n/d,No,sin fecha,,2019\n"
+    "P-5,,,,,Región de La Araucanía,abc\n"
+    'P-6,"Comillas ""dobles""",$ 7 ,NO,2015-01-07 13:05:00,Región de Los Ríos,2024\n'
+    "P-7,\u00a0Espacio  duro\t,-$5,sí,24/11/2021,Región de Los Ríos,2024\n"
+    "P-8,Fecha ambigua,$10,No,05/06/2020,Región de Los Ríos,2020\n"
+    "P-9,ISO con zona,$20,Sí,2009-07-01T00:00:00Z,Región de Los Ríos,2009\n"
+)
+
+
+@pytest.mark.parametrize("date_format", [None, "%Y-%m-%d %H:%M:%S"])
+def test_duckdb_engine_matches_pandas_engine(tmp_path: Path, date_format: str | None) -> None:
+    raw_path = tmp_path / "raw.csv"
+    raw_path.write_text(RAW_CSV, encoding="utf-8")
+    settings = PipelineSettings(
+        paths={"raw_dataset": raw_path, "processed_dir": tmp_path / "processed", "interim_dir": tmp_path / "interim"},
+        output={},
+        etl={
+            "chunk_size": 3,
+            "engine": "duckdb",
+            "currency_columns": ["Financiamiento Innova"],
+            "date_columns": {"Inicio Actividad Económica": date_format},
+            "boolean_mappings": {"affirmative": ["Sí", "Incentivo"], "negative": ["No"]},
+        },
+    )
+
+    expected = EtlPipeline(
+        settings,
+        CsvExtractor(raw_path, chunk_size=3),
+        ProjectTransformer(settings.etl),
+        _MemoryLoader(),
+    ).run()
+    loader = _MemoryLoader()
+    result = DuckDbEtlPipeline(settings, loader).run()
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert [len(chunk) for chunk in loader.chunks] == [3, 3, 3]
+    assert str(result.loc[7, "Inicio Actividad Económica"].date()) == "2020-06-05"
+    assert str(result.loc[8, "Inicio Actividad Económica"].date()) == "2009-07-01"
+    assert (tmp_path / "interim" / "duckdb_spill").is_dir()
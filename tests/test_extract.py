@@ -0,0 +1,102 @@
+"""Tests for the extraction layer."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.core.config import PROJECT_ROOT, PathSettings
+from src.etl.extract import SOURCE_FILE_ATTR, ArrowCsvExtractor, CsvExtractor, MultiFileExtractor
+from src.etl.synthetic import RAW_COLUMNS, generate_raw_frame, write_raw_csv
+
+
+def test_arrow_extractor_yields_same_chunks_as_pandas_extractor(tmp_path: Path) -> None:
+    csv_path = tmp_path / "raw.csv"
+    csv_path.write_text(
+        "Código Proyecto,Objetivo,Financiamiento Innova,Año Adjudicación\n"
+        'P-1,"Texto, con coma",$1.000,2024\n'
+        'P-2,"Línea uno\nlínea dos",,2025\n'
+        "P-3,NA,$2.500,\n"
+        "P-4,null,$3,2023\n"
+        "P-5,Sin cambios,$10,2022\n",
+        encoding="utf-8",
+    )
+
+    expected = list(CsvExtractor(csv_path, chunk_size=2).read())
+    result = list(ArrowCsvExtractor(csv_path, chunk_size=2, block_size=128).read())
+
+    assert [len(chunk) for chunk in result] == [2, 2, 1]
+    for got, want in zip(result, expected):
+        pd.testing.assert_frame_equal(got, want)
+
+
+def test_synthetic_generator_matches_raw_schema_and_is_seeded(tmp_path: Path) -> None:
+    raw_header = pd.read_csv(
+        PROJECT_ROOT / "data" / "raw" / "corfo_idie_los_rios_recursos_anuales.csv", nrows=0
+    )
+    path = write_raw_csv(tmp_path / "synthetic.csv", rows=250, seed=7, chunk_size=100)
+
+    frame = pd.concat(CsvExtractor(path, chunk_size=100).read(), ignore_index=True)
+
+    assert list(frame.columns) == list(raw_header.columns) == list(RAW_COLUMNS)
+    assert len(frame) == 250
+    assert frame["Código Proyecto"].is_unique
+    pd.testing.assert_frame_equal(generate_raw_frame(50, seed=7), generate_raw_frame(50, seed=7))
+
+
+@pytest.mark.parametrize("reader", [CsvExtractor, ArrowCsvExtractor])
+def test_multi_file_extractor_reads_globbed_compressed_files_in_order(
+    tmp_path: Path, reader: type
+) -> None:
+    frame = generate_raw_frame(23, seed=3)
+    parts = {"2023.csv": frame[:10], "2024.csv.gz": frame[10:18], "2025.csv.zst": frame[18:]}
+    for name, part in parts.items():
+        compression = {".gz": "gzip", ".zst": "zstd"}.get(Path(name).suffix)
+        with pa.output_stream(str(tmp_path / name), compression=compression) as stream:
+            stream.write(part.to_csv(index=False).encode("utf-8"))
+    paths = PathSettings(raw_dataset=str(tmp_path / "20*.csv*"), processed_dir=tmp_path, interim_dir=tmp_path)
+
+    extractor = MultiFileExtractor(
+        paths.raw_files,
+        lambda path: reader(path, chunk_size=4),
+        workers=2,
+        prefetch=1,
+        source_column="Archivo",
+    )
+    chunks = list(extractor.read())
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2, 4, 4, 4, 1]
+    assert [Path(chunk.attrs[SOURCE_FILE_ATTR]).name for chunk in chunks[::3]] == list(parts)
+    result = pd.concat(chunks, ignore_index=True)
+    assert result["Archivo"].map(lambda value: Path(value).name).tolist() == [
+        name for name, part in parts.items() for _ in range(len(part))
+    ]
+    frame.to_csv(tmp_path / "all.csv", index=False)
+    expected = pd.concat(CsvExtractor(tmp_path / "all.csv", chunk_size=100).read(), ignore_index=True)
+    pd.testing.assert_frame_equal(result.drop(columns="Archivo"), expected)
+
+    # Stopping early must not leave producers blocked on a full buffer.
+    partial = extractor.read()
+    next(partial)
+    partial.close()
+
+
+@pytest.mark.parametrize("reader", [CsvExtractor, ArrowCsvExtractor])
+def test_memory_budget_resizes_chunks_to_the_widest_rows(tmp_path: Path, reader: type) -> None:
+    csv_path = tmp_path / "raw.csv"
+    objetivos = ["corto"] * 400 + ["largo " * 200] * 400
+    pd.DataFrame({"Código Proyecto": range(800), "Objetivo": objetivos}).to_csv(csv_path, index=False)
+    budget_mb = 0.1
+
+    chunks = list(reader(csv_path, chunk_size=50, memory_budget_mb=budget_mb).read())
+
+    sizes = [len(chunk) for chunk in chunks]
+    assert sizes[:3] == [50, 100, 200]  # narrow rows first: chunks grow, at most doubling
+    first_wide = next(index for index, chunk in enumerate(chunks) if chunk["Objetivo"].str.len().max() > 100)
+    for chunk in chunks[first_wide + 1 :]:
+        assert chunk.memory_usage(deep=True, index=False).sum() <= budget_mb * (1 << 20)
+    expected = pd.concat(CsvExtractor(csv_path, chunk_size=800).read())
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
@@ -0,0 +1,57 @@
+"""Tests for the figure registry and the batch export."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from src.viz.cube import build_region_year_cube
+from src.viz.figures import FIGURES, DashboardContext, export_figures
+
+
+def test_export_figures_writes_every_registered_figure(tmp_path: Path) -> None:
+    projects = pd.DataFrame(
+        {
+            "Código Proyecto": ["A", "B", "C"],
+            "Region_Normalizada": ["Region De Los Rios", "Region Del Biobio", "Region De Los Rios"],
+            "anio_dt": pd.to_datetime(["2023", "2024", "2024"], format="%Y"),
+            "Financiamiento Innova": pd.array([10, 20, 30], dtype="Int64"),
+            "Aprobado Privado": pd.array([1, 2, 3], dtype="Int64"),
+        }
+    )
+    context = DashboardContext(cube=build_region_year_cube(projects))
+
+    paths = export_figures(context, tmp_path)
+
+    assert [path.name for path in paths] == [spec.output_name for spec in FIGURES.values()]
+    assert all("Plotly.newPlot" in path.read_text(encoding="utf-8") for path in paths)
+
+
+def test_figure_to_html_skips_unchanged_figures(tmp_path: Path) -> None:
+    import plotly.graph_objects as go
+
+    from src.ncnvert import MANIFEST_NAME, figure_to_html
+
+    output = tmp_path / "chart.html"
+    figure = go.Figure(go.Bar(x=["a"], y=[1]))
+    figure_to_html(figure, output, title="Chart")
+    os.utime(output, ns=(0, 0))
+
+    figure_to_html(figure, output, title="Chart")
+    assert output.stat().st_mtime_ns == 0
+    assert (tmp_path / MANIFEST_NAME).exists()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [MANIFEST_NAME, "chart.html"]
+
+    # An edited or deleted output is rewritten even though the figure is the same.
+    output.write_text("sentinel", encoding="utf-8")
+    figure_to_html(figure, output, title="Chart")
+    assert "Plotly.newPlot" in output.read_text(encoding="utf-8")
+    output.unlink()
+    figure_to_html(figure, output, title="Chart")
+    assert output.exists()
+
+    os.utime(output, ns=(0, 0))
+    figure_to_html(figure, output, title="Otro título")
+    assert output.stat().st_mtime_ns != 0
@@ -0,0 +1,125 @@
+"""Tests for the partition-aware incremental ETL."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+from src.core.config import PipelineSettings
+from src.etl.extract import CsvExtractor
+from src.etl.load import CsvParquetLoader
+from src.etl.transform import ProjectTransformer, TransformIssues, TransformPlan
+from src.pipelines.etl_pipeline import EtlPipeline
+from src.pipelines.incremental import IncrementalEtlPipeline, PartitionManifest
+
+
+class _CountingTransformer(ProjectTransformer):
+    rows_seen = 0
+
+    def apply(self, frame: pd.DataFrame, plan: TransformPlan) -> tuple[pd.DataFrame, TransformIssues]:
+        type(self).rows_seen += len(frame)
+        return super().apply(frame, plan)
+
+
+def _settings(tmp_path: Path) -> PipelineSettings:
+    return PipelineSettings(
+        paths={
+            "raw_dataset": tmp_path / "raw.csv",
+            "processed_dir": tmp_path / "processed",
+            "interim_dir": tmp_path / "interim",
+        },
+        output={},
+        etl={"chunk_size": 3, "currency_columns": ["Financiamiento Innova"]},
+    )
+
+
+def _write_raw(path: Path, amounts: list[str]) -> None:
+    pd.DataFrame(
+        {
+            "Código Proyecto": [f"P-{index}" for index in range(len(amounts))],
+            "Año Adjudicación": ["2023", "2024", "2025", "2023", "2024", "2025"][: len(amounts)],
+            "Financiamiento Innova": amounts,
+        }
+    ).to_csv(path, index=False)
+
+
+def _incremental(settings: PipelineSettings) -> IncrementalEtlPipeline:
+    return IncrementalEtlPipeline(
+        settings,
+        CsvExtractor(settings.paths.raw_dataset, chunk_size=settings.etl.chunk_size),
+        _CountingTransformer(settings.etl),
+        CsvParquetLoader(settings.processed_csv_path, settings.processed_parquet_path),
+    )
+
+
+def test_incremental_run_only_retransforms_changed_partition(tmp_path: Path) -> None:
+    settings = _settings(tmp_path)
+    _write_raw(settings.paths.raw_dataset, ["$1", "$2", "$3", "$4", "$5", "$6"])
+    _incremental(settings).run()
+    assert set(PartitionManifest.load(_incremental(settings).manifest_path).partitions) == {
+        "2023",
+        "2024",
+        "2025",
+    }
+
+    _write_raw(settings.paths.raw_dataset, ["$1", "$2", "$30", "$4", "$5", "$60"])
+    _CountingTransformer.rows_seen = 0
+    summary = _incremental(settings).run()
+
+    assert _CountingTransformer.rows_seen == 2
+    assert summary.rows == 6
+    expected = EtlPipeline(
+        settings,
+        CsvExtractor(settings.paths.raw_dataset, chunk_size=3),
+        ProjectTransformer(settings.etl),
+        CsvParquetLoader(tmp_path / "full.csv", tmp_path / "full.parquet"),
+    ).run()
+    result = pd.read_parquet(settings.processed_parquet_path)
+    pd.testing.assert_frame_equal(
+        result.sort_values("Código Proyecto", ignore_index=True),
+        expected.sort_values("Código Proyecto", ignore_index=True),
+    )
+
+    # Same rows and order as an incremental run from scratch on the new input.
+    (tmp_path / "scratch").mkdir()
+    scratch = _settings(tmp_path / "scratch")
+    _write_raw(scratch.paths.raw_dataset, ["$1", "$2", "$30", "$4", "$5", "$60"])
+    _incremental(scratch).run()
+    assert settings.processed_csv_path.read_bytes() == scratch.processed_csv_path.read_bytes()
+    pd.testing.assert_frame_equal(result, pd.read_parquet(scratch.processed_parquet_path))
+    assert result["Año Adjudicación"].tolist() == [2023, 2023, 2024, 2024, 2025, 2025]
+
+    _CountingTransformer.rows_seen = 0
+    _incremental(settings).run()
+    assert _CountingTransformer.rows_seen == 0
+
+
+def test_missing_and_non_numeric_years_share_the_null_partition(tmp_path: Path) -> None:
+    settings = _settings(tmp_path)
+
+    def write(amounts: list[str]) -> None:
+        pd.DataFrame(
+            {
+                "Código Proyecto": [f"P-{index}" for index in range(5)],
+                "Año Adjudicación": ["2023", " 2024 ", None, "sin año", "2024.0"],
+                "Financiamiento Innova": amounts,
+            }
+        ).to_csv(settings.paths.raw_dataset, index=False)
+
+    write(["$1", "$2", "$3", "$4", "$5"])
+    _incremental(settings).run()
+    assert set(PartitionManifest.load(_incremental(settings).manifest_path).partitions) == {
+        "2023",
+        "2024",
+        "__null__",
+    }
+
+    write(["$1", "$2", "$3", "$40", "$5"])
+    _CountingTransformer.rows_seen = 0
+    summary = _incremental(settings).run()
+
+    assert _CountingTransformer.rows_seen == 2
+    assert summary.rows == 5
+    result = pd.read_parquet(settings.processed_parquet_path).sort_values("Código Proyecto", ignore_index=True)
+    assert result["Financiamiento Innova"].tolist() == [1, 2, 3, 40, 5]
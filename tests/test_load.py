@@ -0,0 +1,247 @@
+"""Tests for the load layer and the readers of its outputs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+import pytest
+
+from src.core.config import CategoricalEncoding
+from src.etl.load import CompositeLoader, CsvParquetLoader, PartitionedParquetLoader
+from src.etl.transform import CategoricalEncoder
+from src.viz.los_rios_data import load_dataset, load_partitioned_dataset
+
+
+def test_partitioned_dataset_round_trip_with_pushdown(tmp_path: Path) -> None:
+    dataset_dir = tmp_path / "dataset"
+    loader = PartitionedParquetLoader(
+        dataset_dir, ["Año Adjudicación", "Region_Normalizada"], row_group_size=2
+    )
+    chunks = [
+        pd.DataFrame(
+            {
+                "Código Proyecto": ["A", "B", "C"],
+                "Año Adjudicación": ["2023", "2024", "2024"],
+                "Región": ["Región de Los Ríos", "Región de Los Ríos", "Región del Biobío"],
+                "Financiamiento Innova": pd.array([1, 2, 3], dtype="Int64"),
+            }
+        ),
+        pd.DataFrame(
+            {
+                "Código Proyecto": ["D", "E"],
+                "Año Adjudicación": ["2024", None],
+                "Región": ["Región de Los Ríos", "Región de los Lagos"],
+                "Financiamiento Innova": pd.array([None, 5], dtype="Int64"),
+            }
+        ),
+    ]
+
+    loader.open()
+    for chunk in chunks:
+        loader.write_chunk(chunk)
+    loader.close()
+
+    los_rios_2024 = load_partitioned_dataset(
+        dataset_dir,
+        regions=["Region De Los Rios"],
+        years=[2024],
+        columns=["Código Proyecto", "Financiamiento Innova", "Region_Normalizada"],
+    )
+    everything = load_partitioned_dataset(dataset_dir)
+
+    assert sorted(los_rios_2024["Código Proyecto"]) == ["B", "D"]
+    assert los_rios_2024["es_los_rios"].all()
+    assert "Región" not in los_rios_2024
+    assert sorted(everything["Código Proyecto"]) == ["A", "B", "C", "D", "E"]
+    assert everything["Año Adjudicación"].isna().sum() == 1
+
+
+def test_load_dataset_projects_parquet_and_completes_missing_derived_columns(tmp_path: Path) -> None:
+    path = tmp_path / "corfo_projects.parquet"
+    pd.DataFrame(
+        {
+            "Código Proyecto": ["A", "B"],
+            "Región": ["Región de Los Ríos", "Región del Biobío"],
+            "Año Adjudicación": pd.array([2024, None], dtype="Int64"),
+            "Financiamiento Innova": pd.array([10, 20], dtype="Int64"),
+            "Objetivo": ["texto largo", "otro texto"],
+        }
+    ).to_parquet(path, index=False)
+
+    frame = load_dataset(path, columns=["Financiamiento Innova", "es_los_rios", "anio_dt"])
+
+    assert list(frame.columns) == ["Financiamiento Innova", "es_los_rios", "anio_dt"]
+    assert frame["es_los_rios"].tolist() == [True, False]
+    assert frame["anio_dt"].iloc[0] == pd.Timestamp("2024-01-01")
+    assert load_dataset(path)["Año Adjudicación"].dtype == "Int16"
+
+
+def _chunks() -> list[pd.DataFrame]:
+    return [
+        pd.DataFrame(
+            {
+                "Código Proyecto": [f"P-{start + index}" for index in range(4)],
+                "Región": ["Región de Los Ríos", None, "Región del Biobío", "Región de Los Ríos"],
+                "Financiamiento Innova": pd.array([start, None, 2, 3], dtype="Int64"),
+            }
+        )
+        for start in (0, 4, 8)
+    ]
+
+
+def test_csv_parquet_loader_writes_every_format_atomically(tmp_path: Path) -> None:
+    csv_path = tmp_path / "out.csv.zst"
+    parquet_path = tmp_path / "out.parquet"
+    feather_path = tmp_path / "out.arrow"
+    loader = CsvParquetLoader(
+        csv_path,
+        parquet_path,
+        feather_path=feather_path,
+        csv_compression="zstd",
+        compression="zstd",
+        compression_level=9,
+        use_dictionary=["Región"],
+        row_group_size=8,
+    )
+
+    loader.open()
+    for chunk in _chunks():
+        loader.write_chunk(chunk)
+        assert not any(path.exists() for path in (csv_path, parquet_path, feather_path))
+    loader.close()
+
+    expected = pd.concat(_chunks(), ignore_index=True)
+    metadata = pq.read_metadata(parquet_path)
+    assert [metadata.row_group(index).num_rows for index in range(metadata.num_row_groups)] == [8, 4]
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+    pd.testing.assert_frame_equal(pd.read_parquet(parquet_path), expected)
+    pd.testing.assert_frame_equal(feather.read_feather(feather_path), expected)
+    with pa.input_stream(str(csv_path), compression="zstd") as stream:
+        csv = pd.read_csv(stream, dtype={"Financiamiento Innova": "Int64"})
+    pd.testing.assert_frame_equal(csv, expected)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["out.arrow", "out.csv.zst", "out.parquet"]
+
+
+def test_aborted_load_keeps_previous_outputs(tmp_path: Path) -> None:
+    csv_path, parquet_path = tmp_path / "out.csv", tmp_path / "out.parquet"
+    CsvParquetLoader(csv_path, parquet_path).save(_chunks()[0])
+    previous = csv_path.read_bytes(), parquet_path.read_bytes()
+    loader = CsvParquetLoader(csv_path, parquet_path)
+
+    loader.open()
+    loader.write_chunk(_chunks()[1])
+    with pytest.raises(pa.ArrowInvalid):
+        loader.write_chunk(_chunks()[2].assign(**{"Financiamiento Innova": "x"}))
+    loader.abort()
+
+    assert (csv_path.read_bytes(), parquet_path.read_bytes()) == previous
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["out.csv", "out.parquet"]
+
+
+def test_categorical_chunks_round_trip_with_growing_dictionaries(tmp_path: Path) -> None:
+    csv_path, parquet_path = tmp_path / "out.csv", tmp_path / "out.parquet"
+    feather_path = tmp_path / "out.arrow"
+    loader = CsvParquetLoader(csv_path, parquet_path, feather_path=feather_path)
+    encoder = CategoricalEncoder(CategoricalEncoding(max_categories=300, max_ratio=1))
+    # The second chunk pushes the dictionary past int8 codes.
+    chunks = [
+        pd.DataFrame({"Comuna": [f"C-{index % 100}" for index in range(200)], "Monto": range(200)}),
+        pd.DataFrame({"Comuna": [f"C-{index}" for index in range(100, 300)], "Monto": range(200)}),
+    ]
+
+    loader.open()
+    for chunk in chunks:
+        loader.write_chunk(encoder.transform(chunk))
+    loader.close()
+
+    expected = pd.concat(chunks, ignore_index=True)
+    assert pq.read_schema(parquet_path).field("Comuna").type == pa.dictionary(pa.int32(), pa.string())
+    for frame in (pd.read_parquet(parquet_path), feather.read_feather(feather_path)):
+        assert len(frame["Comuna"].cat.categories) == 300
+        pd.testing.assert_frame_equal(frame.astype({"Comuna": "str"}), expected)
+    pd.testing.assert_frame_equal(pd.read_csv(csv_path), expected)
+
+
+def test_column_left_as_text_past_max_categories_round_trips(tmp_path: Path) -> None:
+    csv_path, parquet_path = tmp_path / "out.csv", tmp_path / "out.parquet"
+    feather_path = tmp_path / "out.arrow"
+    loader = CsvParquetLoader(csv_path, parquet_path, feather_path=feather_path)
+    encoder = CategoricalEncoder(CategoricalEncoding(max_categories=150, max_ratio=1))
+    # Encoded in the first chunk only; the later ones reach the writers as text.
+    chunks = [
+        pd.DataFrame({"Comuna": [f"C-{index % 100}" for index in range(200)]}),
+        pd.DataFrame({"Comuna": [f"C-{index}" if index % 7 else None for index in range(100, 300)]}),
+        pd.DataFrame({"Comuna": [f"C-{index}" for index in range(250, 400)]}),
+    ]
+
+    loader.open()
+    for chunk in chunks:
+        loader.write_chunk(encoder.transform(chunk))
+    loader.close()
+
+    expected = pd.concat(chunks, ignore_index=True)
+    for frame in (pd.read_parquet(parquet_path), feather.read_feather(feather_path)):
+        pd.testing.assert_frame_equal(frame.astype({"Comuna": "str"}), expected)
+    pd.testing.assert_frame_equal(pd.read_csv(csv_path), expected)
+
+
+def test_partitioned_loader_swaps_dataset_in_on_close_and_bounds_buffers(tmp_path: Path) -> None:
+    dataset_dir = tmp_path / "dataset"
+    budget = 64 / (1024 * 1024)
+    loader = PartitionedParquetLoader(dataset_dir, ["Región"], row_group_size=4, buffer_memory_mb=budget)
+    loader.save(_chunks()[0])
+    previous = sorted(path.relative_to(dataset_dir) for path in dataset_dir.rglob("*"))
+
+    loader.open()
+    loader.write_chunk(_chunks()[1].iloc[:0])
+    for chunk in _chunks():
+        loader.write_chunk(chunk)
+        # Three partitions, yet never more than the buffer budget left in memory.
+        assert sum(loader._buffered_bytes.values()) <= 64
+    loader.abort()
+
+    assert sorted(path.relative_to(dataset_dir) for path in dataset_dir.rglob("*")) == previous
+    assert [path.name for path in tmp_path.iterdir()] == ["dataset"]
+
+    # With room in the buffers, row groups are cut at ``row_group_size`` only.
+    loader = PartitionedParquetLoader(dataset_dir, ["Región"], row_group_size=4)
+    loader.open()
+    for chunk in _chunks():
+        loader.write_chunk(chunk)
+    loader.close()
+
+    assert [path.name for path in tmp_path.iterdir()] == ["dataset"]
+    metadata = pq.read_metadata(next(dataset_dir.glob("Región=Regi*Los*/part-0.parquet")))
+    assert [metadata.row_group(index).num_rows for index in range(metadata.num_row_groups)] == [4, 2]
+    assert sorted(load_partitioned_dataset(dataset_dir)["Código Proyecto"]) == sorted(
+        f"P-{index}" for index in range(12)
+    )
+
+
+def test_composite_loader_publishes_nothing_when_one_loader_fails_to_finish(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path, parquet_path, dataset_dir = tmp_path / "out.csv", tmp_path / "out.parquet", tmp_path / "dataset"
+    flat = CsvParquetLoader(csv_path, parquet_path)
+    partitioned = PartitionedParquetLoader(dataset_dir, ["Región"])
+    loader = CompositeLoader([flat, partitioned])
+    loader.save(_chunks()[0])
+    previous = {path: path.read_bytes() for path in (csv_path, parquet_path)}
+
+    def fail() -> None:
+        raise OSError("disk full")
+
+    loader.open()
+    for chunk in _chunks():
+        loader.write_chunk(chunk)
+    monkeypatch.setattr(partitioned, "_close_writers", fail)
+    with pytest.raises(OSError, match="disk full"):
+        loader.close()
+
+    assert {path: path.read_bytes() for path in previous} == previous
+    assert sorted(load_partitioned_dataset(dataset_dir)["Código Proyecto"]) == [f"P-{index}" for index in range(4)]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["dataset", "out.csv", "out.parquet"]
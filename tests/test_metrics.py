@@ -0,0 +1,34 @@
+"""Tests for per-stage run metrics and their reports."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from src.core.metrics import RunMetrics, tracing, write_json_report
+
+
+def test_nested_stage_keeps_the_outer_tracemalloc_peak() -> None:
+    metrics = RunMetrics()
+    with tracing(True), metrics.stage("outer"):
+        buffer = bytearray(8_000_000)
+        del buffer
+        with metrics.stage("inner"):
+            small = bytearray(1_000_000)
+            del small
+
+    assert metrics.stages["inner"].tracemalloc_peak_bytes < 4_000_000
+    assert metrics.stages["outer"].tracemalloc_peak_bytes >= 8_000_000
+
+
+def test_reports_of_runs_started_in_the_same_second_do_not_collide(tmp_path: Path) -> None:
+    first, second = RunMetrics(), RunMetrics()
+    second.started_at = first.started_at
+
+    paths = {write_json_report(metrics.report(), tmp_path) for metrics in (first, second)}
+
+    assert len(paths) == 2
+    assert {json.loads(path.read_text(encoding="utf-8"))["run_id"] for path in paths} == {
+        first.run_id,
+        second.run_id,
+    }
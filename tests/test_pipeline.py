@@ -0,0 +1,238 @@
+"""Tests for the EtlPipeline orchestration."""
+
+from __future__ import annotations
+
+import json
+import pickle
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.core.config import PROJECT_ROOT, EtlSettings, PipelineSettings
+from src.core.schema import SCHEMA_VERSION, SchemaError, conform_table, schema_version
+from src.etl.load import CsvParquetLoader
+from src.etl.synthetic import generate_raw_frame
+from src.etl.transform import ProjectTransformer
+from src.pipelines.etl_pipeline import EtlPipeline, RunSummary
+from src.viz.los_rios_data import load_dataset, load_dataset_from_table
+
+
+class _FrameExtractor:
+    def __init__(self, frame: pd.DataFrame, chunk_size: int) -> None:
+        self._frame = frame
+        self._chunk_size = chunk_size
+
+    def read(self) -> Iterator[pd.DataFrame]:
+        for start in range(0, len(self._frame), self._chunk_size):
+            yield self._frame.iloc[start : start + self._chunk_size]
+
+
+class _MemoryLoader:
+    def __init__(self) -> None:
+        self.chunks: list[pd.DataFrame] = []
+
+    def save(self, frame: pd.DataFrame) -> None:
+        self.chunks = [frame]
+
+    def open(self) -> None:
+        self.chunks = []
+
+    def write_chunk(self, frame: pd.DataFrame) -> None:
+        self.chunks.append(frame)
+
+    def close(self) -> None:
+        pass
+
+    def abort(self) -> None:
+        self.chunks = []
+
+
+def _settings(tmp_path: Path, metrics: dict | None = None, **etl: object) -> PipelineSettings:
+    return PipelineSettings(
+        paths={
+            "raw_dataset": tmp_path / "raw.csv",
+            "processed_dir": tmp_path / "processed",
+            "interim_dir": tmp_path / "interim",
+        },
+        output={},
+        etl={"currency_columns": ["Financiamiento Innova"], **etl},
+        metrics=metrics or {},
+    )
+
+
+def _raw_frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Código Proyecto": [f"P-{index}" for index in range(rows)],
+            "Financiamiento Innova": [f"${index}.000" for index in range(rows)],
+            "Título": [f"  Proyecto  {index} " for index in range(rows)],
+        }
+    )
+
+
+def test_project_transformer_is_picklable() -> None:
+    transformer = ProjectTransformer(EtlSettings(currency_columns=["Financiamiento Innova"]))
+    frame = _raw_frame(3)
+
+    restored = pickle.loads(pickle.dumps(transformer))
+
+    pd.testing.assert_frame_equal(restored.transform(frame), transformer.transform(frame))
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_concurrent_run_preserves_chunk_order(tmp_path: Path, executor: str) -> None:
+    raw = _raw_frame(50)
+    serial_settings = _settings(tmp_path)
+    parallel_settings = _settings(tmp_path, workers=3, executor=executor)
+
+    expected = EtlPipeline(
+        serial_settings,
+        _FrameExtractor(raw, chunk_size=7),
+        ProjectTransformer(serial_settings.etl),
+        _MemoryLoader(),
+    ).run()
+    result = EtlPipeline(
+        parallel_settings,
+        _FrameExtractor(raw, chunk_size=7),
+        ProjectTransformer(parallel_settings.etl),
+        _MemoryLoader(),
+    ).run()
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_concurrent_run_detects_dates_once_and_merges_issues(tmp_path: Path, executor: str) -> None:
+    settings = _settings(tmp_path, workers=2, executor=executor, date_columns=["Inicio"])
+    raw = _raw_frame(12)
+    raw.loc[[1, 8], "Financiamiento Innova"] = "n/d"
+    # Day-first dates: the layout comes from the first chunk, later chunks are ambiguous.
+    raw["Inicio"] = ["24/11/2021"] * 4 + ["05/06/2020"] * 7 + ["sin fecha"]
+    transformer = ProjectTransformer(settings.etl)
+
+    summary = EtlPipeline(
+        settings, _FrameExtractor(raw, chunk_size=4), transformer, _MemoryLoader()
+    ).run(materialize=False)
+
+    assert transformer.date_formats == {"Inicio": "%d/%m/%Y"}
+    assert summary.issues == {
+        "rejected_currency": {"Financiamiento Innova": 2},
+        "unparsed_dates": {"Inicio": 1},
+    }
+    assert transformer.rejected_currency == {"Financiamiento Innova": 2}
+
+
+def test_streaming_run_writes_outputs_and_returns_summary(tmp_path: Path) -> None:
+    settings = _settings(tmp_path)
+    raw = _raw_frame(10)
+    # An all-NA chunk used to infer a ``null`` Parquet type for text columns.
+    raw["Título"] = raw["Título"].astype(object)
+    raw.loc[:4, "Título"] = None
+    raw.loc[:4, "Financiamiento Innova"] = None
+    loader = CsvParquetLoader(settings.processed_csv_path, settings.processed_parquet_path)
+
+    summary = EtlPipeline(
+        settings,
+        _FrameExtractor(raw, chunk_size=5),
+        ProjectTransformer(settings.etl),
+        loader,
+    ).run(materialize=False)
+
+    assert isinstance(summary, RunSummary)
+    assert (summary.rows, summary.chunks) == (10, 2)
+    assert summary.null_counts["Título"] == 5
+    parquet = pd.read_parquet(settings.processed_parquet_path)
+    csv = pd.read_csv(settings.processed_csv_path)
+    assert len(parquet) == len(csv) == 10
+    assert parquet["Título"].iloc[-1] == "Proyecto 9"
+    assert parquet["Financiamiento Innova"].iloc[-1] == 9000
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_run_report_times_every_stage(tmp_path: Path, executor: str) -> None:
+    textfile = tmp_path / "metrics" / "etl.prom"
+    settings = _settings(
+        tmp_path,
+        metrics={"enabled": True, "report_dir": tmp_path / "reports", "prometheus_textfile": textfile},
+        workers=2,
+        executor=executor,
+    )
+
+    EtlPipeline(
+        settings,
+        _FrameExtractor(_raw_frame(20), chunk_size=5),
+        ProjectTransformer(settings.etl),
+        _MemoryLoader(),
+    ).run(materialize=False)
+
+    [report_path] = (tmp_path / "reports").glob("etl_run_*.json")
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    stages = report["stages"]
+    assert report["rows"] == 20
+    assert stages["extract"]["rows"] == stages["load"]["rows"] == 20
+    assert stages["transform"]["calls"] == 4
+    assert stages["transform.clean_currency_fields"]["rows"] == 20
+    assert stages["transform.parse_dates"]["calls"] == 4
+    assert 'corfo_etl_stage_wall_seconds{stage="load"}' in textfile.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("concurrent", [True, False])
+def test_run_report_times_each_output_format(tmp_path: Path, concurrent: bool) -> None:
+    settings = _settings(tmp_path, metrics={"enabled": True, "report_dir": tmp_path / "reports"})
+    loader = CsvParquetLoader(
+        settings.processed_csv_path,
+        settings.processed_parquet_path,
+        feather_path=tmp_path / "processed" / "out.arrow",
+        concurrent=concurrent,
+    )
+
+    EtlPipeline(
+        settings,
+        _FrameExtractor(_raw_frame(20), chunk_size=5),
+        ProjectTransformer(settings.etl),
+        loader,
+    ).run(materialize=False)
+
+    [report_path] = (tmp_path / "reports").glob("etl_run_*.json")
+    stages = json.loads(report_path.read_text(encoding="utf-8"))["stages"]
+    for name in ("load.csv", "load.parquet", "load.feather"):
+        assert stages[name]["rows"] == 20
+        assert stages[name]["calls"] == 4
+        assert stages[name]["wall_seconds"] > 0
+
+
+def test_arrow_run_hands_validated_table_to_viz(tmp_path: Path) -> None:
+    settings = PipelineSettings.from_yaml(
+        PROJECT_ROOT / "config" / "settings.yaml",
+        {
+            "paths": {"processed_dir": str(tmp_path / "processed"), "interim_dir": str(tmp_path / "interim")},
+            "output": {"dataset_name": None},
+            "metrics": {"enabled": False},
+        },
+    )
+    loader = CsvParquetLoader(settings.processed_csv_path, settings.processed_parquet_path)
+
+    table = EtlPipeline(
+        settings,
+        _FrameExtractor(generate_raw_frame(60, seed=5), chunk_size=25),
+        ProjectTransformer(settings.etl),
+        loader,
+    ).run(return_arrow=True)
+
+    assert isinstance(table, pa.Table)
+    assert (table.num_rows, schema_version(table)) == (60, SCHEMA_VERSION)
+    assert conform_table(table) is table
+    pd.testing.assert_frame_equal(
+        load_dataset_from_table(table), load_dataset(settings.processed_parquet_path)
+    )
+    with pytest.raises(SchemaError, match="Financiamiento Innova"):
+        load_dataset_from_table(
+            table.replace_schema_metadata().set_column(
+                table.schema.get_field_index("Financiamiento Innova"),
+                "Financiamiento Innova",
+                pa.array(["$1"] * 60),
+            )
+        )
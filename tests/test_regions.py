@@ -0,0 +1,21 @@
+"""Tests for the shared region normalization engine."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from src.core.regions import REGION_ORDER, normalize_region, normalize_regions
+
+
+def test_normalize_regions_matches_scalar_version_and_orders_categories() -> None:
+    raw = pd.Series(
+        ["Región de Los Ríos", "Región del Biobío", None, "Región de los Ríos ", "Zona Nueva"]
+    )
+
+    result = normalize_regions(raw)
+
+    assert isinstance(result.dtype, pd.CategoricalDtype)
+    assert result.astype(object).tolist()[:2] == [normalize_region(raw[0]), normalize_region(raw[1])]
+    assert pd.isna(result[2])
+    assert result[0] == result[3] == "Region De Los Rios"
+    assert list(result.cat.categories) == [*REGION_ORDER, "Zona Nueva"]
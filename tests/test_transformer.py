@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import logging
+
+import numpy as np
 import pandas as pd
+import pytest
 
-from src.core.config import BooleanMapping, EtlSettings
-from src.etl.transform import ProjectTransformer
+from src.core.config import BooleanMapping, CategoricalEncoding, EtlSettings
+from src.etl.transform import CategoricalEncoder, ProjectTransformer
 
 
 def test_project_transformer_clean_currency_boolean_and_dates() -> None:
@@ -32,3 +36,239 @@ def test_project_transformer_clean_currency_boolean_and_dates() -> None:
     assert str(result["Inicio Actividad Económica"].iloc[0]) == "2010-01-01 00:00:00"
     assert bool(result["Criterio Mujer"].iloc[0]) is True
     assert result["Título"].iloc[0] == "Proyecto piloto"
+
+
+def test_vectorized_text_cleaning_matches_python_engine() -> None:
+    frame = pd.DataFrame(
+        {
+            "Título": [" Proyecto\t\tpiloto\n", None, "  ", "Sin cambios"],
+            "Objetivo": ["  a   b  ", "c\r\nd", None, ""],
+        }
+    )
+    vectorized = ProjectTransformer(EtlSettings())
+    python = ProjectTransformer(EtlSettings(text_cleaning={"engine": "python"}))
+
+    expected = python.transform(frame)
+    result = vectorized.transform(frame)
+
+    for column in frame.columns:
+        assert result[column].tolist() == expected[column].tolist()
+
+
+def test_text_cleaning_respects_exclude_list() -> None:
+    settings = EtlSettings(text_cleaning={"exclude": ["Objetivo"]})
+    frame = pd.DataFrame({"Título": ["  a  b "], "Objetivo": ["  a  b "]})
+
+    result = ProjectTransformer(settings).transform(frame)
+
+    assert result["Título"].iloc[0] == "a b"
+    assert result["Objetivo"].iloc[0] == "  a  b "
+
+
+def test_project_transformer_materializes_derived_columns() -> None:
+    frame = pd.DataFrame(
+        {
+            "Región": ["Región de Los Ríos", "Región del Biobío", None],
+            "Año Adjudicación": ["2024", "2025", None],
+        }
+    )
+
+    result = ProjectTransformer(EtlSettings()).transform(frame)
+
+    assert result["Region_Normalizada"].tolist()[:2] == ["Region De Los Rios", "Region Del Biobio"]
+    assert result["es_los_rios"].tolist() == [True, False, False]
+    assert result["Año Adjudicación"].dtype == "Int64"
+    assert result["anio_dt"].iloc[0] == pd.Timestamp("2024-01-01")
+    assert pd.isna(result["anio_dt"].iloc[2])
+
+
+def test_currency_parsing_handles_decimals_signs_and_rejects() -> None:
+    settings = EtlSettings(currency_columns=["Monto"])
+    transformer = ProjectTransformer(settings)
+    frame = pd.DataFrame({"Monto": ["$1.234,50", "-$1.000", "$ 7", "", "n/a", None]})
+
+    result = transformer.transform(frame)
+
+    assert result["Monto"].dtype == "Int64"
+    assert result["Monto"].tolist()[:3] == [1235, -1000, 7]
+    assert result["Monto"].isna().tolist()[3:] == [True, True, True]
+    assert transformer.rejected_currency == {"Monto": 1}
+
+
+def test_boolean_lookup_counts_unmapped_values_and_caches_columns() -> None:
+    settings = EtlSettings(
+        boolean_mappings=BooleanMapping(affirmative=["Sí", "Incentivo"], negative=["No"])
+    )
+    transformer = ProjectTransformer(settings)
+    frame = pd.DataFrame(
+        {
+            "Criterio Mujer": [" incentivo", "No", "no aplica", None],
+            "Sostenible": ["SÍ", "no", "Sí", "No"],
+            "Título": ["a", "b", "c", "d"],
+        }
+    )
+
+    result = transformer.transform(frame)
+    transformer.transform(frame)
+
+    assert result["Criterio Mujer"].tolist() == [True, False, pd.NA, pd.NA]
+    assert result["Sostenible"].tolist() == [True, False, True, False]
+    assert result["Título"].tolist() == ["a", "b", "c", "d"]
+    assert transformer.unmapped_booleans == {"Criterio Mujer": 2}
+    assert len(transformer._plans) == 1
+
+
+def test_date_parsing_detects_format_once_and_recovers_stragglers() -> None:
+    settings = EtlSettings(date_columns=["Inicio Actividad Económica"])
+    transformer = ProjectTransformer(settings)
+    frame = pd.DataFrame(
+        {
+            "Inicio Actividad Económica": [
+                "2021-11-24 0:00:00",
+                "2015-01-07 0:00:00",
+                "1993-01-01",
+                "1993-01-01T00:00:00Z",
+                "2009-07-01T00:00:00Z",
+                "2015-01-06T03:00:00-03:00",
+                "2015/01/06 10:30",
+                "05/06/2020 10:30",
+                "05/06/2020",
+                "13/06/2020",
+                "sin fecha",
+                None,
+            ]
+        }
+    )
+
+    result = transformer.transform(frame)
+
+    parsed = result["Inicio Actividad Económica"]
+    assert str(parsed.dtype) == "datetime64[us]"
+    # Ambiguous dd/mm values are read day-first, like the unambiguous ones;
+    # year-first ones (ISO 8601 with ``Z`` or an offset included) never are.
+    assert [str(value.date()) for value in parsed.iloc[:10]] == [
+        "2021-11-24",
+        "2015-01-07",
+        "1993-01-01",
+        "1993-01-01",
+        "2009-07-01",
+        "2015-01-06",
+        "2015-01-06",
+        "2020-06-05",
+        "2020-06-05",
+        "2020-06-13",
+    ]
+    assert parsed.iloc[10:].isna().all()
+    assert transformer._date_formats == {"Inicio Actividad Económica": "%Y-%m-%d %H:%M:%S"}
+    assert transformer.unparsed_dates == {"Inicio Actividad Económica": 1}
+
+
+def test_plan_is_compiled_once_and_chunks_are_left_untouched(caplog: pytest.LogCaptureFixture) -> None:
+    settings = EtlSettings(currency_columns=["Monto", "Ausente"], date_columns=[])
+    transformer = ProjectTransformer(settings)
+    chunks = [
+        pd.DataFrame({"Monto": ["$1.000", "$2.000"], "Nombre": ["  a  b ", "c"]}),
+        pd.DataFrame({"Monto": ["$3.000", None], "Nombre": ["d", "e\t"]}),
+    ]
+    originals = [chunk.copy() for chunk in chunks]
+
+    with caplog.at_level(logging.WARNING, logger="src.etl.transform"):
+        results = [transformer.transform(chunk) for chunk in chunks]
+
+    assert [message for message in caplog.messages if "missing" in message] == [
+        "Currency column Ausente missing in input"
+    ]
+    assert transformer.compile(chunks[0].columns).currency == ("Monto",)
+    assert results[0]["Nombre"].tolist() == ["a b", "c"]
+    assert results[1]["Monto"].tolist()[0] == 3000
+    for chunk, original in zip(chunks, originals):
+        pd.testing.assert_frame_equal(chunk, original)
+
+
+def _region_chunks(dtype: object) -> list[pd.DataFrame]:
+    return [
+        pd.DataFrame(
+            {
+                "Región": pd.array(["Los Ríos", "Biobío", None, "Los Ríos"], dtype=dtype),
+                "Código": pd.array(["A", "B", "C", "D"], dtype=dtype),
+                "Monto": [1, 2, 3, 4],
+            }
+        ),
+        pd.DataFrame(
+            {
+                "Región": pd.array(["Maule", "Biobío", "Ñuble"], dtype=dtype),
+                "Código": pd.array(["E", "F", "G"], dtype=dtype),
+                "Monto": [5, 6, 7],
+            }
+        ),
+    ]
+
+
+@pytest.mark.parametrize("dtype", ["str", object])
+def test_categorical_encoder_shares_one_growing_dictionary(dtype: object) -> None:
+    encoder = CategoricalEncoder(CategoricalEncoding(max_categories=4, max_ratio=0.7))
+
+    encoded = [encoder.transform(chunk) for chunk in _region_chunks(dtype)]
+
+    assert encoder.columns == ["Región"]
+    first, second = (frame["Región"] for frame in encoded)
+    assert list(first.cat.categories) == ["Los Ríos", "Biobío"]
+    assert list(second.cat.categories) == ["Los Ríos", "Biobío", "Maule", "Ñuble"]
+    assert second.cat.codes.tolist() == [2, 1, 3]
+    assert first.isna().tolist() == [False, False, True, False]
+    combined = pd.concat([encoder.align(frame) for frame in encoded], ignore_index=True)
+    assert isinstance(combined["Región"].dtype, pd.CategoricalDtype)
+    assert combined["Región"].cat.codes.tolist() == [0, 1, -1, 0, 2, 1, 3]
+    report = encoder.memory_report()
+    assert set(report["columns"]) == {"Región"}
+    assert report["bytes_before"] > 0 and report["bytes_after"] > 0
+
+
+@pytest.mark.parametrize("dtype", ["str", object])
+def test_categorical_encoder_drops_columns_past_max_categories(
+    dtype: object, caplog: pytest.LogCaptureFixture
+) -> None:
+    encoder = CategoricalEncoder(CategoricalEncoding(max_categories=3, max_ratio=0.7))
+    chunks = _region_chunks(dtype)
+
+    with caplog.at_level(logging.WARNING, logger="src.etl.transform"):
+        encoded = [encoder.transform(chunk) for chunk in [*chunks, chunks[1]]]
+
+    assert encoder.columns == []
+    assert isinstance(encoded[0]["Región"].dtype, pd.CategoricalDtype)
+    pd.testing.assert_series_equal(encoded[1]["Región"], chunks[1]["Región"])
+    pd.testing.assert_series_equal(encoded[2]["Región"], chunks[1]["Región"])
+    assert [message for message in caplog.messages if "categories" in message] == [
+        "Categorical column Región passed 3 categories; left as text for the rest of the run"
+    ]
+    combined = pd.concat([encoder.align(frame) for frame in encoded[:2]], ignore_index=True)
+    expected = pd.concat([chunk["Región"] for chunk in chunks], ignore_index=True)
+    pd.testing.assert_series_equal(combined["Región"], expected)
+    # ``concat`` gives it the categorical type the writers kept for it.
+    restored = encoder.concat(encoded[:2])["Región"]
+    assert isinstance(restored.dtype, pd.CategoricalDtype)
+    assert list(restored.cat.categories) == ["Los Ríos", "Biobío", "Maule", "Ñuble"]
+    pd.testing.assert_series_equal(restored.astype(expected.dtype), expected)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7])
+def test_categorical_encoder_detects_on_a_sample_of_rows_not_the_first_chunk(chunk_size: int) -> None:
+    frame = pd.concat(_region_chunks("str"), ignore_index=True)
+    frame["Comuna"] = pd.array([None, None, "Valdivia", "Valdivia", "Corral", None, "Corral"], dtype="str")
+    encoder = CategoricalEncoder(CategoricalEncoding(max_categories=4, max_ratio=0.7, sample_rows=6))
+
+    encoded: list[pd.DataFrame] = []
+    for start in range(0, len(frame), chunk_size):
+        chunk = frame.iloc[start : start + chunk_size].copy()
+        if chunk["Comuna"].isna().all():
+            chunk["Comuna"] = np.nan  # what read_csv gives for an all-blank chunk
+        encoded += encoder.push(chunk)
+    # Six rows fill the sample, so nothing is left held once the input ends.
+    assert encoder.drain() == []
+
+    assert encoder.columns == ["Región", "Comuna"]
+    assert sum(len(chunk) for chunk in encoded) == len(frame)
+    assert all(isinstance(chunk["Comuna"].dtype, pd.CategoricalDtype) for chunk in encoded)
+    result = encoder.concat(encoded)
+    assert list(result["Comuna"].cat.categories) == ["Valdivia", "Corral"]
+    pd.testing.assert_series_equal(result["Comuna"].astype("str"), frame["Comuna"])